@@ -0,0 +1 @@
+# benchmarks package: 성능 측정 스위트 (python3 -m benchmarks.run)
@@ -0,0 +1,97 @@
+"""
+벤치마크용 합성 MP3 코퍼스 생성기
+
+실제 MPEG-1 Layer III 프레임(128kbps / 44.1kHz)으로 오디오를 채우고,
+기존 ID3 태그 크기와 대용량 APIC 유무를 조합해 파일을 만든다.
+"""
+
+import os
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import List, Optional
+
+from mutagen.id3 import ID3, APIC, TALB, TIT2, TPE1, TRCK, COMM
+
+# MPEG-1 Layer III, 128kbps, 44.1kHz, 패딩 없음, 스테레오
+FRAME_HEADER = b"\xff\xfb\x90\x00"
+FRAME_SIZE = 144 * 128000 // 44100   # 417 bytes
+FRAMES_PER_SEC = 44100 / 1152
+
+
+@dataclass
+class CorpusVariant:
+    name: str
+    tag_bytes: int          # 기존 태그에 채울 대략적인 텍스트 크기 (0 = 태그 없음)
+    apic_bytes: int         # 기존 APIC 크기 (0 = 없음)
+
+
+# 태그 없음 / 작은 태그 / 큰 텍스트 태그 / 대용량 APIC
+VARIANTS = [
+    CorpusVariant("untagged", 0, 0),
+    CorpusVariant("small_tag", 256, 0),
+    CorpusVariant("large_tag", 64 * 1024, 0),
+    CorpusVariant("large_apic", 256, 1024 * 1024),
+]
+
+
+def make_audio(seconds: float) -> bytes:
+    """무음 페이로드를 가진 유효한 MPEG 프레임 열을 생성"""
+    frame = FRAME_HEADER + b"\x00" * (FRAME_SIZE - len(FRAME_HEADER))
+    return frame * max(1, int(seconds * FRAMES_PER_SEC))
+
+
+def make_cover(size_bytes: int) -> bytes:
+    """대략 size_bytes 크기의 JPEG (압축 불가능한 노이즈로 크기 확보)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return b"\xff\xd8\xff\xe0" + os.urandom(max(0, size_bytes - 4))
+
+    side = 64
+    while True:
+        img = Image.frombytes("RGB", (side, side), os.urandom(side * side * 3))
+        buf = BytesIO()
+        img.save(buf, format="JPEG", quality=95)
+        if buf.tell() >= size_bytes or side >= 4096:
+            return buf.getvalue()
+        side *= 2
+
+
+def make_tag_bytes(variant: CorpusVariant, index: int, cover: Optional[bytes]) -> bytes:
+    if not variant.tag_bytes and not variant.apic_bytes:
+        return b""
+    tags = ID3()
+    tags["TIT2"] = TIT2(encoding=3, text=f"Track {index:03d}")
+    tags["TPE1"] = TPE1(encoding=3, text="Synthetic Artist")
+    tags["TALB"] = TALB(encoding=3, text="Synthetic Album")
+    tags["TRCK"] = TRCK(encoding=3, text=str(index))
+    if variant.tag_bytes > 256:
+        tags["COMM"] = COMM(encoding=3, lang="eng", desc="", text="x" * variant.tag_bytes)
+    if cover:
+        tags["APIC"] = APIC(encoding=3, mime="image/jpeg", type=3, desc="Cover", data=cover)
+    buf = BytesIO()
+    tags.save(buf, v2_version=3)
+    return buf.getvalue()
+
+
+def build_corpus(
+    dest: Path,
+    files_per_variant: int = 10,
+    seconds: float = 180.0,
+    variants: Optional[List[CorpusVariant]] = None,
+) -> List[Path]:
+    """dest/<variant>/NN Track.mp3 형태로 코퍼스를 생성하고 경로 목록을 반환"""
+    audio = make_audio(seconds)
+    paths = []
+    for variant in variants or VARIANTS:
+        cover = make_cover(variant.apic_bytes) if variant.apic_bytes else None
+        vdir = dest / variant.name
+        vdir.mkdir(parents=True, exist_ok=True)
+        for i in range(1, files_per_variant + 1):
+            path = vdir / f"{i:02d} Track {i:03d}.mp3"
+            with open(path, "wb") as f:
+                f.write(make_tag_bytes(variant, i, cover))
+                f.write(audio)
+            paths.append(path)
+    return paths
@@ -0,0 +1,165 @@
+"""
+크롤러 파이프라인 부하 테스트 (로컬 스탠드인 서버 대상, 오프라인)
+
+Usage:
+    python3 -m benchmarks.load_test --albums 50 --workers 8 --latency-ms 40 --rate-429 0.02
+    python3 -m benchmarks.load_test --base-url http://127.0.0.1:8765 --out load.json
+
+앨범 하나당: crawl_album(앨범아트 포함) → 트랙 N개에 대해
+crawl_song_detail + fetch_synced_lyrics. 요청/초와 단계별 지연 분위수를 보고한다.
+"""
+
+import argparse
+import json
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from src.api import MelonCrawler, rate_limiter, single_flight
+from src.services import telemetry
+from benchmarks.standin_server import StandinConfig, start_standin
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+class LatencyRecorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples: Dict[str, List[float]] = defaultdict(list)
+        self._errors: Dict[str, int] = defaultdict(int)
+
+    def record(self, op: str, seconds: float, ok: bool):
+        with self._lock:
+            self._samples[op].append(seconds * 1000)
+            if not ok:
+                self._errors[op] += 1
+
+    def summary(self) -> Dict[str, dict]:
+        out = {}
+        for op, values in self._samples.items():
+            values = sorted(values)
+            out[op] = {
+                "count": len(values),
+                "errors": self._errors[op],
+                "p50_ms": _percentile(values, 50),
+                "p95_ms": _percentile(values, 95),
+                "p99_ms": _percentile(values, 99),
+                "max_ms": values[-1],
+            }
+        return out
+
+
+def _run_album(crawler: MelonCrawler, album_id: int, tracks_per_album: int, rec: LatencyRecorder):
+    t0 = time.perf_counter()
+    try:
+        album = crawler.crawl_album(f"https://www.melon.com/album/detail.htm?albumId={album_id}")
+    except Exception:
+        rec.record("crawl_album", time.perf_counter() - t0, False)
+        return
+    rec.record("crawl_album", time.perf_counter() - t0, True)
+
+    for track in album.tracks[:tracks_per_album]:
+        t0 = time.perf_counter()
+        detail = crawler.crawl_song_detail(track.song_id)
+        rec.record("crawl_song_detail", time.perf_counter() - t0, bool(detail["lyrics"]))
+
+        t0 = time.perf_counter()
+        synced = crawler.fetch_synced_lyrics(track.title, track.artist, track.album)
+        rec.record("fetch_synced_lyrics", time.perf_counter() - t0, bool(synced))
+
+
+def run_load(
+    base_url: str, albums: int, workers: int, tracks_per_album: int,
+) -> dict:
+    crawler = MelonCrawler(base_url=base_url, lrclib_url=base_url)
+    rec = LatencyRecorder()
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for i in range(albums):
+            pool.submit(_run_album, crawler, 10000000 + i, tracks_per_album, rec)
+    elapsed = time.perf_counter() - t0
+
+    ops = rec.summary()
+    total_requests = sum(v["count"] for v in ops.values())
+    return {
+        "albums": albums,
+        "workers": workers,
+        "elapsed_s": elapsed,
+        "crawler_calls": total_requests,
+        "calls_per_s": total_requests / elapsed if elapsed else 0.0,
+        "albums_per_s": albums / elapsed if elapsed else 0.0,
+        "ops": ops,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Crawler load test against the local stand-in")
+    parser.add_argument("--base-url", help="이미 실행 중인 스탠드인 서버 (없으면 내장 서버 기동)")
+    parser.add_argument("--albums", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--tracks", type=int, default=3, help="앨범당 가사 조회 트랙 수")
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-5xx", type=float, default=0.0)
+    parser.add_argument("--slow-body-ms", type=float, default=0.0)
+    parser.add_argument("--max-rate", type=float, help="스탠드인 호스트의 최대 초당 요청 (리미터 정책)")
+    parser.add_argument("--max-concurrency", type=int, help="스탠드인 호스트의 최대 동시 요청")
+    parser.add_argument("--out", type=Path)
+    args = parser.parse_args(argv)
+
+    server = None
+    base_url: Optional[str] = args.base_url
+    if not base_url:
+        server = start_standin(StandinConfig(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            rate_429=args.rate_429,
+            rate_5xx=args.rate_5xx,
+            slow_body_ms=args.slow_body_ms,
+        ))
+        base_url = server.base_url
+
+    limits = {}
+    if args.max_rate:
+        limits["max_rate"] = args.max_rate
+    if args.max_concurrency:
+        limits["max_concurrency"] = args.max_concurrency
+    if limits:
+        rate_limiter.configure(urlsplit(base_url).hostname, **limits)
+
+    try:
+        report = run_load(base_url, args.albums, args.workers, args.tracks)
+        report["telemetry"] = telemetry.summary()
+        report["rate_limiter"] = rate_limiter.snapshot()
+        report["single_flight"] = single_flight.stats()
+        if server:
+            report["server_status_counts"] = {
+                str(k): v for k, v in server.state.status_counts.items()
+            }
+            served = sum(server.state.status_counts.values())
+            report["server_requests"] = served
+            report["server_requests_per_s"] = served / report["elapsed_s"]
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.out:
+        args.out.write_text(text, encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
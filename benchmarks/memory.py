@@ -0,0 +1,156 @@
+"""
+도메인 모델 메모리 벤치마크 (앨범 1,000개 상주)
+
+Usage:
+    python3 -m benchmarks.memory
+    python3 -m benchmarks.memory --albums 1000 --tracks 12 --cover-kb 200 --out mem.json
+
+비교 대상:
+    legacy   이전 구조 (일반 dataclass, 트랙마다 문자열 사본, 커버 바이트 인라인)
+    current  src.models (slots + intern, 커버는 CoverStore 참조)
+큐/캐시에는 같은 앨범이 여러 번 올라오므로 --dup 비율만큼 동일 앨범을 다시 만든다.
+직렬화는 codec(marshal) 과 pickle 의 크기·시간을 함께 보고한다.
+"""
+
+import argparse
+import gc
+import json
+import pickle
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+from src.models import AlbumInfo, TrackInfo, covers, dumps_albums, loads_albums
+
+
+@dataclass
+class LegacyTrack:
+    track_number: int
+    title: str
+    artist: str
+    album: str
+    album_artist: str
+    genre: str
+    song_id: str = ""
+    lyrics: str = ""
+    disc_number: int = 1
+
+
+@dataclass
+class LegacyAlbum:
+    album_name: str
+    album_artist: str
+    genre: str
+    release_date: str
+    cover_url: str
+    tracks: List[LegacyTrack] = field(default_factory=list)
+    cover_data: Optional[bytes] = None
+
+
+def _fresh(text: str) -> str:
+    """파서가 매번 새 문자열을 만드는 상황을 흉내 (intern 효과를 공정하게 측정)"""
+    return "".join(list(text))
+
+
+def _album_specs(n_albums: int, n_tracks: int, dup_ratio: float, seed: int = 7):
+    rng = random.Random(seed)
+    unique = max(1, int(n_albums * (1 - dup_ratio)))
+    specs = []
+    for i in range(n_albums):
+        a = i if i < unique else rng.randrange(unique)
+        specs.append(a)
+    return specs
+
+
+def _build(kind: str, specs: List[int], n_tracks: int, cover_kb: int) -> list:
+    albums = []
+    for a in specs:
+        name, artist, genre = f"앨범 제목 {a:04d}", f"아티스트 {a % 97:03d}", "발라드, 국내드라마"
+        cover = a.to_bytes(4, "big") * (cover_kb * 256)     # 앨범별 고유, 받을 때마다 새 사본
+        if kind == "legacy":
+            tracks = [LegacyTrack(n, _fresh(f"노래 {a}-{n}"), _fresh(artist), _fresh(name),
+                                  _fresh(artist), _fresh(genre), str(a * 100 + n))
+                      for n in range(1, n_tracks + 1)]
+            albums.append(LegacyAlbum(_fresh(name), _fresh(artist), _fresh(genre),
+                                      "2024.01.01", f"https://cdn/{a}.jpg", tracks, cover))
+        else:
+            tracks = [TrackInfo(n, _fresh(f"노래 {a}-{n}"), _fresh(artist), _fresh(name),
+                                _fresh(artist), _fresh(genre), str(a * 100 + n))
+                      for n in range(1, n_tracks + 1)]
+            album = AlbumInfo(_fresh(name), _fresh(artist), _fresh(genre),
+                              "2024.01.01", f"https://cdn/{a}.jpg", tracks)
+            album.cover_data = cover
+            albums.append(album)
+        del cover
+    return albums
+
+
+def _measure(kind: str, specs, n_tracks: int, cover_kb: int):
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+    albums = _build(kind, specs, n_tracks, cover_kb)
+    build_s = time.perf_counter() - t0
+    gc.collect()
+    current = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return albums, {"resident_bytes": current, "build_s": build_s}
+
+
+def _serialize(albums) -> dict:
+    out = {}
+    t0 = time.perf_counter()
+    blob = pickle.dumps(albums, protocol=pickle.HIGHEST_PROTOCOL)
+    t1 = time.perf_counter()
+    pickle.loads(blob)
+    t2 = time.perf_counter()
+    out["pickle"] = {"bytes": len(blob), "dump_s": t1 - t0, "load_s": t2 - t1}
+    if albums and isinstance(albums[0], AlbumInfo):
+        for include in (True, False):
+            t0 = time.perf_counter()
+            blob = dumps_albums(albums, include_cover=include)
+            t1 = time.perf_counter()
+            loads_albums(blob)
+            t2 = time.perf_counter()
+            key = "codec" if include else "codec_no_cover"
+            out[key] = {"bytes": len(blob), "dump_s": t1 - t0, "load_s": t2 - t1}
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Domain model memory benchmark")
+    parser.add_argument("--albums", type=int, default=1000)
+    parser.add_argument("--tracks", type=int, default=12)
+    parser.add_argument("--cover-kb", type=int, default=200)
+    parser.add_argument("--dup", type=float, default=0.3, help="중복 앨범 비율 (0~1)")
+    parser.add_argument("--out", type=Path)
+    args = parser.parse_args(argv)
+
+    specs = _album_specs(args.albums, args.tracks, args.dup)
+    report = {"albums": args.albums, "tracks": args.tracks,
+              "cover_kb": args.cover_kb, "dup": args.dup}
+    for kind in ("legacy", "current"):
+        albums, stats = _measure(kind, specs, args.tracks, args.cover_kb)
+        stats["per_album_bytes"] = stats["resident_bytes"] / args.albums
+        stats["serialize"] = _serialize(albums)
+        if kind == "current":
+            stats["cover_store_entries"] = len(covers)
+        report[kind] = stats
+        del albums
+        gc.collect()
+
+    legacy, current = report["legacy"]["resident_bytes"], report["current"]["resident_bytes"]
+    report["reduction_pct"] = (1 - current / legacy) * 100 if legacy else 0.0
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.out:
+        args.out.write_text(text, encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+Melon MP3 Tagger 성능 벤치마크
+
+Usage:
+    python3 -m benchmarks.run                       # 결과를 표준 출력으로
+    python3 -m benchmarks.run --out base.json       # JSON 저장
+    python3 -m benchmarks.run --out new.json --compare base.json
+
+측정 항목:
+    read_metadata      MP3Handler.read_metadata 처리량 (파일/초)
+    write_metadata     MP3Handler.write_metadata 처리량 (앨범아트 포함)
+    write_grow_10mb    10MB 파일에 패딩을 넘는 APIC 추가 (태그 뒤 오디오 전체 재배치)
+    parse_album        앨범 HTML 전체 파싱 (BeautifulSoup + 필드 추출)
+    get_tracks         MelonCrawler._get_tracks 단독 (파싱된 soup 재사용)
+    parse_song         곡 상세 HTML 파싱 (가사/장르)
+    auto_match         TrackMatcher 파일명 매칭
+    album_apply        앨범 파싱 → 매칭 → 백업 + 태그 기록 (end-to-end)
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from bs4 import BeautifulSoup
+
+from src.api import MelonCrawler
+from src.services import AlbumApplier, ApplyOptions, MP3Handler, TrackMatcher
+from benchmarks.corpus import VARIANTS, build_corpus, make_cover
+
+FIXTURES = Path(__file__).parent / "fixtures"
+# 128kbps 기준 약 10MB
+GROW_SECONDS = 655.0
+GROW_FILES = 10
+
+
+def _summary(times: List[float], ops: int) -> Dict[str, float]:
+    best = min(times)
+    return {
+        "repeat": len(times),
+        "ops": ops,
+        "best_s": best,
+        "median_s": statistics.median(times),
+        "per_op_ms": best / ops * 1000 if ops else 0.0,
+        "ops_per_s": ops / best if best else 0.0,
+    }
+
+
+def _measure(fn: Callable[[], int], repeat: int) -> Dict[str, float]:
+    """fn()을 repeat회 실행. fn은 처리한 작업 수를 반환한다."""
+    times = []
+    ops = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        ops = fn()
+        times.append(time.perf_counter() - t0)
+    return _summary(times, ops)
+
+
+def _git_commit() -> str:
+    try:
+        r = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, timeout=5, cwd=Path(__file__).parent,
+        )
+        return r.stdout.decode().strip()
+    except Exception:
+        return ""
+
+
+def _fresh_copy(paths: List[Path], src_root: Path, dest_root: Path) -> List[Path]:
+    if dest_root.exists():
+        shutil.rmtree(dest_root)
+    shutil.copytree(src_root, dest_root)
+    return [dest_root / p.relative_to(src_root) for p in paths]
+
+
+def run_benchmarks(workdir: Path, files_per_variant: int, repeat: int) -> Dict[str, dict]:
+    corpus_root = workdir / "corpus"
+    paths = build_corpus(corpus_root, files_per_variant=files_per_variant)
+    handler = MP3Handler()
+    crawler = MelonCrawler()
+    album_html = (FIXTURES / "melon_album.html").read_text(encoding="utf-8")
+    song_html = (FIXTURES / "melon_song.html").read_text(encoding="utf-8")
+    cover = make_cover(300 * 1024)
+    results: Dict[str, dict] = {}
+
+    # ── 태그 읽기 ────────────────────────────
+    def read_all():
+        for p in paths:
+            handler.read_metadata(str(p))
+        return len(paths)
+    results["read_metadata"] = _measure(read_all, repeat)
+
+    # ── 태그 쓰기 (매 회 새 복사본) ───────────
+    write_times = []
+    for _ in range(repeat):
+        targets = _fresh_copy(paths, corpus_root, workdir / "write")
+        t0 = time.perf_counter()
+        for i, p in enumerate(targets, start=1):
+            handler.write_metadata(
+                str(p), title=f"제목 {i}", artist="아티스트", album="앨범",
+                album_artist="아티스트", genre="발라드", track_number=i,
+                cover_data=cover,
+            )
+        write_times.append(time.perf_counter() - t0)
+    results["write_metadata"] = _summary(write_times, len(paths))
+
+    # ── 태그가 패딩을 넘어 커지는 쓰기 (10MB 파일) ──
+    grow_root = workdir / "grow"
+    small_tag = [v for v in VARIANTS if v.name == "small_tag"]
+    grow_paths = build_corpus(grow_root, GROW_FILES, GROW_SECONDS, small_tag)
+    grow_times = []
+    for _ in range(repeat):
+        targets = _fresh_copy(grow_paths, grow_root, workdir / "grow_write")
+        t0 = time.perf_counter()
+        for p in targets:
+            handler.write_metadata(str(p), title="제목", cover_data=cover)
+        grow_times.append(time.perf_counter() - t0)
+    results["write_grow_10mb"] = _summary(grow_times, len(grow_paths))
+
+    # ── HTML 파싱 ────────────────────────────
+    def parse_album():
+        crawler.parse_album(album_html)
+        return 1
+
+    def parse_song():
+        crawler.parse_song_detail(song_html)
+        return 1
+
+    results["parse_album"] = _measure(parse_album, repeat * 10)
+    soup = BeautifulSoup(album_html, "html.parser")
+    results["get_tracks"] = _measure(
+        lambda: len(crawler._get_tracks(soup, "앨범", "아티스트", "장르")), repeat * 10,
+    )
+    results["parse_song"] = _measure(parse_song, repeat * 10)
+
+    # ── 자동 매칭 ────────────────────────────
+    album = crawler.parse_album(album_html)
+    names = [str(p) for p in paths]
+
+    def match_all():
+        matcher = TrackMatcher(album.tracks)
+        for name in names:
+            matcher.match(name)
+        return len(names)
+    results["auto_match"] = _measure(match_all, repeat * 10)
+
+    # ── end-to-end 앨범 적용 ──────────────────
+    e2e_times = []
+    for _ in range(repeat):
+        targets = _fresh_copy(paths, corpus_root, workdir / "e2e")
+        t0 = time.perf_counter()
+        parsed = crawler.parse_album(album_html)
+        parsed.cover_data = cover
+        matcher = TrackMatcher(parsed.tracks)
+        items = []
+        for p in targets:
+            track = matcher.match(str(p))
+            if track:
+                items.append((str(p), track))
+        AlbumApplier(handler).apply(
+            items, ApplyOptions(backup=True, cover_data=parsed.cover_data),
+        )
+        e2e_times.append(time.perf_counter() - t0)
+    results["album_apply"] = _summary(e2e_times, len(paths))
+
+    return results
+
+
+def compare(current: Dict[str, dict], baseline: Dict[str, dict]):
+    print(f"{'benchmark':<16} {'base ms/op':>12} {'new ms/op':>12} {'change':>9}")
+    for name, cur in current.items():
+        base = baseline.get(name)
+        if not base or not base.get("per_op_ms"):
+            print(f"{name:<16} {'—':>12} {cur['per_op_ms']:>12.3f}")
+            continue
+        delta = (cur["per_op_ms"] / base["per_op_ms"] - 1) * 100
+        print(f"{name:<16} {base['per_op_ms']:>12.3f} {cur['per_op_ms']:>12.3f} {delta:>+8.1f}%")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Melon MP3 Tagger benchmarks")
+    parser.add_argument("--files", type=int, default=10, help="변형(variant)당 MP3 파일 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 기록)")
+    parser.add_argument("--out", type=Path, help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument("--workdir", type=Path, help="코퍼스 생성 디렉토리 (기본: 임시)")
+    args = parser.parse_args(argv)
+
+    if args.workdir:
+        args.workdir.mkdir(parents=True, exist_ok=True)
+        results = run_benchmarks(args.workdir, args.files, args.repeat)
+    else:
+        with tempfile.TemporaryDirectory(prefix="mp3bench_") as tmp:
+            results = run_benchmarks(Path(tmp), args.files, args.repeat)
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "files_per_variant": args.files,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.out:
+        args.out.write_text(text, encoding="utf-8")
+    else:
+        print(text)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        compare(results, baseline.get("results", {}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+멜론 / lrclib 로컬 스탠드인 HTTP 서버 (부하·동시성 테스트용)
+
+저장된 앨범·곡 상세 HTML, 앨범아트 JPEG, lrclib JSON을 제공하며
+지연, 429, 5xx, 느린 본문 전송을 설정값에 따라 주입한다.
+
+Usage:
+    python3 -m benchmarks.standin_server --port 8765 --latency-ms 80 --rate-429 0.05
+
+    crawler = MelonCrawler(base_url="http://127.0.0.1:8765",
+                           lrclib_url="http://127.0.0.1:8765")
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.corpus import make_cover
+
+FIXTURES = Path(__file__).parent / "fixtures"
+_CDN_URL = re.compile(r"https://cdnimg\.melon\.co\.kr")
+
+
+@dataclass
+class StandinConfig:
+    latency_ms: float = 0.0        # 모든 응답 앞에 더할 지연
+    jitter_ms: float = 0.0         # 지연에 더할 균등분포 랜덤 값의 최댓값
+    rate_429: float = 0.0          # 429 응답 비율 (0~1)
+    rate_5xx: float = 0.0          # 503 응답 비율 (0~1)
+    retry_after: int = 1           # 429 응답의 Retry-After (초)
+    slow_body_ms: float = 0.0      # 본문을 청크로 나눠 보낼 때 청크 사이 지연
+    slow_chunks: int = 8
+    cover_bytes: int = 200 * 1024
+    seed: Optional[int] = None
+
+
+class StandinState:
+    """서버 전역 상태: 픽스처, 설정, 응답 통계"""
+
+    def __init__(self, config: StandinConfig):
+        self.config = config
+        self.album_html = (FIXTURES / "melon_album.html").read_text(encoding="utf-8")
+        self.song_html = (FIXTURES / "melon_song.html").read_text(encoding="utf-8")
+        self.lrclib_json = (FIXTURES / "lrclib_get.json").read_bytes()
+        self.cover = make_cover(config.cover_bytes)
+        self.random = random.Random(config.seed)
+        self.lock = threading.Lock()
+        self.status_counts: Counter = Counter()
+
+    def roll(self) -> float:
+        with self.lock:
+            return self.random.random()
+
+    def count(self, status: int):
+        with self.lock:
+            self.status_counts[status] += 1
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    server_version = "MelonStandin/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def state(self) -> StandinState:
+        return self.server.state
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        cfg = self.state.config
+        delay = cfg.latency_ms + (cfg.jitter_ms * self.state.roll() if cfg.jitter_ms else 0)
+        if delay:
+            time.sleep(delay / 1000)
+
+        roll = self.state.roll()
+        if roll < cfg.rate_429:
+            return self._send(429, b"Too Many Requests", "text/plain",
+                              {"Retry-After": str(cfg.retry_after)})
+        if roll < cfg.rate_429 + cfg.rate_5xx:
+            return self._send(503, b"Service Unavailable", "text/plain")
+
+        route = self._route()
+        if route is None:
+            return self._send(404, b"Not Found", "text/plain")
+        body, content_type = route
+        self._send(200, body, content_type)
+
+    def _route(self) -> Optional[Tuple[bytes, str]]:
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        base = f"http://{self.headers.get('Host', '127.0.0.1')}"
+
+        if parsed.path == "/album/detail.htm":
+            album_id = query.get("albumId", ["0"])[0]
+            html = _CDN_URL.sub(base, self.state.album_html)
+            html = html.replace("albumId=10000001", f"albumId={album_id}")
+            return html.encode("utf-8"), "text/html; charset=utf-8"
+        if parsed.path == "/song/detail.htm":
+            return self.state.song_html.encode("utf-8"), "text/html; charset=utf-8"
+        if parsed.path.startswith("/cm/album/images/"):
+            return self.state.cover, "image/jpeg"
+        if parsed.path == "/api/get":
+            return self.state.lrclib_json, "application/json"
+        return None
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[dict] = None):
+        self.state.count(status)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        cfg = self.state.config
+        try:
+            if cfg.slow_body_ms and status == 200 and len(body) > cfg.slow_chunks:
+                step = -(-len(body) // cfg.slow_chunks)
+                for i in range(0, len(body), step):
+                    self.wfile.write(body[i:i + step])
+                    self.wfile.flush()
+                    time.sleep(cfg.slow_body_ms / 1000)
+            else:
+                self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], config: StandinConfig):
+        super().__init__(address, StandinHandler)
+        self.state = StandinState(config)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_standin(
+    config: Optional[StandinConfig] = None, host: str = "127.0.0.1", port: int = 0,
+) -> StandinServer:
+    """백그라운드 스레드에서 서버를 시작한다. 종료: server.shutdown()"""
+    server = StandinServer((host, port), config or StandinConfig())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Melon/lrclib stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-5xx", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--slow-body-ms", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    config = StandinConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_429=args.rate_429,
+        rate_5xx=args.rate_5xx,
+        retry_after=args.retry_after,
+        slow_body_ms=args.slow_body_ms,
+    )
+    server = StandinServer((args.host, args.port), config)
+    print(f"stand-in listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(dict(server.state.status_counts)))
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,19 @@
-# api package: 외부 연동 (멜론 웹)
+# api package: 외부 연동 (멜론 웹, 메타데이터 출처)
 
 from .melon_crawler import MelonCrawler
+from .providers import AlbumQuery, MetadataProvider, LibraryProvider, ProviderSet
+from .rate_limiter import RateLimiter, HostPolicy, rate_limiter
+from .single_flight import SingleFlight, single_flight
 
-__all__ = ["MelonCrawler"]
+__all__ = [
+    "MelonCrawler",
+    "AlbumQuery",
+    "MetadataProvider",
+    "LibraryProvider",
+    "ProviderSet",
+    "RateLimiter",
+    "HostPolicy",
+    "rate_limiter",
+    "SingleFlight",
+    "single_flight",
+]
@@ -3,14 +3,45 @@
 """
 
 import re
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
 from bs4 import BeautifulSoup
-from typing import List, Tuple
+from typing import Callable, List, Optional, Tuple
 
+from src.api.providers import AlbumQuery, MetadataProvider
+from src.api.rate_limiter import RateLimiter, THROTTLE_STATUS, rate_limiter as _shared_limiter
+from src.api.single_flight import SingleFlight, single_flight as _shared_flight
 from src.models import AlbumInfo, TrackInfo
+from src.services.lyrics_store import LocalLyricsStore
+from src.services.telemetry import span
 
 
-class MelonCrawler:
+_MELON_HOST = re.compile(r"^https?://(?:www\.|m\.)?melon\.com", re.IGNORECASE)
+_ALBUM_ID = re.compile(r"albumId=(\d+)")
+
+# 앨범아트 백그라운드 다운로드 (crawl_album(on_cover=...))
+_cover_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cover")
+
+
+class CoverTooLarge(Exception):
+    pass
+
+
+class _CoverCancelled(Exception):
+    """공유 다운로드가 취소됨 (None을 돌려주면 flight 캐시에 "커버 없음"으로 남으므로 예외로 알린다)"""
+
+
+class MelonCrawler(MetadataProvider):
+    """멜론 웹 출처 (MetadataProvider 기본 구현). 요청 제한·병합은 limiter·flight가 맡는다"""
+
+    name = "melon"
+    MELON_URL = "https://www.melon.com"
+    ALBUM_URL = MELON_URL + "/album/detail.htm?albumId={}"
+    LRCLIB_URL = "https://lrclib.net"
+
     HEADERS = {
         "User-Agent": (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -22,18 +53,210 @@ class MelonCrawler:
         "Referer": "https://www.melon.com/",
     }
 
-    def crawl_album(self, url: str) -> AlbumInfo:
-        resp = requests.get(url, headers=self.HEADERS, timeout=15)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+    # 429/503 재시도 횟수 (대기는 rate limiter의 Retry-After 처리에 맡긴다)
+    MAX_ATTEMPTS = 3
+
+    # 앨범아트: 이 크기를 넘으면 받지 않는다 / 스트리밍 청크 크기
+    MAX_COVER_BYTES = 8 * 1024 * 1024
+    COVER_CHUNK = 64 * 1024
+
+    # 공유 다운로드가 다른 호출자의 취소로 끊겼을 때 다시 요청하는 횟수
+    COVER_ATTEMPTS = 3
+
+    def __init__(
+        self,
+        base_url: str = MELON_URL,
+        lrclib_url: str = LRCLIB_URL,
+        lyrics_store: Optional[LocalLyricsStore] = None,
+        limiter: Optional[RateLimiter] = None,
+        flight: Optional[SingleFlight] = None,
+    ):
+        """
+        base_url / lrclib_url: 로컬 스탠드인 서버 등으로 요청을 돌릴 때 지정.
+        멜론 URL을 그대로 넘겨도 호스트 부분이 base_url로 치환된다.
+        lyrics_store: 싱크 가사 로컬 저장소. 생략 시 기본 위치에 가져온 덤프가 있으면 사용 (프로세스 전역 공유).
+        limiter: 호스트별 요청 제한. 생략 시 프로세스 전역 리미터를 공유.
+        flight: 같은 앨범/곡 동시 요청 병합 + 짧은 결과 캐시. 생략 시 전역 인스턴스 공유.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.lrclib_url = lrclib_url.rstrip("/")
+        self.lyrics_store = lyrics_store if lyrics_store is not None else LocalLyricsStore.shared()
+        self.limiter = limiter or _shared_limiter
+        self.flight = flight or _shared_flight
+
+    def flight_stats(self) -> dict:
+        """요청 병합 통계: hits(캐시) / coalesced(진행 중 합류) / misses(실제 요청)"""
+        return self.flight.stats()
+
+    def _melon_url(self, url: str) -> str:
+        if self.base_url == self.MELON_URL:
+            return url
+        return _MELON_HOST.sub(self.base_url, url)
+
+    def _fetch(self, url: str, timeout: float, **attrs) -> requests.Response:
+        """GET + raise_for_status, fetch 스팬 기록"""
+        with span("fetch", url=url, **attrs) as sp:
+            resp = self._get(url, timeout, sp.attrs)
+            sp.attrs["status"] = str(resp.status_code)
+            sp.bytes = len(resp.content)
+            resp.raise_for_status()
+        return resp
 
-        album_name = self._get_album_name(soup)
-        album_artist = self._get_album_artist(soup)
-        genre, release_date = self._get_meta_info(soup)
-        cover_url = self._get_cover_url(soup)
-        tracks = self._get_tracks(soup, album_name, album_artist, genre)
+    def _get(self, url: str, timeout: float, attrs: dict, headers: Optional[dict] = HEADERS, **kwargs):
+        """
+        호스트 리미터를 거쳐 GET. 429/503이면 리미터가 감속·대기한 뒤 재시도한다.
+        attrs: 스팬 속성 (재시도 횟수·리미터 대기 시간 기록)
+        """
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            with self.limiter.limit(url) as permit:
+                resp = requests.get(url, headers=headers, timeout=timeout, **kwargs)
+                permit.observe(resp)
+            if permit.waited_s >= 0.001:
+                attrs["throttle_wait_ms"] = f"{permit.waited_s * 1000:.0f}"
+            if resp.status_code not in THROTTLE_STATUS:
+                break
+            attrs["attempts"] = str(attempt)
+            if attempt == self.MAX_ATTEMPTS:
+                break
+            # stream=True 응답은 본문을 읽거나 닫기 전까지 풀 연결을 잡고 있다
+            resp.close()
+        return resp
+
+    def crawl_album(
+        self,
+        url: str,
+        on_cover: Optional[Callable[[AlbumInfo], None]] = None,
+        cancel: Optional[threading.Event] = None,
+        with_cover: bool = True,
+    ) -> AlbumInfo:
+        """
+        on_cover 없이 호출하면 앨범아트까지 받은 뒤 반환한다.
+        with_cover=False면 앨범아트는 받지 않는다 (텍스트 태그만 갱신할 때).
+        on_cover를 주면 HTML 파싱 직후 반환하고, 앨범아트는 백그라운드에서 받아
+        on_cover(album)을 워커 스레드에서 호출한다 (실패·취소 시 cover_data는 None).
+        cancel이 설정되면 진행 중인 앨범아트 다운로드를 중단한다.
+
+        같은 앨범을 동시에 요청하면 한 번만 가져와 결과(AlbumInfo)를 공유한다.
+        with_cover=False로 받은 객체는 다른 호출자와 공유될 수 있으므로 수정하지 않는다.
+        앨범아트는 호출자별 사본에 붙인다 (공유 객체에는 cover_data를 쓰지 않는다).
+        """
+        url = self._melon_url(url)
+        m = _ALBUM_ID.search(url)
+        key = ("album", self.base_url, m.group(1) if m else url)
+        album_id = m.group(1) if m else ""
+        album = self.flight.do(
+            key,
+            lambda: self.parse_album(self._fetch(url, timeout=15, kind="album").text, album_id),
+        )
+        if with_cover:
+            album = replace(album, tracks=list(album.tracks))
+            if on_cover is None:
+                self._attach_cover(album, cancel)
+            else:
+                _cover_pool.submit(self._cover_job, album, on_cover, cancel)
+        return album
+
+    # ── MetadataProvider ──────────────────────
+    def fetch_album(self, query: AlbumQuery) -> Optional[AlbumInfo]:
+        if query.url and _ALBUM_ID.search(query.url):
+            url = query.url
+        elif query.album_id:
+            url = self.ALBUM_URL.format(query.album_id)
+        else:
+            return None                 # 멜론은 albumId로만 찾는다
+        return self.crawl_album(url, with_cover=False)
+
+    def fetch_cover(self, album: AlbumInfo, cancel: Optional[threading.Event] = None) -> Optional[bytes]:
+        # album은 fetch_album이 돌려준 공유 객체일 수 있으므로 바이트만 돌려준다
+        return album.cover_data or self._cover_bytes(album, cancel)
+
+    def _cover_job(self, album: AlbumInfo, on_cover, cancel: Optional[threading.Event]):
+        self._attach_cover(album, cancel)
+        if cancel is None or not cancel.is_set():
+            on_cover(album)
+
+    def _attach_cover(self, album: AlbumInfo, cancel: Optional[threading.Event] = None):
+        """album(호출자 자신의 사본)에 앨범아트를 붙인다. 실패·취소 시 그대로 둔다"""
+        if album.cover_data is not None or not album.cover_url:
+            return
+        data = self._cover_bytes(album, cancel)
+        if data and album.cover_data is None:
+            album.cover_data = data
+
+    def _cover_bytes(self, album: AlbumInfo, cancel: Optional[threading.Event] = None) -> Optional[bytes]:
+        """
+        앨범아트 바이트 (실패·취소 시 None). 미리 받기(prefetch)와 실제 크롤링이 겹치면
+        다운로드 하나를 공유하고, 받은 바이트는 flight 캐시에 잠시 남아 뒤이은 크롤링도 재사용한다.
+        """
+        if not album.cover_url:
+            return None
+        url, name = album.cover_url, album.album_name
+
+        def download() -> bytes:
+            data = self.download_cover(url, name, cancel)
+            if data is None:
+                raise _CoverCancelled(url)
+            return data
+
+        # 다운로드는 먼저 온 호출자의 cancel로 돌므로, 그 호출자가 취소하면 합류한 쪽도 _CoverCancelled를
+        # 받는다. 내 cancel이 아니면 다시 요청한다 (이번엔 내가 다운로드를 맡을 수 있다)
+        for _ in range(self.COVER_ATTEMPTS):
+            if cancel is not None and cancel.is_set():
+                return None
+            try:
+                return self.flight.do(("cover", url), download)
+            except _CoverCancelled:
+                continue
+            except Exception:
+                return None
+        return None
 
-        album = AlbumInfo(
+    def download_cover(
+        self, url: str, album_name: str = "", cancel: Optional[threading.Event] = None,
+    ) -> Optional[bytes]:
+        """
+        앨범아트를 청크 단위로 스트리밍해서 받는다.
+        MAX_COVER_BYTES를 넘으면 CoverTooLarge, 취소되면 None.
+        """
+        with span("cover_download", url=url, album=album_name) as sp:
+            resp = self._get(url, 10, sp.attrs, stream=True)
+            try:
+                resp.raise_for_status()
+                declared = int(resp.headers.get("Content-Length") or 0)
+                if declared > self.MAX_COVER_BYTES:
+                    raise CoverTooLarge(f"cover is {declared} bytes")
+                buf = bytearray()
+                for chunk in resp.iter_content(self.COVER_CHUNK):
+                    if cancel is not None and cancel.is_set():
+                        sp.outcome = "miss"
+                        sp.attrs["cancelled"] = "1"
+                        return None
+                    buf += chunk
+                    if len(buf) > self.MAX_COVER_BYTES:
+                        raise CoverTooLarge(f"cover exceeds {self.MAX_COVER_BYTES} bytes")
+                sp.bytes = len(buf)
+                return bytes(buf)
+            finally:
+                resp.close()
+
+    def parse_album(self, html: str, album_id: str = "") -> AlbumInfo:
+        """
+        앨범 상세 페이지 HTML을 AlbumInfo로 변환 (네트워크 없음).
+        album_id: 페이지(og:url)에서 찾지 못할 때 쓸 albumId
+        """
+        with span("parse", kind="album") as sp:
+            sp.bytes = len(html)
+            soup = BeautifulSoup(html, "html.parser")
+
+            album_name = self._get_album_name(soup)
+            album_artist = self._get_album_artist(soup)
+            genre, release_date = self._get_meta_info(soup)
+            cover_url = self._get_cover_url(soup)
+            album_id = self._get_album_id(soup) or album_id
+            tracks = self._get_tracks(soup, album_name, album_artist, genre, album_id)
+            sp.attrs["album"] = album_name
+
+        return AlbumInfo(
             album_name=album_name,
             album_artist=album_artist,
             genre=genre,
@@ -42,14 +265,10 @@ class MelonCrawler:
             tracks=tracks,
         )
 
-        if cover_url:
-            try:
-                cover_resp = requests.get(cover_url, headers=self.HEADERS, timeout=10)
-                album.cover_data = cover_resp.content
-            except Exception:
-                pass
-
-        return album
+    def _get_album_id(self, soup: BeautifulSoup) -> str:
+        og = soup.select_one('meta[property="og:url"]')
+        m = _ALBUM_ID.search(og.get("content", "")) if og else None
+        return m.group(1) if m else ""
 
     def _get_album_name(self, soup: BeautifulSoup) -> str:
         el = soup.select_one(".song_name")
@@ -93,6 +312,7 @@ class MelonCrawler:
         album_name: str,
         album_artist: str,
         genre: str,
+        album_id: str = "",
     ) -> List[TrackInfo]:
         tracks = []
         rows = soup.select("tbody tr")
@@ -108,7 +328,13 @@ class MelonCrawler:
 
             disc_attr = row.get("data-group-items", "")
             disc_match = re.search(r"cd(\d+)", disc_attr, re.IGNORECASE)
-            disc_num = int(disc_match.group(1)) if disc_match else 1
+            if disc_match:
+                disc_num = int(disc_match.group(1))
+            elif tracks and track_num <= tracks[-1].track_number:
+                # 디스크 구분 속성이 없는 페이지: 순번이 다시 작아지면 다음 디스크
+                disc_num = tracks[-1].disc_number + 1
+            else:
+                disc_num = tracks[-1].disc_number if tracks else 1
 
             checkbox = row.select_one('input[type="checkbox"]')
             song_id = checkbox["value"] if checkbox else ""
@@ -148,6 +374,7 @@ class MelonCrawler:
                     genre=genre,
                     song_id=song_id,
                     disc_number=disc_num,
+                    album_id=album_id,
                 )
             )
 
@@ -157,17 +384,30 @@ class MelonCrawler:
         result = {"lyrics": "", "genre": ""}
         if not song_id:
             return result
-        url = f"https://www.melon.com/song/detail.htm?songId={song_id}"
+        url = f"{self.base_url}/song/detail.htm?songId={song_id}"
         try:
-            resp = requests.get(url, headers=self.HEADERS, timeout=15)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-            result["lyrics"] = self._extract_lyrics(soup)
-            result["genre"] = self._extract_song_genre(soup)
+            shared = self.flight.do(
+                ("song", self.base_url, song_id),
+                lambda: self.parse_song_detail(self._fetch(url, timeout=15, kind="song").text),
+            )
+            result = dict(shared)
         except Exception:
             pass
         return result
 
+    def parse_song_detail(self, html: str) -> dict:
+        """곡 상세 페이지 HTML에서 가사·장르 추출 (네트워크 없음)"""
+        with span("parse", kind="song") as sp:
+            sp.bytes = len(html)
+            soup = BeautifulSoup(html, "html.parser")
+            result = {
+                "lyrics": self._extract_lyrics(soup),
+                "genre": self._extract_song_genre(soup),
+            }
+            if not result["lyrics"]:
+                sp.outcome = "miss"
+        return result
+
     def crawl_lyrics(self, song_id: str) -> str:
         return self.crawl_song_detail(song_id)["lyrics"]
 
@@ -180,35 +420,70 @@ class MelonCrawler:
         return ""
 
     def fetch_synced_lyrics(
-        self, title: str, artist: str, album: str
+        self, title: str, artist: str, album: str, duration: Optional[float] = None,
     ) -> List[Tuple[str, int]]:
-        url = "https://lrclib.net/api/get"
+        """로컬 가사 저장소를 먼저 조회하고, 없을 때만 lrclib.net에 요청"""
+        if self.lyrics_store is not None:
+            try:
+                with span("fetch", kind="lyrics_store", album=album) as sp:
+                    lrc_text = self.lyrics_store.lookup(title, artist, album, duration)
+                    if not lrc_text:
+                        sp.outcome = "miss"
+                if lrc_text:
+                    return self._parse_lrc(lrc_text)
+            except Exception:
+                pass
+
+        url = f"{self.lrclib_url}/api/get"
         params = {
             "artist_name": artist,
             "track_name": title,
             "album_name": album,
         }
+        if duration:
+            params["duration"] = int(round(duration))
         try:
-            resp = requests.get(url, params=params, timeout=10)
-            if resp.status_code == 200:
-                data = resp.json()
-                lrc_text = data.get("syncedLyrics") or ""
-                if lrc_text:
-                    return self._parse_lrc(lrc_text)
+            # 404(가사 없음)는 결과로 캐시되고, 네트워크 오류는 캐시되지 않는다
+            lrc_text = self.flight.do(
+                ("lrclib", url, tuple(sorted(params.items()))),
+                lambda: self._lrclib_get(url, params, album),
+            )
+            if lrc_text:
+                return self._parse_lrc(lrc_text)
         except Exception:
             pass
         return []
 
+    def _lrclib_get(self, url: str, params: dict, album: str) -> str:
+        with span("fetch", url=url, kind="lrclib", album=album) as sp:
+            resp = self._get(url, 10, sp.attrs, headers=None, params=params)
+            sp.attrs["status"] = str(resp.status_code)
+            sp.bytes = len(resp.content)
+            lrc_text = ""
+            if resp.status_code == 200:
+                lrc_text = resp.json().get("syncedLyrics") or ""
+            elif resp.status_code != 404:
+                resp.raise_for_status()
+            if not lrc_text:
+                sp.outcome = "miss"
+        return lrc_text
+
     def _parse_lrc(self, lrc_text: str) -> List[Tuple[str, int]]:
-        pattern = re.compile(r"\[(\d{2}):(\d{2})\.(\d{2,3})\](.*)")
-        result = []
-        for line in lrc_text.splitlines():
-            m = pattern.match(line.strip())
-            if m:
-                mm, ss, cs, text = m.groups()
-                ms = int(mm) * 60000 + int(ss) * 1000 + int(cs.ljust(3, "0")[:3])
-                result.append((text.strip(), ms))
-        return result
+        return list(_parse_lrc_cached(lrc_text))
+
+    def fetch_track_lyrics(
+        self, track: TrackInfo, duration: Optional[float] = None,
+    ) -> Tuple[str, List[Tuple[str, int]]]:
+        """
+        트랙 하나의 (일반 가사, 싱크 가사). 멜론 가사가 없으면 싱크 가사에서 추출.
+        duration: 파일의 재생 시간 (초) — 싱크 가사 후보 중 길이가 맞는 것을 고른다
+        """
+        detail = self.crawl_song_detail(track.song_id)
+        synced = self.fetch_synced_lyrics(track.title, track.artist, track.album, duration)
+        lyrics = detail["lyrics"]
+        if not lyrics and synced:
+            lyrics = "\n".join(text for text, _ in synced if text.strip())
+        return lyrics, synced
 
     def _extract_lyrics(self, soup: BeautifulSoup) -> str:
         candidates = [
@@ -232,3 +507,19 @@ class MelonCrawler:
                 if len(text) > 10:
                     return text
         return ""
+
+
+_LRC_LINE = re.compile(r"\[(\d{2}):(\d{2})\.(\d{2,3})\](.*)")
+
+
+@lru_cache(maxsize=512)
+def _parse_lrc_cached(lrc_text: str) -> Tuple[Tuple[str, int], ...]:
+    """같은 LRC 텍스트는 한 번만 파싱 (곡별 캐시)"""
+    result = []
+    for line in lrc_text.splitlines():
+        m = _LRC_LINE.match(line.strip())
+        if m:
+            mm, ss, cs, text = m.groups()
+            ms = int(mm) * 60000 + int(ss) * 1000 + int(cs.ljust(3, "0")[:3])
+            result.append((text.strip(), ms))
+    return tuple(result)
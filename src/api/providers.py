@@ -0,0 +1,292 @@
+"""
+메타데이터 출처(provider) 인터페이스 + 여러 출처 동시 조회 (외부 연동)
+
+MelonCrawler가 기본 출처이고, 다른 음원 사이트나 로컬 출처(라이브러리 앨범 캐시 등)는
+MetadataProvider를 구현해 ProviderSet에 넣는다. 요청 병합·결과 캐시(SingleFlight)와
+호스트별 요청 제한(rate_limiter)은 출처마다 각자 가진다.
+
+ProviderSet 조회 순서:
+- 첫 출처를 바로 보내고, hedge_after초 안에 답이 없으면 다음 출처도 보낸다 (hedged request).
+  보낸 출처가 모두 실패하면 기다리지 않고 바로 다음 출처를 보낸다.
+- 먼저 도착한 쓸 만한 답이 기준이다. 빈 필드(장르·발매일·가사 등)가 없으면 바로 돌려주고,
+  있으면 남은 출처를 모두 보내 budget초 안에 도착한 답으로 필드 단위로 채운다.
+  시한을 넘긴 답은 기다리지 않는다 (출처 쪽 캐시에는 남는다).
+"""
+
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.models import AlbumInfo, TrackInfo
+
+_ALBUM_ID = re.compile(r"albumId=(\d+)")
+
+ALBUM_FIELDS = ("album_artist", "genre", "release_date", "cover_url")
+TRACK_FIELDS = ("title", "artist", "genre", "song_id")
+
+# 출처 호출 전용 (출처 안의 요청 제한은 각 출처가 처리)
+_provider_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="provider")
+
+Lyrics = Tuple[str, List[Tuple[str, int]]]
+Answer = Tuple["MetadataProvider", Any]
+
+
+@dataclass(frozen=True)
+class AlbumQuery:
+    """앨범 조회 조건. 멜론 albumId가 출처 공통 키이고, 이름은 검색형 출처용"""
+    album_id: str = ""
+    url: str = ""
+    album_name: str = ""
+    album_artist: str = ""
+
+    @classmethod
+    def from_url(cls, url: str) -> "AlbumQuery":
+        m = _ALBUM_ID.search(url)
+        return cls(album_id=m.group(1) if m else "", url=url)
+
+
+class MetadataProvider:
+    """
+    메타데이터 출처. name과 지원하는 조회만 구현하면 된다 (나머지는 "없음"을 돌려준다).
+    조회 메서드는 여러 작업 스레드에서 동시에 불린다. 찾지 못하면 None/빈 값, 통신 오류는 예외.
+    """
+
+    name = "provider"
+
+    def fetch_album(self, query: AlbumQuery) -> Optional[AlbumInfo]:
+        """앨범 정보 (앨범아트는 받지 않아도 된다 — fetch_cover에서 따로 받는다)"""
+        return None
+
+    def fetch_cover(self, album: AlbumInfo, cancel: Optional[threading.Event] = None) -> Optional[bytes]:
+        """이 출처의 fetch_album이 돌려준 album의 앨범아트"""
+        return album.cover_data
+
+    def fetch_track_lyrics(self, track: TrackInfo, duration: Optional[float] = None) -> Lyrics:
+        """트랙 하나의 (일반 가사, 싱크 가사). duration: 파일의 재생 시간 (초, 모르면 None)"""
+        return "", []
+
+
+class LibraryProvider(MetadataProvider):
+    """
+    라이브러리 색인의 앨범 캐시 (services.LibraryIndex). 네트워크 없이 바로 답하므로
+    멜론이 느리거나 실패할 때의 대체 출처, 빈 필드를 채우는 출처로 쓴다.
+    max_age보다 오래 전에 가져온 앨범은 돌려주지 않는다 (멜론 쪽 수정 이전 값이 기준 답이 되지 않도록).
+    """
+
+    name = "library"
+    MAX_AGE_S = 7 * 24 * 3600
+
+    def __init__(self, index, max_age: Optional[float] = MAX_AGE_S):
+        self.index = index
+        self.max_age = max_age
+
+    def fetch_album(self, query: AlbumQuery) -> Optional[AlbumInfo]:
+        if not query.album_id:
+            return None
+        return self.index.get_album(query.album_id, self.max_age)
+
+
+# ── 필드 병합 ────────────────────────────────
+def missing_fields(album: AlbumInfo) -> List[str]:
+    """비어 있는 앨범 필드 + 하나라도 비어 있는 트랙 필드 ("track.genre" 형식)"""
+    missing = [name for name in ALBUM_FIELDS if not getattr(album, name)]
+    for name in TRACK_FIELDS:
+        if any(not getattr(t, name) for t in album.tracks):
+            missing.append(f"track.{name}")
+    return missing
+
+
+def merge_albums(base: AlbumInfo, others: Sequence[AlbumInfo]) -> AlbumInfo:
+    """
+    base의 빈 필드를 others(앞쪽 우선)에서 채운 앨범.
+    트랙 필드는 트랙 구성((디스크, 트랙) 목록)이 같은 앨범에서만 가져온다.
+    바꿀 것이 없으면 base를 그대로, 있으면 새 객체를 돌려준다 (출처 캐시의 공유 객체는 수정하지 않는다).
+    """
+    album_changes: Dict[str, str] = {}
+    for name in ALBUM_FIELDS:
+        if not getattr(base, name):
+            value = next((getattr(o, name) for o in others if getattr(o, name)), "")
+            if value:
+                album_changes[name] = value
+    cover_ref = base.cover_ref or next((o.cover_ref for o in others if o.cover_ref), None)
+
+    keys = [t.key for t in base.tracks]
+    same_layout = [{t.key: t for t in o.tracks} for o in others if [t.key for t in o.tracks] == keys]
+    genre = album_changes.get("genre", base.genre)
+    tracks: List[TrackInfo] = []
+    tracks_changed = False
+    for track in base.tracks:
+        changes = {}
+        for name in TRACK_FIELDS:
+            if getattr(track, name):
+                continue
+            value = next((getattr(m[track.key], name) for m in same_layout if getattr(m[track.key], name)), "")
+            if not value and name == "genre":
+                value = genre
+            if value:
+                changes[name] = value
+        if changes:
+            track = replace(track, **changes)
+            tracks_changed = True
+        tracks.append(track)
+
+    if not album_changes and not tracks_changed and cover_ref == base.cover_ref:
+        return base
+    return AlbumInfo(
+        album_name=base.album_name,
+        album_artist=album_changes.get("album_artist", base.album_artist),
+        genre=genre,
+        release_date=album_changes.get("release_date", base.release_date),
+        cover_url=album_changes.get("cover_url", base.cover_url),
+        tracks=tracks,
+        cover_ref=cover_ref,
+    )
+
+
+class ProviderSet:
+    """
+    여러 출처를 우선순위 순으로 묶어 hedged 조회 + 필드 병합.
+    crawl_album / fetch_track_lyrics는 MelonCrawler와 같은 모양이라 작업 큐에서 그대로 바꿔 쓸 수 있다.
+    """
+
+    HEDGE_AFTER_S = 1.0
+    BUDGET_S = 3.0
+
+    def __init__(
+        self,
+        providers: Sequence[MetadataProvider],
+        hedge_after: float = HEDGE_AFTER_S,
+        budget: float = BUDGET_S,
+    ):
+        """
+        providers: 우선순위 순 (첫 출처가 기본, 나머지는 hedge_after초 간격으로 추가 요청)
+        budget: 첫 답이 불완전할 때 다른 출처의 답을 기다리는 시한 (조회 시작부터, 초)
+        """
+        if not providers:
+            raise ValueError("at least one provider is required")
+        self.providers = list(providers)
+        self.hedge_after = hedge_after
+        self.budget = budget
+        self._lock = threading.Lock()
+        self._stats = {
+            p.name: dict.fromkeys(("sent", "hedged", "won", "merged", "empty", "failed"), 0)
+            for p in self.providers
+        }
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        출처별 통계: sent(요청) / hedged(앞 출처가 늦거나 불완전해 추가 요청) /
+        won(기준 답) / merged(시한 안에 도착해 병합에 쓰인 답) / empty(못 찾음) / failed(오류)
+        """
+        with self._lock:
+            return {name: dict(counts) for name, counts in self._stats.items()}
+
+    def _count(self, provider: MetadataProvider, what: str):
+        with self._lock:
+            self._stats[provider.name][what] += 1
+
+    # ── 조회 ──────────────────────────────────
+    def fetch_album(
+        self, query: AlbumQuery, with_cover: bool = True, cancel: Optional[threading.Event] = None,
+    ) -> AlbumInfo:
+        """찾지 못하면 마지막 출처 오류를 다시 올리고, 오류도 없으면 LookupError"""
+        answers, error = self._race(
+            lambda p: p.fetch_album(query),
+            good=lambda album: album is not None and bool(album.tracks),
+            complete=lambda albums: not missing_fields(merge_albums(albums[0], albums[1:])),
+        )
+        if not answers:
+            if error is not None:
+                raise error
+            raise LookupError(f"album not found: {query.album_id or query.url}")
+        album = merge_albums(answers[0][1], [a for _, a in answers[1:]])
+        if with_cover and album.cover_data is None:
+            for provider, source in answers:
+                try:
+                    data = provider.fetch_cover(source, cancel)
+                except Exception:
+                    continue
+                if data:
+                    # merge_albums는 바꿀 것이 없으면 출처 캐시의 공유 객체를 그대로 돌려준다
+                    if album is answers[0][1]:
+                        album = replace(album, tracks=list(album.tracks))
+                    album.cover_data = data
+                    break
+        return album
+
+    def crawl_album(self, url: str, with_cover: bool = True) -> AlbumInfo:
+        """멜론 앨범 URL로 조회 (MelonCrawler.crawl_album 대신 쓰는 용도)"""
+        return self.fetch_album(AlbumQuery.from_url(url), with_cover)
+
+    def fetch_track_lyrics(self, track: TrackInfo, duration: Optional[float] = None) -> Lyrics:
+        """출처별 (일반 가사, 싱크 가사) 중 먼저 온 답 기준, 빈 쪽은 다른 출처로 채운다"""
+        answers, _ = self._race(
+            lambda p: p.fetch_track_lyrics(track, duration),
+            good=lambda r: bool(r[0] or r[1]),
+            complete=lambda rs: any(r[0] for r in rs) and any(r[1] for r in rs),
+        )
+        lyrics = next((r[0] for _, r in answers if r[0]), "")
+        synced = next((r[1] for _, r in answers if r[1]), [])
+        return lyrics, synced
+
+    # ── hedged 요청 ───────────────────────────
+    def _race(
+        self,
+        call: Callable[[MetadataProvider], Any],
+        good: Callable[[Any], bool],
+        complete: Callable[[List[Any]], bool],
+    ) -> Tuple[List[Answer], Optional[BaseException]]:
+        """
+        (도착 순 [(출처, 답)], 마지막 오류). 첫 항목이 기준 답이다.
+        complete(지금까지의 답 목록)가 참이 되면 시한 전이라도 바로 끝낸다.
+        쓸 만한 답이 하나도 없으면 모든 출처가 끝날 때까지 기다린다.
+        """
+        start = time.monotonic()
+        waiting = list(self.providers)
+        running: Dict[Future, MetadataProvider] = {}
+        answers: List[Answer] = []
+        error: Optional[BaseException] = None
+        next_hedge = start
+
+        def send():
+            provider = waiting.pop(0)
+            self._count(provider, "sent")
+            if running or answers:
+                self._count(provider, "hedged")
+            running[_provider_pool.submit(call, provider)] = provider
+
+        while True:
+            now = time.monotonic()
+            if not answers and waiting and (not running or now >= next_hedge):
+                send()
+                next_hedge = now + self.hedge_after
+                continue
+            if not running or (answers and now >= start + self.budget):
+                break
+            if answers:
+                timeout = start + self.budget - now
+            else:
+                timeout = next_hedge - now if waiting else None
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                provider = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    error = exc
+                    self._count(provider, "failed")
+                    continue
+                if not good(result):
+                    self._count(provider, "empty")
+                    continue
+                answers.append((provider, result))
+                self._count(provider, "won" if len(answers) == 1 else "merged")
+                if complete([r for _, r in answers]):
+                    return answers, error
+                # 빈 필드가 있다: 남은 출처를 모두 보내 시한 안에 채운다
+                while waiting:
+                    send()
+        return answers, error
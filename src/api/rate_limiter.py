@@ -0,0 +1,229 @@
+"""
+호스트별 적응형 요청 제한 (토큰 버킷 + AIMD 동시성)
+
+모든 크롤러 인스턴스·스레드가 프로세스 전역 rate_limiter 하나를 공유한다.
+- 토큰 버킷: 호스트별 초당 요청 수 (rate) 와 순간 허용량 (burst)
+- 동시 요청 창: 성공 시 조금씩 늘리고 (additive increase),
+  429/503·Retry-After 를 받으면 절반으로 줄인다 (multiplicative decrease)
+- 응답 지연 EWMA 가 목표치를 넘으면 창을 완만하게 줄인다
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+THROTTLE_STATUS = (429, 503)
+
+# Retry-After 상한 (하루짜리 값 하나로 모든 작업 스레드가 멈추지 않게)
+MAX_RETRY_AFTER_S = 60.0
+# 요청 허가를 기다리는 기본 시한. 넘으면 ThrottleTimeout
+ACQUIRE_TIMEOUT_S = 90.0
+
+
+class ThrottleTimeout(TimeoutError):
+    """호스트 리미터 대기 시한 초과"""
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    rate: float = 10.0                  # 시작 초당 요청 수
+    burst: float = 10.0
+    min_rate: float = 0.5
+    max_rate: float = 50.0
+    concurrency: int = 4                # 시작 동시 요청 수
+    max_concurrency: int = 8
+    latency_target_ms: float = 3000.0
+
+
+# 호스트 접미사 → 정책. 멜론 본 사이트는 차단을 피하려고 보수적으로 잡는다.
+DEFAULT_POLICIES: Dict[str, HostPolicy] = {
+    "melon.com": HostPolicy(rate=4.0, burst=4.0, max_rate=10.0, concurrency=2, max_concurrency=4),
+    "melon.co.kr": HostPolicy(rate=10.0, burst=10.0, max_rate=30.0, concurrency=4, max_concurrency=8),
+    "lrclib.net": HostPolicy(rate=5.0, burst=5.0, max_rate=15.0, concurrency=2, max_concurrency=4),
+}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) → 대기 초"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+@dataclass
+class Permit:
+    """limit() 블록 안에서 응답 결과를 기록한다. 기록 없이 끝나면 실패로 본다."""
+    status: Optional[int] = None
+    retry_after: Optional[float] = None
+    waited_s: float = 0.0
+
+    def observe(self, response):
+        self.status = response.status_code
+        self.retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+
+class HostLimiter:
+    def __init__(self, host: str, policy: HostPolicy):
+        self.host = host
+        self.policy = policy
+        self._cond = threading.Condition()
+        self.rate = policy.rate
+        self.concurrency = float(policy.concurrency)
+        self._tokens = policy.burst
+        self._stamp = time.monotonic()
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        self._latency_ewma: Optional[float] = None
+        self._last_decrease = 0.0
+        self.requests = 0
+        self.throttled = 0
+        self.waited_s = 0.0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.policy.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        요청 하나를 보낼 수 있을 때까지 기다린다. 반환: 대기한 초.
+        timeout초 안에 허가를 받지 못하면 (차단이 그보다 길게 남았으면 바로) ThrottleTimeout
+        """
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._in_flight >= int(self.concurrency):
+                    wait = None                         # release() 가 깨운다
+                elif self._tokens < 1.0:
+                    wait = (1.0 - self._tokens) / self.rate
+                else:
+                    self._tokens -= 1.0
+                    self._in_flight += 1
+                    self.requests += 1
+                    waited = now - start
+                    self.waited_s += waited
+                    return waited
+                if deadline is not None:
+                    if now >= deadline or (now < self._blocked_until and self._blocked_until > deadline):
+                        raise ThrottleTimeout(f"{self.host}: throttled for {now - start:.1f}s")
+                    wait = deadline - now if wait is None else min(wait, deadline - now)
+                self._cond.wait(wait)
+
+    def release(self, status: Optional[int], latency_s: float, retry_after: Optional[float] = None):
+        p = self.policy
+        with self._cond:
+            self._in_flight -= 1
+            now = time.monotonic()
+            if status in THROTTLE_STATUS:
+                self.throttled += 1
+                # 동시에 나가 있던 요청들이 한꺼번에 429를 받아도 감속은 한 번만
+                if now - self._last_decrease >= self._decrease_window():
+                    self.concurrency = max(1.0, self.concurrency / 2)
+                    self.rate = max(p.min_rate, self.rate / 2)
+                    self._last_decrease = now
+                pause = min(retry_after, MAX_RETRY_AFTER_S) if retry_after is not None else 1.0 / self.rate
+                self._blocked_until = max(self._blocked_until, now + pause)
+                self._tokens = 0.0
+            elif status is None or status >= 500:
+                # 연결 실패·서버 오류: 창만 약하게 줄인다
+                self.concurrency = max(1.0, self.concurrency * 0.75)
+            else:
+                ms = latency_s * 1000
+                ewma = self._latency_ewma
+                self._latency_ewma = ms if ewma is None else ewma * 0.8 + ms * 0.2
+                if self._latency_ewma > p.latency_target_ms:
+                    self.concurrency = max(1.0, self.concurrency * 0.9)
+                else:
+                    self.concurrency = min(float(p.max_concurrency), self.concurrency + 1.0 / self.concurrency)
+                    self.rate = min(p.max_rate, self.rate + 1.0 / self.rate)
+            self._cond.notify_all()
+
+    def _decrease_window(self) -> float:
+        latency = (self._latency_ewma or 0.0) / 1000
+        return max(0.5, latency * 2)
+
+    def snapshot(self) -> dict:
+        with self._cond:
+            return {
+                "rate": round(self.rate, 2),
+                "concurrency": round(self.concurrency, 2),
+                "in_flight": self._in_flight,
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "waited_s": round(self.waited_s, 3),
+                "latency_ewma_ms": round(self._latency_ewma or 0.0, 1),
+            }
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        policies: Optional[Dict[str, HostPolicy]] = None,
+        default: HostPolicy = HostPolicy(),
+    ):
+        self._policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self._default = default
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, HostLimiter] = {}
+
+    def policy_for(self, host: str) -> HostPolicy:
+        for suffix, policy in self._policies.items():
+            if host == suffix or host.endswith("." + suffix):
+                return policy
+        return self._default
+
+    def for_host(self, host: str) -> HostLimiter:
+        host = (host or "").lower()
+        with self._lock:
+            limiter = self._hosts.get(host)
+            if limiter is None:
+                limiter = self._hosts[host] = HostLimiter(host, self.policy_for(host))
+            return limiter
+
+    def configure(self, suffix: str, **changes):
+        """정책 조정 (이미 만들어진 호스트 리미터에는 다음 생성부터 반영)"""
+        with self._lock:
+            base = self._policies.get(suffix, self._default)
+            self._policies[suffix] = replace(base, **changes)
+
+    @contextmanager
+    def limit(self, url: str, timeout: Optional[float] = ACQUIRE_TIMEOUT_S) -> Iterator[Permit]:
+        """
+        with rate_limiter.limit(url) as permit:
+            resp = requests.get(url)
+            permit.observe(resp)
+
+        timeout: 허가 대기 시한 (None이면 무기한). 넘으면 ThrottleTimeout
+        """
+        limiter = self.for_host(urlsplit(url).hostname or "")
+        permit = Permit(waited_s=limiter.acquire(timeout))
+        start = time.monotonic()
+        try:
+            yield permit
+        finally:
+            limiter.release(permit.status, time.monotonic() - start, permit.retry_after)
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            hosts = dict(self._hosts)
+        return {host: limiter.snapshot() for host, limiter in hosts.items()}
+
+
+# 프로세스 전역 리미터 (모든 MelonCrawler 인스턴스가 공유)
+rate_limiter = RateLimiter()
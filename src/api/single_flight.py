@@ -0,0 +1,95 @@
+"""
+단일 비행(single-flight) 요청 병합 + 짧은 결과 캐시
+
+같은 키(albumId, songId 등)에 대한 동시 요청은 먼저 온 호출 하나만 실제로 수행하고,
+나머지는 그 결과(또는 예외)를 함께 받는다. 성공한 결과는 TTL 동안 재사용한다.
+예외는 캐시하지 않는다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    def __init__(self, ttl: float = 120.0, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, _Call] = {}
+        self._cache: "OrderedDict[Hashable, tuple]" = OrderedDict()   # key → (만료 시각, 결과)
+        self.hits = 0              # 캐시에서 바로 반환
+        self.coalesced = 0         # 진행 중인 호출에 합류
+        self.misses = 0            # 실제 수행
+
+    def do(self, key: Hashable, fn: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return cached[1]
+                del self._cache[key]
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _Call()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+                if call.error is None and ttl > 0:
+                    self._cache[key] = (time.monotonic() + ttl, call.result)
+                    self._cache.move_to_end(key)
+                    while len(self._cache) > self.max_entries:
+                        self._cache.popitem(last=False)
+            call.done.set()
+        return call.result
+
+    def forget(self, key: Hashable):
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "coalesced": self.coalesced,
+                "misses": self.misses,
+                "in_flight": len(self._in_flight),
+                "cached": len(self._cache),
+            }
+
+
+# 프로세스 전역 (탭·큐마다 새 MelonCrawler를 만들어도 공유)
+single_flight = SingleFlight()
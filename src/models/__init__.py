@@ -1,5 +1,14 @@
 # models package: 도메인·데이터 구조
 
-from .album import AlbumInfo, TrackInfo
+from .album import AlbumInfo, TrackInfo, TrackKey, track_label
+from .cover_store import CoverStore, covers
+from .codec import (
+    dumps_album, loads_album, dumps_albums, loads_albums, album_to_tuple, album_from_tuple,
+)
 
-__all__ = ["AlbumInfo", "TrackInfo"]
+__all__ = [
+    "AlbumInfo", "TrackInfo", "TrackKey", "track_label",
+    "CoverStore", "covers",
+    "dumps_album", "loads_album", "dumps_albums", "loads_albums",
+    "album_to_tuple", "album_from_tuple",
+]
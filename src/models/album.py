@@ -1,13 +1,31 @@
 """
 도메인·데이터 구조: 앨범/트랙 정보 (UI·API·서비스 공통)
+
+대량 큐·캐시를 위해 __slots__ 기반으로 만들고, 트랙마다 반복되는
+앨범 공통 문자열은 intern 해서 한 벌만 둔다. 앨범아트는 CoverStore에서 받은 CoverBlob을 공유한다.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+from .cover_store import CoverBlob, covers
+
+_SHARED_TRACK_FIELDS = ("artist", "album", "album_artist", "genre", "album_id")
+
+# 앨범 안에서 트랙을 가리키는 키. 여러 장짜리 앨범은 디스크마다 트랙번호가 1부터 다시 시작한다
+TrackKey = Tuple[int, int]      # (디스크, 트랙)
 
 
-@dataclass
+def track_label(key: TrackKey, multi_disc: bool) -> str:
+    """화면 표시용 번호: 한 장짜리는 5, 여러 장은 2-05 형식"""
+    disc, num = key
+    return f"{disc}-{num:02d}" if multi_disc else str(num)
+
+
+@dataclass(frozen=True, slots=True)
 class TrackInfo:
+    """불변. 값을 바꿀 때는 dataclasses.replace 사용"""
     track_number: int
     title: str
     artist: str
@@ -17,9 +35,18 @@ class TrackInfo:
     song_id: str = ""
     lyrics: str = ""
     disc_number: int = 1
+    album_id: str = ""                        # 멜론 albumId (태그의 TXXX:MELON_ALBUM_ID)
+
+    def __post_init__(self):
+        for name in _SHARED_TRACK_FIELDS:
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
 
+    @property
+    def key(self) -> TrackKey:
+        return (self.disc_number, self.track_number)
 
-@dataclass
+
+@dataclass(slots=True)
 class AlbumInfo:
     album_name: str
     album_artist: str
@@ -27,4 +54,38 @@ class AlbumInfo:
     release_date: str
     cover_url: str
     tracks: List[TrackInfo] = field(default_factory=list)
-    cover_data: Optional[bytes] = None
+    cover_ref: Optional[str] = None          # CoverStore 참조 (content hash)
+    # 커버 바이트. 이 앨범이 사는 동안 유지된다 (replace·codec 사본은 같은 참조로 저장소에서 다시 찾음)
+    _cover: Optional[CoverBlob] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.album_name = sys.intern(self.album_name)
+        self.album_artist = sys.intern(self.album_artist)
+        self.genre = sys.intern(self.genre)
+        self._cover = covers.find(self.cover_ref)
+
+    def __reduce__(self):
+        # pickle도 codec을 거쳐 커버 바이트를 함께 싣고 저장소의 사본과 합친다
+        from .codec import dumps_album, loads_album
+        return loads_album, (dumps_album(self),)
+
+    @property
+    def multi_disc(self) -> bool:
+        return any(t.disc_number != self.tracks[0].disc_number for t in self.tracks)
+
+    @property
+    def album_id(self) -> str:
+        """멜론 albumId (트랙에 기록된 값)"""
+        return self.tracks[0].album_id if self.tracks else ""
+
+    @property
+    def cover_data(self) -> Optional[bytes]:
+        if self._cover is None or self._cover.ref != self.cover_ref:
+            # 참조만 옮겨 받은 경우: 같은 커버를 든 다른 앨범이 있으면 공유
+            self._cover = covers.find(self.cover_ref)
+        return self._cover.data if self._cover is not None else None
+
+    @cover_data.setter
+    def cover_data(self, data: Optional[bytes]):
+        self._cover = covers.put(data) if data else None
+        self.cover_ref = self._cover.ref if self._cover is not None else None
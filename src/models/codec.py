@@ -0,0 +1,97 @@
+"""
+AlbumInfo / TrackInfo 바이너리 직렬화 (캐시·작업 큐용)
+
+marshal 기반 튜플 인코딩. intern된 공통 문자열은 marshal이 참조로 한 번만 기록한다.
+marshal 포맷은 인터프리터 버전에 묶여 있으므로 버전이 다르면 ValueError —
+호출 측은 캐시 미스로 취급하면 된다.
+"""
+
+import marshal
+import sys
+from typing import List
+
+from .album import AlbumInfo, TrackInfo
+from .cover_store import covers
+
+_MAGIC = b"MTA\x01"
+_PY_TAG = bytes(sys.version_info[:2])
+_HEADER = _MAGIC + _PY_TAG
+_MARSHAL_VERSION = 4
+
+
+def _track_tuple(t: TrackInfo) -> tuple:
+    return (t.track_number, t.title, t.artist, t.album, t.album_artist,
+            t.genre, t.song_id, t.lyrics, t.disc_number, t.album_id)
+
+
+def album_to_tuple(album: AlbumInfo) -> tuple:
+    """marshal 가능한 값 튜플 (커버는 참조만). 다른 직렬화 포맷에 끼워 넣을 때 사용"""
+    return (album.album_name, album.album_artist, album.genre, album.release_date,
+            album.cover_url, album.cover_ref,
+            tuple(_track_tuple(t) for t in album.tracks))
+
+
+def album_from_tuple(raw: tuple) -> AlbumInfo:
+    name, artist, genre, release_date, cover_url, cover_ref, tracks = raw
+    return AlbumInfo(
+        album_name=name,
+        album_artist=artist,
+        genre=genre,
+        release_date=release_date,
+        cover_url=cover_url,
+        tracks=[TrackInfo(*t) for t in tracks],
+        cover_ref=cover_ref,
+    )
+
+
+def _encode(albums: List[AlbumInfo], include_cover: bool) -> bytes:
+    # 커버는 참조별로 한 번만 기록 (같은 앨범이 여러 번 있어도 한 벌)
+    cover_map = {}
+    if include_cover:
+        for album in albums:
+            if album.cover_ref and album.cover_ref not in cover_map:
+                data = covers.get(album.cover_ref)
+                if data is not None:
+                    cover_map[album.cover_ref] = data
+    payload = (cover_map, tuple(album_to_tuple(a) for a in albums))
+    return _HEADER + marshal.dumps(payload, _MARSHAL_VERSION)
+
+
+def _decode(data: bytes) -> List[AlbumInfo]:
+    cover_map, raw_albums = _unwrap(data)
+    # 앨범이 커버를 잡을 때까지 저장소에서 사라지지 않도록 들고 있는다
+    staged = [covers.put(blob, ref) for ref, blob in cover_map.items()]
+    albums = [album_from_tuple(raw) for raw in raw_albums]
+    del staged
+    return albums
+
+
+def _unwrap(data: bytes):
+    if data[:len(_MAGIC)] != _MAGIC:
+        raise ValueError("not an encoded album")
+    if data[len(_MAGIC):len(_HEADER)] != _PY_TAG:
+        raise ValueError("encoded with a different Python version")
+    try:
+        return marshal.loads(memoryview(data)[len(_HEADER):])
+    except (EOFError, TypeError) as exc:
+        raise ValueError(f"corrupt album data: {exc}") from None
+
+
+def dumps_album(album: AlbumInfo, include_cover: bool = True) -> bytes:
+    """include_cover=False면 커버는 참조만 기록 (같은 프로세스 안의 큐 등)"""
+    return _encode([album], include_cover)
+
+
+def loads_album(data: bytes) -> AlbumInfo:
+    albums = _decode(data)
+    if len(albums) != 1:
+        raise ValueError("expected a single album")
+    return albums[0]
+
+
+def dumps_albums(albums: List[AlbumInfo], include_cover: bool = True) -> bytes:
+    return _encode(albums, include_cover)
+
+
+def loads_albums(data: bytes) -> List[AlbumInfo]:
+    return _decode(data)
@@ -0,0 +1,68 @@
+"""
+앨범아트 내용 주소(content-hash) 저장소
+
+AlbumInfo는 커버(CoverBlob)를 직접 들고, 저장소는 약한 참조로 해시 → 커버를 찾아 준다.
+같은 앨범이 큐·캐시에 여러 번 올라와도 커버 메모리는 한 벌이고,
+커버를 든 앨범이 모두 사라지면 (복사본·순환 참조·종료 포함) 가비지 컬렉터가 함께 해제한다.
+"""
+
+import hashlib
+import threading
+import weakref
+from typing import Optional
+
+
+class CoverBlob:
+    """커버 바이트 한 벌. 이 객체를 잡고 있는 동안 저장소에서도 찾을 수 있다"""
+    __slots__ = ("ref", "data", "__weakref__")
+
+    def __init__(self, ref: str, data: bytes):
+        self.ref = ref
+        self.data = data
+
+
+class CoverStore:
+    """약한 참조 기반 커버 저장소 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._blobs: "weakref.WeakValueDictionary[str, CoverBlob]" = weakref.WeakValueDictionary()
+
+    @staticmethod
+    def ref_for(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def put(self, data: bytes, ref: Optional[str] = None) -> CoverBlob:
+        """
+        바이트를 저장하고 커버를 반환 (같은 내용이 살아 있으면 기존 사본 재사용).
+        ref: 직렬화 데이터처럼 해시를 이미 알고 있을 때 재계산 생략
+        """
+        ref = ref or self.ref_for(data)
+        with self._lock:
+            blob = self._blobs.get(ref)
+            if blob is None:
+                blob = self._blobs[ref] = CoverBlob(ref, data)
+            return blob
+
+    def find(self, ref: Optional[str]) -> Optional[CoverBlob]:
+        """참조로 살아 있는 커버를 찾는다. 없으면 None"""
+        if not ref:
+            return None
+        with self._lock:
+            return self._blobs.get(ref)
+
+    def get(self, ref: Optional[str]) -> Optional[bytes]:
+        blob = self.find(ref)
+        return blob.data if blob is not None else None
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(len(b.data) for b in list(self._blobs.values()))
+
+
+# 프로세스 전역 저장소
+covers = CoverStore()
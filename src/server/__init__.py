@@ -0,0 +1,6 @@
+# server package: 로컬 작업 API (다른 서비스에서 태깅 작업 제출)
+
+from .jobs import Job, JobQueue, JobError, QueueFull
+from .job_server import JobHTTPServer, JobUnixServer, main
+
+__all__ = ["Job", "JobQueue", "JobError", "QueueFull", "JobHTTPServer", "JobUnixServer", "main"]
@@ -0,0 +1,3 @@
+from src.server.job_server import main
+
+main()
@@ -0,0 +1,316 @@
+"""
+로컬 작업 API 서버 (HTTP / Unix 소켓)
+
+Tk 앱 없이 다른 서비스가 태깅 작업을 넣을 수 있게 한다. 프로세스 하나가 떠 있으면서
+크롤러의 single-flight 캐시, 호스트별 리미터, 연결 풀을 모든 요청자가 공유한다.
+앨범은 멜론을 먼저 조회하고, 늦거나 빈 필드가 있으면 라이브러리 앨범 캐시로 보완한다.
+
+Usage:
+    python3 -m src.server --port 8790 --workers 2
+    python3 -m src.server --unix /tmp/mp3tagger.sock
+
+인증: TCP로 띄우면 토큰이 필요하다 (--token, MP3TAGGER_TOKEN, 없으면 실행 시 만들어
+앱 데이터 디렉토리의 server.token에 0600으로 저장). 요청 헤더 "Authorization: Bearer <토큰>".
+브라우저 페이지가 보내는 요청(DNS rebinding 포함)을 막기 위해 Host는 localhost/127.0.0.1/[::1]만,
+POST 본문은 Content-Type: application/json만 받는다. Unix 소켓은 파일 권한으로 막고 토큰은 선택이다.
+
+Endpoints:
+    POST   /jobs                 {"album_url", "directory" | "files": {path: track | "disc-track"}, "options"}
+    GET    /jobs                 작업 목록
+    GET    /jobs/<id>            작업 상태 (?events=1 이면 이벤트 포함)
+    GET    /jobs/<id>/events     진행 이벤트 스트림 (NDJSON, chunked, 작업 종료 시 닫힘)
+    DELETE /jobs/<id>            대기 중인 작업 취소
+    GET    /metrics              Prometheus 텍스트 (큐 깊이, 처리량, 단계별 타이밍)
+    GET    /healthz
+"""
+
+import argparse
+import hmac
+import json
+import os
+import secrets
+import socket
+import socketserver
+import sqlite3
+import stat
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from src.api import LibraryProvider, MelonCrawler, ProviderSet
+from src.services import LibraryIndex, telemetry
+from src.services.app_paths import app_data_dir
+from src.server.jobs import FINISHED, JobError, JobQueue, QueueFull
+
+MAX_BODY = 1024 * 1024
+TOKEN_FILE = "server.token"
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "[::1]")
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MelonMP3Tagger"
+
+    @property
+    def jobs(self) -> JobQueue:
+        return self.server.jobs
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # ── 응답 도우미 ───────────────────────────
+    def _send(self, status: int, body: bytes, content_type: str = "application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, status: int, obj):
+        self._send(status, json.dumps(obj, ensure_ascii=False).encode("utf-8"))
+
+    def _error(self, status: int, message: str):
+        self._json(status, {"error": message})
+
+    def _allowed(self) -> bool:
+        """Host·토큰 검사. 통과하지 못하면 오류 응답을 보내고 False (읽지 않은 본문이 남으므로 연결도 닫는다)"""
+        keep = self.close_connection
+        self.close_connection = True
+        if self.server.check_host:
+            host = (self.headers.get("Host") or "").strip().lower()
+            if host.startswith("["):
+                host = host[:host.find("]") + 1]
+            else:
+                host = host.split(":", 1)[0]
+            if host not in LOCAL_HOSTS:
+                self._error(403, "host not allowed")
+                return False
+        token = self.server.token
+        if token and urlparse(self.path).path != "/healthz":
+            auth = self.headers.get("Authorization") or ""
+            given = auth[7:].strip() if auth[:7].lower() == "bearer " else ""
+            if not hmac.compare_digest(given.encode(), token.encode()):
+                self._error(401, "missing or invalid token")
+                return False
+        self.close_connection = keep
+        return True
+
+    def _read_json(self) -> Optional[dict]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0 or length > MAX_BODY:
+            return None
+        try:
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            return None
+        return body if isinstance(body, dict) else None
+
+    # ── 라우팅 ────────────────────────────────
+    def do_GET(self):
+        if not self._allowed():
+            return
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        query = parse_qs(url.query)
+
+        if parts == ["healthz"]:
+            self._json(200, {"ok": True})
+        elif parts == ["metrics"]:
+            text = self.jobs.prometheus_text() + telemetry.prometheus_text()
+            self._send(200, text.encode("utf-8"), "text/plain; version=0.0.4")
+        elif parts == ["jobs"]:
+            self._json(200, {"jobs": self.jobs.list(), "metrics": self.jobs.metrics()})
+        elif len(parts) == 2 and parts[0] == "jobs":
+            state = self.jobs.describe(parts[1], events=query.get("events") == ["1"])
+            if state is None:
+                self._error(404, "no such job")
+            else:
+                self._json(200, state)
+        elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "events":
+            job = self.jobs.get(parts[1])
+            try:
+                since = int(query.get("since", ["0"])[0] or 0)
+            except ValueError:
+                since = -1
+            if job is None:
+                self._error(404, "no such job")
+            elif since < 0:
+                self._error(400, "since must be a non-negative integer")
+            else:
+                self._stream_events(job, since)
+        else:
+            self._error(404, "not found")
+
+    def do_POST(self):
+        if not self._allowed():
+            return
+        if urlparse(self.path).path.rstrip("/") != "/jobs":
+            self._error(404, "not found")
+            return
+        # text/plain 등은 브라우저가 사전 확인(CORS preflight) 없이 보낼 수 있으므로 받지 않는다
+        content_type = (self.headers.get("Content-Type") or "").split(";", 1)[0].strip().lower()
+        if content_type != "application/json":
+            self.close_connection = True
+            self._error(415, "Content-Type must be application/json")
+            return
+        body = self._read_json()
+        if body is None:
+            self._error(400, "expected a JSON object body")
+            return
+        try:
+            job = self.jobs.submit(body)
+        except JobError as exc:
+            self._error(400, str(exc))
+        except QueueFull as exc:
+            self._error(503, str(exc))
+        else:
+            self._json(202, {"id": job.id, "state": job.state, "events": f"/jobs/{job.id}/events"})
+
+    def do_DELETE(self):
+        if not self._allowed():
+            return
+        parts = [p for p in urlparse(self.path).path.split("/") if p]
+        if len(parts) != 2 or parts[0] != "jobs":
+            self._error(404, "not found")
+        elif self.jobs.get(parts[1]) is None:
+            self._error(404, "no such job")
+        elif self.jobs.cancel(parts[1]):
+            self._json(200, {"id": parts[1], "state": "cancelled"})
+        else:
+            self._error(409, "job is not queued")
+
+    def _stream_events(self, job, since: int):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        try:
+            while True:
+                since, events = self.jobs.wait_events(job, since)
+                if events:
+                    chunk = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in events).encode("utf-8")
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                    self.wfile.flush()
+                elif job.state in FINISHED:
+                    break
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class JobHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    check_host = True
+
+    def __init__(self, address, jobs: JobQueue, verbose: bool = False, token: str = ""):
+        super().__init__(address, JobRequestHandler)
+        self.jobs = jobs
+        self.verbose = verbose
+        self.token = token
+
+
+def _stale_socket(path: str) -> bool:
+    """path가 아무도 듣고 있지 않은 소켓 파일인지 (이전 실행이 남긴 것만 지운다)"""
+    try:
+        if not stat.S_ISSOCK(os.lstat(path).st_mode):
+            return False
+    except OSError:
+        return False
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        return True
+    finally:
+        probe.close()
+    return False
+
+
+class JobUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    check_host = False
+
+    def __init__(self, path: str, jobs: JobQueue, verbose: bool = False, token: str = ""):
+        if _stale_socket(path):
+            os.unlink(path)
+        super().__init__(path, JobRequestHandler)
+        self.jobs = jobs
+        self.verbose = verbose
+        self.token = token
+
+    def get_request(self):
+        # BaseHTTPRequestHandler는 client_address를 (host, port)로 가정한다
+        sock, _ = super().get_request()
+        return sock, ("unix", 0)
+
+
+def load_token() -> str:
+    """MP3TAGGER_TOKEN, 없으면 앱 데이터 디렉토리의 토큰 파일 (없으면 새로 만든다)"""
+    token = os.environ.get("MP3TAGGER_TOKEN", "").strip()
+    if token:
+        return token
+    path = app_data_dir() / TOKEN_FILE
+    try:
+        token = path.read_text(encoding="utf-8").strip()
+    except OSError:
+        token = ""
+    if not token:
+        token = secrets.token_urlsafe(32)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as fp:
+            fp.write(token)
+    return token
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local tagging job server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8790)
+    parser.add_argument("--unix", help="TCP 대신 Unix 소켓 경로에서 대기")
+    parser.add_argument("--token", help=f"요청에 필요한 토큰 (기본: MP3TAGGER_TOKEN 또는 앱 데이터의 {TOKEN_FILE})")
+    parser.add_argument("--workers", type=int, default=2, help="동시에 실행할 작업 수")
+    parser.add_argument("--max-queued", type=int, default=100)
+    parser.add_argument("--hedge-after", type=float, default=ProviderSet.HEDGE_AFTER_S,
+                        help="멜론 응답이 이 시간(초) 안에 없으면 다음 출처도 조회")
+    parser.add_argument("--latency-budget", type=float, default=ProviderSet.BUDGET_S,
+                        help="빈 필드를 다른 출처로 채울 때 기다리는 시한 (초)")
+    parser.add_argument("--no-library", action="store_true", help="라이브러리 앨범 캐시를 출처로 쓰지 않음")
+    parser.add_argument("--library-max-age", type=float, default=LibraryProvider.MAX_AGE_S,
+                        help="이보다 오래 전(초)에 가져온 앨범 캐시는 출처로 쓰지 않음")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    providers = [MelonCrawler()]
+    if not args.no_library:
+        try:
+            providers.append(LibraryProvider(LibraryIndex(), max_age=args.library_max_age))
+        except sqlite3.Error as exc:
+            print(f"library index unavailable: {exc}")
+    jobs = JobQueue(
+        workers=args.workers, max_queued=args.max_queued,
+        providers=ProviderSet(providers, hedge_after=args.hedge_after, budget=args.latency_budget),
+    )
+    if args.unix:
+        server = JobUnixServer(args.unix, jobs, args.verbose, token=args.token or "")
+        where = args.unix
+    else:
+        server = JobHTTPServer((args.host, args.port), jobs, args.verbose, token=args.token or load_token())
+        where = f"http://{args.host}:{server.server_address[1]}"
+        if not args.token and not os.environ.get("MP3TAGGER_TOKEN"):
+            where += f" (token: {app_data_dir() / TOKEN_FILE})"
+    print(f"job server listening on {where}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        jobs.shutdown()
+        server.server_close()
+        if args.unix and os.path.exists(args.unix) and stat.S_ISSOCK(os.lstat(args.unix).st_mode):
+            os.unlink(args.unix)
+
+
+if __name__ == "__main__":
+    main()
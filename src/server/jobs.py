@@ -0,0 +1,365 @@
+"""
+태깅 작업 큐 (로컬 작업 서버용)
+
+작업 하나 = 앨범 URL + (디렉토리 | 파일→트랙 매핑).
+트랙은 번호(5) 또는 여러 장짜리 앨범이면 "2-5" / [2, 5] 처럼 (디스크, 트랙)으로 지정한다.
+고정 개수의 워커 스레드가 큐에서 꺼내 크롤링 → 매칭 → AlbumApplier 적용을 수행하고,
+진행 이벤트를 작업별 목록에 쌓는다 (HTTP 스트리밍은 wait_events로 따라 읽는다).
+끝난 작업은 MAX_FINISHED개·FINISHED_TTL_S초까지만 보관하고, 작업별 이벤트는 최근 MAX_EVENTS개만 남긴다.
+"""
+
+import itertools
+import os
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple
+
+from src.api import MelonCrawler, ProviderSet
+from src.services import AlbumApplier, ApplyOptions, TrackMatcher, validate_template
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+FINISHED = (DONE, FAILED, CANCELLED)
+
+# 처리량 게이지 계산 구간 (초)
+THROUGHPUT_WINDOW_S = 60.0
+
+# 끝난 작업 보관: 최대 개수 / 보관 시간 (초). 넘으면 오래된 것부터 목록에서 뺀다
+MAX_FINISHED = 200
+FINISHED_TTL_S = 3600.0
+
+# 작업별로 남기는 최근 이벤트 수 (큰 디렉토리는 파일마다 이벤트가 쌓인다)
+MAX_EVENTS = 1000
+
+
+class JobError(ValueError):
+    """잘못된 작업 요청 (HTTP 400)"""
+
+
+def _track_ref(value) -> Tuple[Optional[int], int]:
+    """요청의 트랙 지정 → (디스크 또는 None, 트랙번호)"""
+    if isinstance(value, str) and "-" in value:
+        value = value.split("-", 1)
+    if isinstance(value, (list, tuple)):
+        if len(value) != 2:
+            raise ValueError(value)
+        return int(value[0]), int(value[1])
+    return None, int(value)
+
+
+class QueueFull(Exception):
+    """대기열이 가득 참 (HTTP 503)"""
+
+
+@dataclass
+class Job:
+    id: str
+    album_url: str
+    directory: str = ""
+    files: Dict[str, Tuple[Optional[int], int]] = field(default_factory=dict)   # 경로 → (디스크, 트랙) 명시 매핑
+    options: Dict[str, object] = field(default_factory=dict)
+    state: str = QUEUED
+    created: float = field(default_factory=time.time)
+    started: float = 0.0
+    finished: float = 0.0
+    total: int = 0
+    done: int = 0
+    applied: int = 0
+    unmatched: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    renamed: Dict[str, str] = field(default_factory=dict)
+    events: List[dict] = field(default_factory=list)
+    events_dropped: int = 0         # MAX_EVENTS를 넘어 앞에서 버린 이벤트 수 (since 계산용)
+
+    @classmethod
+    def from_request(cls, job_id: str, body: dict) -> "Job":
+        album_url = str(body.get("album_url") or "").strip()
+        directory = str(body.get("directory") or "").strip()
+        files = body.get("files") or {}
+        if not album_url:
+            raise JobError("album_url is required")
+        if bool(directory) == bool(files):
+            raise JobError("give exactly one of directory or files")
+        if directory and not os.path.isdir(directory):
+            raise JobError(f"not a directory: {directory}")
+        if not isinstance(files, dict):
+            raise JobError("files must map path -> track number")
+        try:
+            files = {str(path): _track_ref(ref) for path, ref in files.items()}
+        except (TypeError, ValueError):
+            raise JobError('tracks must be integers, "disc-track" or [disc, track]') from None
+        options = body.get("options") or {}
+        if not isinstance(options, dict):
+            raise JobError("options must be an object")
+        template = options.get("rename_template")
+        if template:
+            if not isinstance(template, str):
+                raise JobError("rename_template must be a string")
+            try:
+                validate_template(template)
+            except ValueError as exc:
+                raise JobError(str(exc)) from None
+        return cls(job_id, album_url, directory, files, options)
+
+    def to_dict(self, events: bool = False) -> dict:
+        """JSON으로 내보낼 사본 (JobQueue의 잠금 안에서 부른다)"""
+        out = {
+            "id": self.id,
+            "album_url": self.album_url,
+            "directory": self.directory,
+            "state": self.state,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+            "total": self.total,
+            "done": self.done,
+            "applied": self.applied,
+            "unmatched": list(self.unmatched),
+            "errors": list(self.errors),
+            "renamed": dict(self.renamed),
+        }
+        if events:
+            out["events"] = list(self.events)
+            out["events_dropped"] = self.events_dropped
+        return out
+
+
+class JobQueue:
+    def __init__(self, workers: int = 2, max_queued: int = 100, providers: Optional[ProviderSet] = None):
+        """providers: 앨범·가사 출처 (생략 시 멜론만)"""
+        self._queue: "queue.Queue[Optional[Job]]" = queue.Queue(maxsize=max_queued)
+        self._cond = threading.Condition()
+        self._jobs: Dict[str, Job] = {}
+        self._ids = itertools.count(1)
+        self._providers = providers or ProviderSet([MelonCrawler()])
+        self._applied_times: Deque[float] = deque()
+        self.files_applied = 0
+        self._running = 0
+        self._stopping = False
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"job-worker-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for t in self._threads:
+            t.start()
+
+    # ── 제출/조회 ────────────────────────────
+    def submit(self, body: dict) -> Job:
+        with self._cond:
+            job = Job.from_request(f"j{next(self._ids)}", body)
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                raise QueueFull("job queue is full") from None
+            self._jobs[job.id] = job
+            self._emit(job, "queued")
+            self._prune()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._cond:
+            return self._jobs.get(job_id)
+
+    def describe(self, job_id: str, events: bool = False) -> Optional[dict]:
+        """작업 상태 (to_dict). 워커가 고치는 중인 목록을 읽지 않도록 잠근 채로 만든다"""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            return None if job is None else job.to_dict(events)
+
+    def list(self) -> List[dict]:
+        with self._cond:
+            return [job.to_dict() for job in self._jobs.values()]
+
+    def cancel(self, job_id: str) -> bool:
+        """대기 중인 작업만 취소할 수 있다 (실행 중인 작업은 파일 단위로 끝까지 간다)"""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None or job.state != QUEUED:
+                return False
+            job.state = CANCELLED
+            job.finished = time.time()
+            self._emit(job, "cancelled")
+            self._prune()
+            return True
+
+    def wait_events(self, job: Job, since: int, timeout: float = 15.0) -> Tuple[int, List[dict]]:
+        """
+        (다음 since, since 이후 이벤트). 없으면 새 이벤트·종료·timeout까지 기다린다.
+        since가 이미 버린 이벤트를 가리키면 남아 있는 가장 오래된 이벤트부터 돌려준다.
+        """
+        with self._cond:
+            if job.events_dropped + len(job.events) <= since and job.state not in FINISHED:
+                self._cond.wait(timeout)
+            start = max(0, since - job.events_dropped)
+            return job.events_dropped + len(job.events), job.events[start:]
+
+    def shutdown(self):
+        """워커를 멈춘다 (실행 중인 작업은 끝까지 간다). 대기열이 가득 차 있어도 막히지 않는다"""
+        with self._cond:
+            self._stopping = True
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:
+                break               # 워커가 다음 작업을 꺼낼 때 _stopping을 본다
+
+    # ── 지표 ─────────────────────────────────
+    def metrics(self) -> dict:
+        now = time.monotonic()
+        with self._cond:
+            while self._applied_times and now - self._applied_times[0] > THROUGHPUT_WINDOW_S:
+                self._applied_times.popleft()
+            states: Dict[str, int] = {}
+            for job in self._jobs.values():
+                states[job.state] = states.get(job.state, 0) + 1
+            return {
+                "queue_depth": self._queue.qsize(),
+                "running": self._running,
+                "jobs": states,
+                "files_applied_total": self.files_applied,
+                "files_per_second": len(self._applied_times) / THROUGHPUT_WINDOW_S,
+                "providers": self._providers.stats(),
+            }
+
+    def prometheus_text(self, prefix: str = "mp3tagger") -> str:
+        m = self.metrics()
+        lines = [
+            f"# HELP {prefix}_job_queue_depth Jobs waiting for a worker.",
+            f"# TYPE {prefix}_job_queue_depth gauge",
+            f"{prefix}_job_queue_depth {m['queue_depth']}",
+            f"# HELP {prefix}_jobs_running Jobs currently being applied.",
+            f"# TYPE {prefix}_jobs_running gauge",
+            f"{prefix}_jobs_running {m['running']}",
+            f"# HELP {prefix}_jobs Jobs by state.",
+            f"# TYPE {prefix}_jobs gauge",
+        ]
+        for state in (QUEUED, RUNNING, DONE, FAILED, CANCELLED):
+            lines.append(f'{prefix}_jobs{{state="{state}"}} {m["jobs"].get(state, 0)}')
+        lines += [
+            f"# HELP {prefix}_files_applied_total Files tagged successfully.",
+            f"# TYPE {prefix}_files_applied_total counter",
+            f"{prefix}_files_applied_total {m['files_applied_total']}",
+            f"# HELP {prefix}_files_per_second Tagged files per second over the last minute.",
+            f"# TYPE {prefix}_files_per_second gauge",
+            f"{prefix}_files_per_second {m['files_per_second']:.3f}",
+            f"# HELP {prefix}_provider_requests_total Metadata provider lookups by outcome.",
+            f"# TYPE {prefix}_provider_requests_total counter",
+        ]
+        for name, counts in m["providers"].items():
+            for outcome, n in counts.items():
+                lines.append(f'{prefix}_provider_requests_total{{provider="{name}",outcome="{outcome}"}} {n}')
+        return "\n".join(lines) + "\n"
+
+    # ── 실행 ─────────────────────────────────
+    def _emit(self, job: Job, event: str, **data):
+        """self._cond 를 잡은 상태에서 호출"""
+        job.events.append({"event": event, "t": time.time(), **data})
+        if len(job.events) > MAX_EVENTS:
+            drop = len(job.events) - MAX_EVENTS
+            del job.events[:drop]
+            job.events_dropped += drop
+        self._cond.notify_all()
+
+    def _prune(self):
+        """self._cond 를 잡은 상태에서 호출. 오래됐거나 개수를 넘은 끝난 작업을 뺀다 (오래된 것부터)"""
+        now = time.time()
+        finished = [job for job in self._jobs.values() if job.state in FINISHED]
+        excess = len(finished) - MAX_FINISHED
+        for i, job in enumerate(sorted(finished, key=lambda j: j.finished)):
+            if i >= excess and now - job.finished < FINISHED_TTL_S:
+                break
+            del self._jobs[job.id]
+
+    def _worker(self):
+        while True:
+            job = self._queue.get()
+            if job is None or self._stopping:
+                return
+            with self._cond:
+                if job.state != QUEUED:
+                    continue
+                job.state = RUNNING
+                job.started = time.time()
+                self._running += 1
+                self._emit(job, "started")
+            try:
+                self._run(job)
+                state = DONE
+            except Exception as exc:
+                state = FAILED
+                with self._cond:
+                    job.errors.append(str(exc))
+            with self._cond:
+                self._running -= 1
+                job.state = state
+                job.finished = time.time()
+                self._emit(job, state, applied=job.applied, errors=len(job.errors))
+                self._prune()
+
+    def _run(self, job: Job):
+        album = self._providers.crawl_album(job.album_url)
+        with self._cond:
+            self._emit(job, "crawled", album=album.album_name, tracks=len(album.tracks))
+
+        items, unmatched = self._match(job, album.tracks)
+        opts = job.options
+        options = ApplyOptions(
+            backup=bool(opts.get("backup", True)),
+            cover_data=album.cover_data if opts.get("include_cover", True) else None,
+            rename_template=opts.get("rename_template") or None,
+            write_lrc=bool(opts.get("write_lrc", False)),
+            embed_lyrics=bool(opts.get("embed_lyrics", False)),
+        )
+        if options.write_lrc or options.embed_lyrics:
+            options.lyrics_fetcher = self._providers.fetch_track_lyrics
+        with self._cond:
+            job.total = len(items)
+            job.unmatched = unmatched
+            self._emit(job, "matched", total=len(items), unmatched=len(unmatched))
+
+        def on_progress(done, total, path, track, error):
+            with self._cond:
+                job.done = done
+                if error is None:
+                    job.applied += 1
+                    self.files_applied += 1
+                    self._applied_times.append(time.monotonic())
+                else:
+                    job.errors.append(error)
+                self._emit(job, "file", done=done, total=total, path=path,
+                           track=track.track_number, disc=track.disc_number, error=error)
+
+        result = AlbumApplier().apply(items, options, on_progress)
+        with self._cond:
+            job.renamed = result.renamed
+            job.errors.extend(e for e in result.errors if e not in job.errors)
+
+    def _match(self, job: Job, tracks) -> Tuple[list, List[str]]:
+        """(매칭된 (경로, 트랙) 목록, 매칭 못 한 경로). job은 읽기만 한다 (갱신은 self._cond 안에서)"""
+        matcher = TrackMatcher(tracks)
+        items, unmatched = [], []
+        if job.files:
+            for path, (disc, num) in job.files.items():
+                track = matcher.lookup(num, disc)
+                if track is None or not os.path.isfile(path):
+                    unmatched.append(path)
+                else:
+                    items.append((path, track))
+            return items, unmatched
+
+        # 바로 아래 디스크 폴더(CD1, CD2 …)의 파일도 한 번에 함께 매칭한다
+        root = Path(job.directory)
+        paths = sorted(
+            p for p in itertools.chain(root.glob("*"), root.glob("*/*"))
+            if p.suffix.lower() == ".mp3" and p.is_file()
+        )
+        for p in paths:
+            track = matcher.match(str(p))
+            if track is None:
+                unmatched.append(str(p))
+            else:
+                items.append((str(p), track))
+        return items, unmatched
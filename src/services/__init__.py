@@ -1,5 +1,43 @@
 # services package: 파일·I/O 등 애플리케이션 서비스
 
 from .mp3_handler import MP3Handler
+from .track_matcher import TrackMatcher, normalize_title
+from .album_applier import AlbumApplier, ApplyOptions, ApplyResult
+from .rename_planner import RenamePlanner, RenamePlan, DEFAULT_TEMPLATE, safe_filename, validate_template
+from .lyrics_store import LocalLyricsStore
+from .io_scheduler import IOScheduler, io_scheduler
+from .apply_journal import ApplyJournal, JournalJob
+from .session_store import SessionStore, SessionSnapshot, FileEntry
+from .library_index import LibraryIndex
+from .library_refresh import LibraryRefresher, RefreshResult
+from .thumbnail_cache import ThumbnailCache
+from .telemetry import Telemetry, telemetry, span
 
-__all__ = ["MP3Handler"]
+__all__ = [
+    "MP3Handler",
+    "TrackMatcher",
+    "normalize_title",
+    "AlbumApplier",
+    "ApplyOptions",
+    "ApplyResult",
+    "RenamePlanner",
+    "RenamePlan",
+    "DEFAULT_TEMPLATE",
+    "safe_filename",
+    "validate_template",
+    "LocalLyricsStore",
+    "IOScheduler",
+    "io_scheduler",
+    "ApplyJournal",
+    "JournalJob",
+    "SessionStore",
+    "SessionSnapshot",
+    "FileEntry",
+    "LibraryIndex",
+    "LibraryRefresher",
+    "RefreshResult",
+    "ThumbnailCache",
+    "Telemetry",
+    "telemetry",
+    "span",
+]
@@ -0,0 +1,267 @@
+"""
+매칭된 MP3 파일들에 앨범 메타데이터 일괄 적용 (서비스 레이어)
+"""
+
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.models import TrackInfo
+from src.services.apply_journal import (
+    ApplyJournal, BACKED_UP, COMPLETED, FAILED, PENDING, RENAMED, RENAMING, WRITTEN,
+)
+from src.services.io_scheduler import IOScheduler, io_scheduler
+from src.services.mp3_handler import MP3Handler
+from src.services.rename_planner import RenamePlanner, temp_path, validate_template
+from src.services.telemetry import span
+
+# on_progress(done, total, path, track, error) — error는 실패 시 메시지, 성공 시 None
+ProgressCallback = Callable[[int, int, str, TrackInfo, Optional[str]], None]
+
+SyncedLyrics = List[Tuple[str, int]]
+# (트랙, 파일 재생 시간 초 또는 None) → (일반 가사, 싱크 가사). 예: MelonCrawler.fetch_track_lyrics
+LyricsFetcher = Callable[[TrackInfo, Optional[float]], Tuple[str, SyncedLyrics]]
+
+
+@dataclass
+class ApplyOptions:
+    backup: bool = True
+    cover_data: Optional[bytes] = None
+    rename_template: Optional[str] = None     # 지정 시 태그 기록 후 일괄 파일명 변경
+    lyrics_fetcher: Optional[LyricsFetcher] = None
+    embed_lyrics: bool = False                # USLT + SYLT 프레임 (태그 저장 1회에 포함)
+    write_lrc: bool = False                   # .lrc 사이드카 (rename 시 함께 이동)
+    lyrics_workers: int = 8
+
+    def journal_fields(self) -> Dict[str, object]:
+        """저널에 남길 옵션 (커버는 따로, 가사 함수는 재개 시 다시 지정)"""
+        return {
+            "backup": self.backup,
+            "rename_template": self.rename_template,
+            "embed_lyrics": self.embed_lyrics,
+            "write_lrc": self.write_lrc,
+            "lyrics_workers": self.lyrics_workers,
+        }
+
+
+@dataclass
+class ApplyResult:
+    applied: int = 0
+    errors: List[str] = field(default_factory=list)
+    renamed: Dict[str, str] = field(default_factory=dict)    # 원래 경로 → 새 경로
+    job_id: Optional[int] = None                              # 저널 작업 id
+
+
+class AlbumApplier:
+    """
+    (파일 경로, 트랙) 목록에 태그를 기록한다. UI 스레드와 무관하게 동작.
+    journal이 있으면 파일별 진행 상태를 기록하고, resume_job으로 중단된 작업을 이어서 한다.
+    기록은 IOScheduler가 장치별 동시성 제한 안에서 병렬로 수행하고,
+    on_progress·저널 상태 갱신은 호출 스레드에서 끝난 순서대로 일어난다.
+    """
+
+    def __init__(
+        self,
+        handler: Optional[MP3Handler] = None,
+        journal: Optional[ApplyJournal] = None,
+        scheduler: Optional[IOScheduler] = None,
+    ):
+        self._handler = handler or MP3Handler()
+        self._journal = journal
+        self._scheduler = scheduler or io_scheduler
+
+    def apply(
+        self,
+        items: List[Tuple[str, TrackInfo]],
+        options: ApplyOptions,
+        on_progress: Optional[ProgressCallback] = None,
+        resume_job: Optional[int] = None,
+    ) -> ApplyResult:
+        """
+        resume_job: 저널의 작업 id. items는 journal.load(id).items 그대로 넘긴다.
+        파일명 템플릿이 잘못됐으면 아무것도 기록하지 않고 ValueError
+        """
+        result = ApplyResult()
+        total = len(items)
+        written = []
+        journal = self._journal
+        if options.rename_template:
+            try:
+                validate_template(options.rename_template)
+            except ValueError:
+                if journal is not None and resume_job is not None:
+                    # 다시 이어서 해도 같은 오류 → 중단된 작업 목록에서 뺀다
+                    journal.finish(resume_job)
+                raise
+        states: Dict[int, Tuple[str, Optional[str]]] = {}
+        if journal is not None:
+            if resume_job is None:
+                result.job_id = journal.begin(items, options.journal_fields(), options.cover_data)
+            else:
+                result.job_id = resume_job
+                job = journal.load(resume_job)
+                states = job.states if job else {}
+
+        done = 0
+        todo = []
+        # rename 대상의 현재 경로 → seq (이전 실행에서 임시 이름에 남은 파일은 그 경로)
+        seq_by_path: Dict[str, int] = {path: seq for seq, (path, _) in enumerate(items)}
+        for seq, (path, track) in enumerate(items):
+            state, new_path = states.get(seq, (PENDING, None))
+            if state not in COMPLETED:
+                todo.append(seq)
+                continue
+            # 이전 실행에서 태그까지 끝난 파일
+            done += 1
+            result.applied += 1
+            located, current = _locate(path, state, new_path)
+            if located == RENAMED and new_path:
+                result.renamed[path] = new_path
+                if journal is not None and state != RENAMED:
+                    journal.mark(result.job_id, seq, RENAMED, new_path=new_path)
+            else:
+                written.append((current, track))
+                seq_by_path[current] = seq
+            if on_progress:
+                on_progress(done, total, path, track, None)
+
+        lyrics = self._prefetch_lyrics([items[seq] for seq in todo], options)
+
+        def write(seq: int):
+            path, track = items[seq]
+            self._apply_one(
+                path, track, options, lyrics.get(_lyrics_key(track)),
+                skip_backup=states.get(seq, (PENDING,))[0] == BACKED_UP,
+                on_backup=(lambda: journal.mark(result.job_id, seq, BACKED_UP)) if journal else None,
+            )
+
+        for index, _, exc in self._scheduler.run(todo, lambda seq: items[seq][0], write):
+            seq = todo[index]
+            path, track = items[seq]
+            done += 1
+            error = None
+            if exc is None:
+                result.applied += 1
+                written.append((path, track))
+            else:
+                error = f"{Path(path).name}: {exc}"
+                result.errors.append(error)
+            if journal is not None:
+                journal.mark(result.job_id, seq, FAILED if error else WRITTEN, error)
+            if on_progress:
+                on_progress(done, total, path, track, error)
+
+        try:
+            if options.rename_template and written:
+                self._rename(items, written, seq_by_path, options.rename_template, result)
+        except Exception as exc:
+            result.errors.append(f"파일명 변경 실패: {exc}")
+        finally:
+            if journal is not None:
+                journal.finish(result.job_id)
+        return result
+
+    def _rename(
+        self,
+        items: List[Tuple[str, TrackInfo]],
+        written: List[Tuple[str, TrackInfo]],
+        seq_by_path: Dict[str, int],
+        template: str,
+        result: ApplyResult,
+    ):
+        journal = self._journal
+        before_move = after_move = None
+        if journal is not None:
+            # rename은 되돌릴 수 없는 단계라 파일마다 옮기기 전 목적지, 옮긴 뒤 완료를 바로 커밋한다
+            def before_move(old: str, new: str):
+                journal.mark_now(result.job_id, seq_by_path[old], RENAMING, new_path=new)
+
+            def after_move(old: str, new: str):
+                journal.mark_now(result.job_id, seq_by_path[old], RENAMED, new_path=new)
+
+        renamed = RenamePlanner(template).plan(written).apply(before_move, after_move)
+        for old, new in renamed.renamed.items():
+            result.renamed[items[seq_by_path[old]][0]] = new
+        result.errors.extend(renamed.errors)
+
+    def _prefetch_lyrics(
+        self, items: List[Tuple[str, TrackInfo]], options: ApplyOptions,
+    ) -> Dict[str, Tuple[str, SyncedLyrics]]:
+        """태그 기록 전에 곡당 한 번씩, 동시에 가사를 가져온다"""
+        if not options.lyrics_fetcher or not (options.embed_lyrics or options.write_lrc):
+            return {}
+        tracks: Dict[str, Tuple[str, TrackInfo]] = {}
+        for path, track in items:
+            tracks.setdefault(_lyrics_key(track), (path, track))
+        if not tracks:
+            return {}
+
+        def fetch(entry: Tuple[str, TrackInfo]) -> Tuple[str, SyncedLyrics]:
+            path, track = entry
+            try:
+                return options.lyrics_fetcher(track, self._handler.duration(path))
+            except Exception:
+                return "", []
+
+        workers = max(1, min(options.lyrics_workers, len(tracks)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lyrics") as pool:
+            return dict(zip(tracks, pool.map(fetch, tracks.values())))
+
+    def _apply_one(
+        self,
+        path: str,
+        track: TrackInfo,
+        options: ApplyOptions,
+        lyrics: Optional[Tuple[str, SyncedLyrics]] = None,
+        skip_backup: bool = False,
+        on_backup: Optional[Callable[[], None]] = None,
+    ):
+        plain, synced = lyrics or ("", [])
+        if options.backup and not skip_backup:
+            backup_path = Path(path).with_suffix(".mp3.bak")
+            if not backup_path.exists():
+                with span("backup", file=Path(path).name, album=track.album) as sp:
+                    shutil.copy2(path, backup_path)
+                    sp.bytes = backup_path.stat().st_size
+            if on_backup:
+                on_backup()
+        self._handler.write_metadata(
+            filepath=path,
+            title=track.title,
+            artist=track.artist,
+            album=track.album,
+            album_artist=track.album_artist,
+            genre=track.genre,
+            track_number=track.track_number,
+            disc_number=track.disc_number,
+            song_id=track.song_id,
+            album_id=track.album_id,
+            cover_data=options.cover_data,
+            lyrics=plain if options.embed_lyrics else "",
+            synced_lyrics=synced if options.embed_lyrics else None,
+        )
+        if options.write_lrc and synced:
+            self._handler.write_lrc_file(path, synced)
+
+
+def _locate(path: str, state: str, new_path: Optional[str]) -> Tuple[str, str]:
+    """
+    이전 실행에서 태그까지 끝난 파일의 (상태, 현재 경로).
+    renaming인데 원래 경로가 없고 new_path에 있으면 옮기기는 끝났으므로 renamed로 본다.
+    순환을 풀다 멈췄으면 파일은 임시 이름에 있다 → 그 경로에서 다시 rename한다.
+    """
+    if state == RENAMED or os.path.lexists(path):
+        return state, path
+    if state == RENAMING and new_path and os.path.lexists(new_path):
+        return RENAMED, new_path
+    tmp = str(temp_path(Path(path)))
+    if os.path.lexists(tmp):
+        return WRITTEN, tmp
+    return WRITTEN, path
+
+
+def _lyrics_key(track: TrackInfo) -> str:
+    return track.song_id or f"{track.artist}\0{track.title}"
@@ -0,0 +1,23 @@
+"""
+애플리케이션 데이터 경로 (캐시·DB·세션 파일 위치)
+"""
+
+import os
+from pathlib import Path
+
+APP_DIR_NAME = "melon-mp3-tagger"
+
+
+def app_data_dir() -> Path:
+    """
+    MP3TAGGER_DATA_DIR 환경 변수가 있으면 그 경로,
+    없으면 $XDG_DATA_HOME/melon-mp3-tagger (기본 ~/.local/share/...).
+    """
+    override = os.environ.get("MP3TAGGER_DATA_DIR")
+    if override:
+        path = Path(override)
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or str(Path.home() / ".local" / "share")
+        path = Path(base) / APP_DIR_NAME
+    path.mkdir(parents=True, exist_ok=True)
+    return path
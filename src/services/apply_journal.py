@@ -0,0 +1,202 @@
+"""
+적용 작업 저널 (SQLite WAL) — 중단된 일괄 적용 이어서 하기
+
+작업 하나 = (파일 경로, 트랙) 목록 + 적용 옵션 + 커버. 파일마다 상태를 기록한다.
+    pending → backed-up → written → renaming → renamed   (실패 시 failed)
+앱이 중간에 죽으면 다음 실행에서 written 이후의 파일은 태그를 다시 쓰지 않고 나머지만 다시 한다.
+rename은 파일마다 옮기기 전에 목적지(renaming + new_path)를, 옮긴 뒤에 renamed를 바로 커밋한다.
+재개 시 renaming인 파일은 원래 경로가 없고 new_path에 있으면 이미 옮긴 것으로 본다.
+
+상태 기록은 메모리에 모았다가 BATCH_SIZE개 또는 FLUSH_INTERVAL_S마다 한 트랜잭션으로
+커밋한다. WAL + synchronous=NORMAL 이라 커밋마다 fsync하지 않는다 (체크포인트 때만).
+앱이 죽어도 커밋된 상태는 남고, 전원이 나가면 마지막 몇 건이 빠질 수 있지만
+태그 기록·백업은 다시 해도 결과가 같으므로 그 파일들은 한 번 더 처리될 뿐이다.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import astuple, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.models import TrackInfo
+from src.services.app_paths import app_data_dir
+
+DEFAULT_DB_NAME = "journal.sqlite3"
+
+PENDING, BACKED_UP, WRITTEN, RENAMED, FAILED = "pending", "backed-up", "written", "renamed", "failed"
+RENAMING = "renaming"
+# 태그를 다시 쓸 필요가 없는 상태
+COMPLETED = (WRITTEN, RENAMING, RENAMED)
+
+BATCH_SIZE = 64
+FLUSH_INTERVAL_S = 1.0
+# 끝난 작업은 최근 것만 남긴다
+KEEP_FINISHED = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id          INTEGER PRIMARY KEY,
+    created     REAL NOT NULL,
+    label       TEXT NOT NULL DEFAULT '',
+    options     TEXT NOT NULL,
+    cover       BLOB,
+    finished    REAL
+);
+CREATE TABLE IF NOT EXISTS files (
+    job_id      INTEGER NOT NULL,
+    seq         INTEGER NOT NULL,
+    path        TEXT NOT NULL,
+    track       TEXT NOT NULL,
+    state       TEXT NOT NULL DEFAULT 'pending',
+    new_path    TEXT,
+    error       TEXT,
+    PRIMARY KEY (job_id, seq)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass
+class JournalJob:
+    id: int
+    created: float
+    label: str
+    options: Dict[str, object]                  # ApplyOptions 필드 (커버·가사 함수 제외)
+    cover: Optional[bytes]
+    items: List[Tuple[str, TrackInfo]] = field(default_factory=list)
+    states: Dict[int, Tuple[str, Optional[str]]] = field(default_factory=dict)   # seq → (상태, 새 경로)
+
+    @property
+    def remaining(self) -> int:
+        return sum(1 for state, _ in self.states.values() if state not in COMPLETED)
+
+
+class ApplyJournal:
+    """스레드 간 공유 가능한 단일 커넥션 저널"""
+
+    def __init__(self, db_path: Optional[Path] = None, batch_size: int = BATCH_SIZE,
+                 flush_interval: float = FLUSH_INTERVAL_S):
+        self.db_path = Path(db_path) if db_path else app_data_dir() / DEFAULT_DB_NAME
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending: List[tuple] = []
+        self._last_flush = time.monotonic()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+    # ── 기록 ─────────────────────────────────
+    def begin(
+        self,
+        items: List[Tuple[str, TrackInfo]],
+        options: Dict[str, object],
+        cover: Optional[bytes] = None,
+        label: str = "",
+    ) -> int:
+        """새 작업을 등록하고 id를 반환 (모든 파일 pending, 즉시 커밋)"""
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "INSERT INTO jobs (created, label, options, cover) VALUES (?, ?, ?, ?)",
+                (time.time(), label, json.dumps(options, ensure_ascii=False), cover),
+            )
+            job_id = cur.lastrowid
+            self._conn.executemany(
+                "INSERT INTO files (job_id, seq, path, track) VALUES (?, ?, ?, ?)",
+                [(job_id, seq, path, json.dumps(astuple(track), ensure_ascii=False))
+                 for seq, (path, track) in enumerate(items)],
+            )
+            self._prune_locked()
+        return job_id
+
+    def mark(self, job_id: int, seq: int, state: str,
+             error: Optional[str] = None, new_path: Optional[str] = None):
+        """파일 상태 변경. 모아 두었다가 배치로 커밋한다"""
+        with self._lock:
+            self._pending.append((state, error, new_path, job_id, seq))
+            if (len(self._pending) >= self.batch_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def mark_now(self, job_id: int, seq: int, state: str, new_path: Optional[str] = None):
+        """쌓인 상태와 함께 바로 커밋 (되돌릴 수 없는 단계 직전·직후)"""
+        with self._lock:
+            self._pending.append((state, None, new_path, job_id, seq))
+            self._flush_locked()
+
+    def finish(self, job_id: int):
+        with self._lock:
+            self._flush_locked()
+            with self._conn:
+                self._conn.execute("UPDATE jobs SET finished = ? WHERE id = ?", (time.time(), job_id))
+
+    def discard(self, job_id: int):
+        """이어서 하지 않을 작업 삭제"""
+        with self._lock:
+            self._flush_locked()
+            with self._conn:
+                self._conn.execute("DELETE FROM files WHERE job_id = ?", (job_id,))
+                self._conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+    def _flush_locked(self):
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE files SET state = ?, error = ?, new_path = COALESCE(?, new_path) "
+                "WHERE job_id = ? AND seq = ?",
+                batch,
+            )
+
+    def _prune_locked(self):
+        self._conn.execute(
+            "DELETE FROM files WHERE job_id IN (SELECT id FROM jobs WHERE finished IS NOT NULL "
+            "ORDER BY id DESC LIMIT -1 OFFSET ?)", (KEEP_FINISHED,),
+        )
+        self._conn.execute(
+            "DELETE FROM jobs WHERE id IN (SELECT id FROM jobs WHERE finished IS NOT NULL "
+            "ORDER BY id DESC LIMIT -1 OFFSET ?)", (KEEP_FINISHED,),
+        )
+
+    # ── 조회 ─────────────────────────────────
+    def interrupted(self) -> List[JournalJob]:
+        """끝나지 않은 작업 (최근 것부터)"""
+        with self._lock:
+            self._flush_locked()
+            ids = [row[0] for row in self._conn.execute(
+                "SELECT id FROM jobs WHERE finished IS NULL ORDER BY id DESC"
+            )]
+        jobs = [self.load(job_id) for job_id in ids]
+        return [job for job in jobs if job is not None]
+
+    def load(self, job_id: int) -> Optional[JournalJob]:
+        with self._lock:
+            self._flush_locked()
+            row = self._conn.execute(
+                "SELECT id, created, label, options, cover FROM jobs WHERE id = ?", (job_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            files = self._conn.execute(
+                "SELECT seq, path, track, state, new_path FROM files WHERE job_id = ? ORDER BY seq",
+                (job_id,),
+            ).fetchall()
+        job = JournalJob(row[0], row[1], row[2], json.loads(row[3]), row[4])
+        for seq, path, track, state, new_path in files:
+            job.items.append((path, TrackInfo(*json.loads(track))))
+            job.states[seq] = (state, new_path)
+        return job
@@ -0,0 +1,197 @@
+"""
+장치 인식 I/O 스케줄러 (태그 일괄 기록용)
+
+파일을 st_dev(파일시스템 장치)별로 묶고, 장치마다 동시 기록 스레드 수를 따로 제한한다.
+- SSD: 병렬 기록이 이득이라 여러 개
+- HDD: 헤드 이동 때문에 동시 기록이 오히려 느려져 1개
+- NAS/네트워크 공유: 왕복 지연을 조금 가리는 정도로 2개
+장치 안에서는 inode → 경로 순으로 정렬해 디스크상 배치에 가깝게 순차 접근한다.
+여러 디스크에 걸친 배치는 장치별 작업이 동시에 진행되므로 각 장치가 제 속도를 낸다.
+
+장치 종류는 Linux에서 /proc/self/mountinfo (파일시스템 종류)와
+/sys/dev/block/<maj:min>/queue/rotational 로 판별하고, 알 수 없으면 "unknown" 이다.
+"""
+
+import os
+import queue
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+SSD, HDD, NETWORK, UNKNOWN = "ssd", "hdd", "network", "unknown"
+
+DEFAULT_WRITERS: Dict[str, int] = {
+    SSD: min(8, os.cpu_count() or 4),
+    HDD: 1,
+    NETWORK: 2,
+    UNKNOWN: 2,
+}
+
+_NETWORK_FS = {"nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "afs", "ceph", "glusterfs",
+               "fuse.sshfs", "fuse.rclone", "davfs", "fuse.davfs2"}
+
+
+@dataclass
+class DeviceQueue:
+    dev: int
+    kind: str
+    writers: int
+    order: List[int] = field(default_factory=list)     # 원래 목록의 인덱스 (기록 순서)
+
+
+def _mount_types() -> Dict[str, str]:
+    """"maj:min" → 파일시스템 종류 (Linux 전용, 그 외에는 빈 dict)"""
+    types = {}
+    try:
+        with open("/proc/self/mountinfo", encoding="utf-8") as f:
+            for line in f:
+                left, _, right = line.partition(" - ")
+                parts = left.split()
+                if len(parts) >= 3 and right:
+                    types[parts[2]] = right.split()[0]
+    except OSError:
+        pass
+    return types
+
+
+def _rotational(dev: int) -> Optional[bool]:
+    """블록 장치의 회전 디스크 여부. 파티션이면 상위 디스크의 queue를 본다"""
+    try:
+        base = Path(f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}").resolve()
+    except OSError:
+        return None
+    for candidate in (base, base.parent):
+        try:
+            return (candidate / "queue" / "rotational").read_text().strip() == "1"
+        except OSError:
+            continue
+    return None
+
+
+class IOScheduler:
+    def __init__(self, writers: Optional[Dict[str, int]] = None):
+        self.writers = {**DEFAULT_WRITERS, **(writers or {})}
+        self._lock = threading.Lock()
+        self._kinds: Dict[int, str] = {}
+        self._overrides: Dict[int, int] = {}
+        self._mounts: Optional[Dict[str, str]] = None
+
+    # ── 장치 판별 ─────────────────────────────
+    def device_kind(self, dev: int) -> str:
+        with self._lock:
+            kind = self._kinds.get(dev)
+            if kind is None:
+                kind = self._kinds[dev] = self._probe(dev)
+            return kind
+
+    def _probe(self, dev: int) -> str:
+        if self._mounts is None:
+            self._mounts = _mount_types()
+        fstype = self._mounts.get(f"{os.major(dev)}:{os.minor(dev)}", "")
+        if fstype in _NETWORK_FS:
+            return NETWORK
+        rotational = _rotational(dev)
+        if rotational is None:
+            return UNKNOWN
+        return HDD if rotational else SSD
+
+    def writers_for(self, dev: int) -> int:
+        with self._lock:
+            override = self._overrides.get(dev)
+        if override is not None:
+            return override
+        return max(1, self.writers.get(self.device_kind(dev), 1))
+
+    def set_writers(self, dev: int, writers: int):
+        """특정 장치의 동시 기록 수 직접 지정 (측정으로 찾은 값 등)"""
+        with self._lock:
+            self._overrides[dev] = max(1, writers)
+
+    # ── 계획/실행 ─────────────────────────────
+    def plan(self, paths: Sequence[str]) -> List[DeviceQueue]:
+        """장치별 묶음과 장치 안 기록 순서. stat 실패한 파일은 별도 묶음(dev=-1)으로 뒤에 둔다"""
+        groups: Dict[int, List[Tuple[int, str, int]]] = {}
+        for index, path in enumerate(paths):
+            try:
+                st = os.stat(path)
+                dev, ino = st.st_dev, st.st_ino
+            except OSError:
+                dev, ino = -1, 0
+            groups.setdefault(dev, []).append((ino, path, index))
+
+        queues = []
+        for dev, entries in groups.items():
+            entries.sort()
+            if dev == -1:
+                kind, writers = UNKNOWN, 1
+            else:
+                kind, writers = self.device_kind(dev), self.writers_for(dev)
+            queues.append(DeviceQueue(dev, kind, min(writers, len(entries)),
+                                      [index for _, _, index in entries]))
+        return queues
+
+    def run(
+        self,
+        items: Sequence[T],
+        path_of: Callable[[T], str],
+        fn: Callable[[T], object],
+    ) -> Iterator[Tuple[int, object, Optional[Exception]]]:
+        """
+        fn(item)을 장치별 제한 안에서 실행하고 (인덱스, 결과, 예외)를 끝나는 순서대로 낸다.
+        소비 측이 중간에 멈추면(예외·close) 아직 시작하지 않은 항목은 실행하지 않는다.
+        """
+        if not items:
+            return
+        queues = self.plan([path_of(item) for item in items])
+        if len(queues) == 1 and queues[0].writers == 1:
+            # 장치 하나에 기록자 하나면 스레드 없이 정렬 순서대로
+            for index in queues[0].order:
+                yield self._call(index, items[index], fn)
+            return
+
+        results: "queue.Queue[Tuple[int, object, Optional[Exception]]]" = queue.Queue()
+        stop = threading.Event()
+        for dq in queues:
+            pending = iter(dq.order)
+            lock = threading.Lock()
+
+            def work(pending=pending, lock=lock):
+                while not stop.is_set():
+                    with lock:
+                        index = next(pending, None)
+                    if index is None:
+                        return
+                    results.put(self._call(index, items[index], fn))
+
+            for n in range(dq.writers):
+                threading.Thread(target=work, name=f"io-{dq.kind}-{n}", daemon=True).start()
+        try:
+            for _ in range(len(items)):
+                yield results.get()
+        finally:
+            stop.set()
+
+    @staticmethod
+    def _call(index: int, item, fn) -> Tuple[int, object, Optional[Exception]]:
+        try:
+            return index, fn(item), None
+        except Exception as exc:
+            return index, None, exc
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            kinds, overrides = dict(self._kinds), dict(self._overrides)
+        return {
+            f"{os.major(dev)}:{os.minor(dev)}": {
+                "kind": kind,
+                "writers": overrides.get(dev, self.writers.get(kind, 1)),
+            }
+            for dev, kind in kinds.items()
+        }
+
+
+# 프로세스 전역 (장치 판별 결과를 배치 간에 재사용)
+io_scheduler = IOScheduler()
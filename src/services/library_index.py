@@ -0,0 +1,372 @@
+"""
+라이브러리 색인 (SQLite) — 태그에 기록된 멜론 ID로 파일·앨범 재식별
+
+write_metadata가 남긴 TXXX:MELON_SONG_ID / MELON_ALBUM_ID를 파일별로 색인하고,
+크롤링한 앨범을 albumId 기준으로 보관한다. 이미 태깅한 폴더를 다시 처리할 때
+albumId로 앨범을 바로 꺼내고 songId로 트랙을 찾으므로 크롤링·파일명 매칭이 필요 없다.
+
+파일마다 오디오 구간 해시(MP3Handler.audio_hash)도 보관해 이름만 다른 같은 음원을 찾는다.
+태그 기록은 오디오를 바꾸지 않으므로 기록 후에도 해시는 그대로 둔다.
+
+Usage:
+    python3 -m src.services.library_index scan ~/Music
+    python3 -m src.services.library_index album 10000001
+    python3 -m src.services.library_index dupes ~/Music
+"""
+
+import argparse
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.models import AlbumInfo, dumps_album, loads_album
+from src.services.app_paths import app_data_dir
+from src.services.mp3_handler import MP3Handler
+from src.services.session_store import FileEntry
+
+DEFAULT_DB_NAME = "library.sqlite3"
+# 태그 읽기 + 해시 동시 작업 수 (해시는 GIL 밖에서 돌아 코어 수만큼 이득)
+SCAN_WORKERS = min(8, os.cpu_count() or 4)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path        TEXT PRIMARY KEY,
+    size        INTEGER NOT NULL,
+    mtime_ns    INTEGER NOT NULL,
+    song_id     TEXT NOT NULL DEFAULT '',
+    album_id    TEXT NOT NULL DEFAULT '',
+    audio_hash  TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_files_song ON files (song_id) WHERE song_id != '';
+CREATE INDEX IF NOT EXISTS idx_files_album ON files (album_id) WHERE album_id != '';
+CREATE TABLE IF NOT EXISTS albums (
+    album_id     TEXT PRIMARY KEY,
+    fetched      REAL NOT NULL,
+    data         BLOB NOT NULL,
+    album_name   TEXT NOT NULL DEFAULT '',
+    album_artist TEXT NOT NULL DEFAULT '',
+    cover_ref    TEXT NOT NULL DEFAULT ''
+);
+"""
+# 이전 버전이 만든 색인에 없는 열 (인덱스는 열을 추가한 뒤 만든다)
+_MIGRATIONS = (
+    ("files", "audio_hash", "ALTER TABLE files ADD COLUMN audio_hash TEXT NOT NULL DEFAULT ''"),
+    ("albums", "album_name", "ALTER TABLE albums ADD COLUMN album_name TEXT NOT NULL DEFAULT ''"),
+    ("albums", "album_artist", "ALTER TABLE albums ADD COLUMN album_artist TEXT NOT NULL DEFAULT ''"),
+    ("albums", "cover_ref", "ALTER TABLE albums ADD COLUMN cover_ref TEXT NOT NULL DEFAULT ''"),
+)
+_POST_SCHEMA = "CREATE INDEX IF NOT EXISTS idx_files_hash ON files (audio_hash) WHERE audio_hash != ''"
+_FILE_COLS = "path, size, mtime_ns, song_id, album_id, audio_hash"
+
+
+@dataclass
+class LibraryFile:
+    path: str
+    size: int
+    mtime_ns: int
+    song_id: str = ""
+    album_id: str = ""
+    audio_hash: str = ""
+
+
+@dataclass
+class AlbumSummary:
+    """갤러리용 앨범 요약 (트랙·커버 바이트 없이)"""
+    album_id: str
+    album_name: str
+    album_artist: str
+    cover_ref: str
+    fetched: float
+    files: int = 0           # 색인에서 이 albumId로 태깅된 파일 수
+
+
+@dataclass
+class ScanResult:
+    scanned: int = 0
+    read: int = 0            # 태그를 실제로 읽은 파일 (새 파일·변경된 파일)
+    removed: int = 0
+    hashed: int = 0          # 오디오 해시를 계산한 파일
+
+
+class LibraryIndex:
+    """스레드별 커넥션을 쓰는 색인"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else app_data_dir() / DEFAULT_DB_NAME
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+            added = set()
+            for table, column, ddl in _MIGRATIONS:
+                if column not in {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}:
+                    conn.execute(ddl)
+                    added.add(table)
+            conn.execute(_POST_SCHEMA)
+            if "albums" in added:
+                self._backfill_albums(conn)
+
+    @staticmethod
+    def _backfill_albums(conn: sqlite3.Connection):
+        """요약 열이 생기기 전에 보관한 앨범: 한 번 디코딩해 채운다"""
+        rows = []
+        for album_id, data in conn.execute("SELECT album_id, data FROM albums").fetchall():
+            try:
+                album = loads_album(data)
+            except ValueError:
+                continue
+            rows.append((album.album_name, album.album_artist, album.cover_ref or "", album_id))
+        conn.executemany(
+            "UPDATE albums SET album_name = ?, album_artist = ?, cover_ref = ? WHERE album_id = ?", rows,
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # ── 파일 ─────────────────────────────────
+    def record(self, entries: Iterable[FileEntry]):
+        """
+        이미 태그를 읽은 파일들 (MP3FilePanel 항목 등) 색인.
+        크기·mtime이 색인과 다르면 오디오 해시를 비워 다음 scan에서 다시 계산한다
+        """
+        rows = [
+            (e.path, e.size, e.mtime_ns,
+             e.meta.get("melon_song_id", ""), e.meta.get("melon_album_id", ""))
+            for e in entries
+        ]
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT INTO files (path, size, mtime_ns, song_id, album_id) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (path) DO UPDATE SET "
+                "audio_hash = CASE WHEN size = excluded.size AND mtime_ns = excluded.mtime_ns "
+                "THEN audio_hash ELSE '' END, "
+                "size = excluded.size, mtime_ns = excluded.mtime_ns, "
+                "song_id = excluded.song_id, album_id = excluded.album_id",
+                rows,
+            )
+
+    def record_written(self, written: Iterable[Tuple[str, str, str, str]]):
+        """
+        태그를 기록한 직후. written: (원래 경로, 현재 경로, songId, albumId)
+        rename 된 파일은 원래 경로 행을 지운다. 사라진 파일은 건너뛴다.
+        태그 기록은 오디오를 바꾸지 않으므로 원래 경로의 오디오 해시를 이어받는다
+        """
+        rows, gone = [], []
+        for old_path, path, song_id, album_id in written:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if old_path != path:
+                gone.append((old_path,))
+            rows.append((path, st.st_size, st.st_mtime_ns, song_id, album_id, old_path))
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, "
+                "COALESCE((SELECT audio_hash FROM files WHERE path = ?), ''))",
+                rows,
+            )
+            conn.executemany("DELETE FROM files WHERE path = ?", gone)
+
+    def scan(self, root: Path, handler: Optional[MP3Handler] = None,
+             workers: int = SCAN_WORKERS) -> ScanResult:
+        """
+        root 아래 MP3를 색인한다. 크기·mtime이 색인과 같은 파일은 태그를 다시 읽지 않고,
+        root 아래에서 사라진 파일은 색인에서 뺀다. 새 파일·변경된 파일·해시가 없는 파일은
+        스레드 풀에서 태그를 읽고 오디오 해시를 계산한다.
+        """
+        handler = handler or MP3Handler()
+        root = Path(root)
+        conn = self._connect()
+        known = {f.path: f for f in self.files_under(root)}
+        result = ScanResult()
+        todo: List[Tuple[str, os.stat_result, Optional[LibraryFile]]] = []
+        seen = set()
+        for dirpath, _, names in os.walk(root):
+            for name in names:
+                if not name.lower().endswith(".mp3"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                seen.add(path)
+                result.scanned += 1
+                f = known.get(path)
+                if f and (f.size, f.mtime_ns) != (st.st_size, st.st_mtime_ns):
+                    f = None
+                if f and f.audio_hash:
+                    continue
+                todo.append((path, st, f))       # f: 태그는 그대로이고 해시만 없던 파일
+
+        def read(item: Tuple[str, os.stat_result, Optional[LibraryFile]]) -> tuple:
+            path, st, f = item
+            if f:
+                song_id, album_id = f.song_id, f.album_id
+            else:
+                meta = handler.read_metadata(path)
+                song_id, album_id = meta.get("melon_song_id", ""), meta.get("melon_album_id", "")
+            try:
+                digest = handler.audio_hash(path)
+            except (OSError, ValueError):
+                digest = ""
+            return path, st.st_size, st.st_mtime_ns, song_id, album_id, digest
+
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="scan") as pool:
+            rows = list(pool.map(read, todo))
+        result.read = sum(1 for _, _, f in todo if f is None)
+        result.hashed = sum(1 for row in rows if row[5])
+        gone = [(path,) for path in known if path not in seen]
+        result.removed = len(gone)
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)", rows)
+            conn.executemany("DELETE FROM files WHERE path = ?", gone)
+        return result
+
+    def files_under(self, root: Path) -> List[LibraryFile]:
+        prefix = str(root).rstrip(os.sep) + os.sep
+        rows = self._connect().execute(
+            f"SELECT {_FILE_COLS} FROM files WHERE substr(path, 1, ?) = ? ORDER BY path",
+            (len(prefix), prefix),
+        ).fetchall()
+        return [LibraryFile(*row) for row in rows]
+
+    def files_for_album(self, album_id: str) -> List[LibraryFile]:
+        rows = self._connect().execute(
+            f"SELECT {_FILE_COLS} FROM files WHERE album_id = ? ORDER BY path",
+            (album_id,),
+        ).fetchall()
+        return [LibraryFile(*row) for row in rows]
+
+    # ── 중복 ─────────────────────────────────
+    def duplicates(self, root: Optional[Path] = None) -> List[List[LibraryFile]]:
+        """
+        오디오 해시가 같은 파일 묶음 (2개 이상). root를 주면 그 아래 파일이 하나라도 있는 묶음만.
+        묶음 안에서는 멜론 ID가 있는 파일이 먼저 온다
+        """
+        rows = self._connect().execute(
+            f"SELECT {_FILE_COLS} FROM files WHERE audio_hash IN ("
+            "SELECT audio_hash FROM files WHERE audio_hash != '' "
+            "GROUP BY audio_hash HAVING COUNT(*) > 1) "
+            "ORDER BY audio_hash, song_id = '', path"
+        ).fetchall()
+        groups: Dict[str, List[LibraryFile]] = {}
+        for row in rows:
+            f = LibraryFile(*row)
+            groups.setdefault(f.audio_hash, []).append(f)
+        out = list(groups.values())
+        if root is not None:
+            prefix = str(root).rstrip(os.sep) + os.sep
+            out = [g for g in out if any(f.path.startswith(prefix) for f in g)]
+        return out
+
+    def tagged_twin(self, path: str) -> Optional[LibraryFile]:
+        """오디오가 같고 멜론 ID로 태깅된 다른 파일 (없으면 None)"""
+        row = self._connect().execute(
+            f"SELECT {_FILE_COLS} FROM files WHERE audio_hash != '' AND song_id != '' AND path != ? "
+            "AND audio_hash = (SELECT audio_hash FROM files WHERE path = ?) ORDER BY path LIMIT 1",
+            (path, path),
+        ).fetchone()
+        return LibraryFile(*row) if row else None
+
+    def paths_for_song(self, song_id: str) -> List[str]:
+        return [row[0] for row in self._connect().execute(
+            "SELECT path FROM files WHERE song_id = ? ORDER BY path", (song_id,),
+        )]
+
+    def album_ids(self) -> List[str]:
+        return [row[0] for row in self._connect().execute(
+            "SELECT DISTINCT album_id FROM files WHERE album_id != '' ORDER BY album_id"
+        )]
+
+    # ── 앨범 캐시 ─────────────────────────────
+    def put_album(self, album: AlbumInfo):
+        """크롤링한 앨범 보관 (커버 포함). albumId가 없는 앨범은 무시"""
+        if not album.album_id:
+            return
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO albums VALUES (?, ?, ?, ?, ?, ?)",
+                (album.album_id, time.time(), dumps_album(album, include_cover=True),
+                 album.album_name, album.album_artist, album.cover_ref or ""),
+            )
+
+    def get_album(self, album_id: str, max_age: Optional[float] = None) -> Optional[AlbumInfo]:
+        """보관한 앨범. 없거나 max_age(초)보다 오래됐거나 다른 Python 버전으로 기록됐으면 None"""
+        row = self._connect().execute(
+            "SELECT fetched, data FROM albums WHERE album_id = ?", (album_id,),
+        ).fetchone()
+        if row is None or (max_age is not None and time.time() - row[0] > max_age):
+            return None
+        try:
+            return loads_album(row[1])
+        except ValueError:
+            return None
+
+    def album_summaries(self) -> List[AlbumSummary]:
+        """보관한 앨범 전체 (아티스트·앨범명 순). 앨범 데이터는 디코딩하지 않는다"""
+        rows = self._connect().execute(
+            "SELECT a.album_id, a.album_name, a.album_artist, a.cover_ref, a.fetched, COALESCE(c.n, 0) "
+            "FROM albums a LEFT JOIN (SELECT album_id, COUNT(*) AS n FROM files "
+            "WHERE album_id != '' GROUP BY album_id) c USING (album_id) "
+            "ORDER BY a.album_artist COLLATE NOCASE, a.album_name COLLATE NOCASE"
+        ).fetchall()
+        return [AlbumSummary(*row) for row in rows]
+
+    def album_cover(self, album_id: str) -> Optional[bytes]:
+        """보관한 앨범의 커버 바이트 (없으면 None)"""
+        album = self.get_album(album_id)
+        return album.cover_data if album is not None else None
+
+    def album_fetched(self, album_id: str) -> Optional[float]:
+        row = self._connect().execute(
+            "SELECT fetched FROM albums WHERE album_id = ?", (album_id,),
+        ).fetchone()
+        return row[0] if row else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Melon ID library index")
+    parser.add_argument("--db", type=Path, help="색인 경로 (기본: 앱 데이터 디렉토리)")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_scan = sub.add_parser("scan", help="폴더 색인")
+    p_scan.add_argument("root", type=Path)
+    p_album = sub.add_parser("album", help="albumId로 파일 조회")
+    p_album.add_argument("album_id")
+    p_dupes = sub.add_parser("dupes", help="오디오가 같은 파일 묶음 (색인 후)")
+    p_dupes.add_argument("root", type=Path)
+    args = parser.parse_args(argv)
+
+    index = LibraryIndex(args.db)
+    if args.cmd == "scan":
+        r = index.scan(args.root)
+        print(f"{r.scanned} files ({r.read} read, {r.hashed} hashed, {r.removed} removed) in {index.db_path}")
+    elif args.cmd == "dupes":
+        index.scan(args.root)
+        groups = index.duplicates(args.root)
+        for group in groups:
+            print(group[0].audio_hash)
+            for f in group:
+                print(f"  {f.song_id or '-':>10}  {f.path}")
+        print(f"{len(groups)} duplicate groups, {sum(len(g) - 1 for g in groups)} extra copies")
+    else:
+        for f in index.files_for_album(args.album_id):
+            print(f"{f.song_id or '-':>10}  {f.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+라이브러리 메타데이터 새로 고침 (멜론 ID 기반 백그라운드 작업)
+
+1. 라이브러리를 색인한다 (stat이 바뀐 파일만 태그를 다시 읽음)
+   멜론 ID가 없는 파일은 오디오가 같은 태깅된 파일(twin)이 있으면 그 태그를 그대로 복사한다
+2. 파일을 태그의 albumId로 묶는다. ID가 없는 파일은 같은 폴더의 다른 파일 ID를 따른다
+3. 앨범마다 한 번만, 동시에 다시 가져와 앨범 캐시와 비교한다 (캐시는 커버 재사용·변경 여부 확인용).
+   max_age를 주면 그보다 최근에 가져온 앨범은 네트워크 없이 캐시를 쓴다
+4. 파일의 현재 태그와 비교해 실제로 달라진 파일만 다시 기록한다
+"""
+
+import os
+import shutil
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.models import AlbumInfo, TrackInfo
+from src.services.album_applier import AlbumApplier, ApplyOptions
+from src.services.library_index import LibraryIndex
+from src.services.mp3_handler import MP3Handler
+from src.services.track_matcher import TrackMatcher
+
+ALBUM_URL = "https://www.melon.com/album/detail.htm?albumId={}"
+
+# 비교하는 태그 (read_metadata 키 → TrackInfo 값)
+_FIELDS: Tuple[Tuple[str, Callable[[TrackInfo], str]], ...] = (
+    ("title", lambda t: t.title),
+    ("artist", lambda t: t.artist),
+    ("album", lambda t: t.album),
+    ("album_artist", lambda t: t.album_artist),
+    ("genre", lambda t: t.genre),
+    ("track_number", lambda t: str(t.track_number)),
+    ("disc_number", lambda t: str(t.disc_number)),
+    ("melon_song_id", lambda t: t.song_id),
+    ("melon_album_id", lambda t: t.album_id),
+)
+
+
+@dataclass
+class AlbumRefresh:
+    album_id: str
+    album_name: str = ""
+    files: int = 0
+    updated: int = 0
+    unmatched: int = 0
+    cached: bool = False          # 네트워크 없이 캐시 사용 (max_age)
+    unchanged: bool = False       # 다시 가져왔지만 캐시와 같음
+    error: str = ""
+
+
+@dataclass
+class RefreshProgress:
+    albums_done: int
+    albums_total: int
+    files_checked: int
+    files_updated: int
+    album: Optional[AlbumRefresh] = None     # 방금 끝난 앨범
+
+
+@dataclass
+class RefreshResult:
+    albums: List[AlbumRefresh] = field(default_factory=list)
+    files: int = 0
+    updated: int = 0
+    unidentified: int = 0        # 앨범 ID를 알 수 없는 파일
+    adopted: int = 0             # 오디오가 같은 파일에서 태그를 복사한 파일
+    errors: List[str] = field(default_factory=list)
+    cancelled: bool = False
+
+
+def changed_fields(meta: Dict[str, str], track: TrackInfo) -> List[str]:
+    """현재 태그(read_metadata)와 트랙 정보가 다른 필드 이름"""
+    out = []
+    for key, value in _FIELDS:
+        current = meta.get(key, "")
+        if key in ("track_number", "disc_number"):
+            current = current.split("/")[0].strip()
+        if key == "disc_number" and not current:
+            current = "1"           # TPOS가 없는 한 장짜리 앨범 파일은 다시 기록하지 않는다
+        if value(track) and current != value(track):
+            out.append(key)
+    return out
+
+
+def _same_metadata(a: AlbumInfo, b: AlbumInfo) -> bool:
+    """커버 바이트를 뺀 앨범 정보가 같은지"""
+    fields = ("album_name", "album_artist", "genre", "release_date", "cover_url")
+    return all(getattr(a, f) == getattr(b, f) for f in fields) and a.tracks == b.tracks
+
+
+class LibraryRefresher:
+    def __init__(
+        self,
+        index: LibraryIndex,
+        crawler,
+        handler: Optional[MP3Handler] = None,
+        workers: int = 4,
+        max_age: float = 0.0,
+        backup: bool = True,
+    ):
+        """
+        crawler: MelonCrawler (요청 제한·병합은 크롤러가 처리)
+        max_age: 이보다 최근에 가져온 앨범 캐시는 다시 크롤링하지 않는다 (초, 기본 0 = 항상 다시 확인).
+                 다중 파일 탭에서 방금 크롤링한 앨범도 캐시에 있으므로, 멜론 쪽 수정을 바로 반영하려면 0으로 둔다
+        backup: 태그를 다시 쓰기 전에 .mp3.bak 백업 (ApplyOptions와 같은 기본값)
+        """
+        self.index = index
+        self.crawler = crawler
+        self.handler = handler or MP3Handler()
+        self.workers = workers
+        self.max_age = max_age
+        self.backup = backup
+
+    def run(
+        self,
+        root: Path,
+        on_progress: Optional[Callable[[RefreshProgress], None]] = None,
+        cancel: Optional[threading.Event] = None,
+        confirm: Optional[Callable[[int, int], bool]] = None,
+    ) -> RefreshResult:
+        """
+        on_progress는 워커 스레드에서 호출된다.
+        confirm(파일 수, 앨범 수): 색인 후 첫 기록 전에 부른다 (워커 스레드). False면 아무것도 쓰지 않고 취소
+        """
+        result = RefreshResult()
+        self.index.scan(root, self.handler)
+        if confirm is not None:
+            groups, _ = self._group(root)
+            if not confirm(sum(len(paths) for paths in groups.values()), len(groups)):
+                result.cancelled = True
+                return result
+        result.adopted = self._adopt_twins(root, result, cancel)
+        groups, result.unidentified = self._group(root)
+        total = len(groups)
+        lock = threading.Lock()
+        checked = updated = done = 0
+
+        with ThreadPoolExecutor(max_workers=max(1, self.workers), thread_name_prefix="refresh") as pool:
+            futures = {
+                pool.submit(self._refresh_album, album_id, paths, cancel): album_id
+                for album_id, paths in groups.items()
+            }
+            for future in as_completed(futures):
+                item = future.result()
+                with lock:
+                    done += 1
+                    checked += item.files
+                    updated += item.updated
+                    result.albums.append(item)
+                    if item.error:
+                        result.errors.append(f"{item.album_name or item.album_id}: {item.error}")
+                if on_progress:
+                    on_progress(RefreshProgress(done, total, checked, updated, item))
+
+        result.files, result.updated = checked, updated
+        result.cancelled = bool(cancel and cancel.is_set())
+        return result
+
+    def _adopt_twins(self, root: Path, result: RefreshResult,
+                     cancel: Optional[threading.Event]) -> int:
+        """ID가 없는 파일에 같은 음원의 태깅된 파일 태그를 복사 (크롤링 없음). 반환: 복사한 파일 수"""
+        written = []
+        for f in self.index.files_under(root):
+            if cancel is not None and cancel.is_set():
+                break
+            if f.song_id or not f.audio_hash:
+                continue
+            twin = self.index.tagged_twin(f.path)
+            if twin is None or not os.path.isfile(twin.path):
+                continue
+            try:
+                if self.backup:
+                    backup_path = Path(f.path).with_suffix(".mp3.bak")
+                    if not backup_path.exists():
+                        shutil.copy2(f.path, backup_path)
+                self.handler.copy_tags(twin.path, f.path)
+            except Exception as exc:
+                result.errors.append(f"{os.path.basename(f.path)}: {exc}")
+                continue
+            written.append((f.path, f.path, twin.song_id, twin.album_id))
+        self.index.record_written(written)
+        return len(written)
+
+    def _group(self, root: Path) -> Tuple[Dict[str, List[str]], int]:
+        """albumId → 경로 목록. 반환: (묶음, 식별 못 한 파일 수)"""
+        by_dir: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        for f in self.index.files_under(root):
+            by_dir[os.path.dirname(f.path)].append((f.path, f.album_id))
+
+        groups: Dict[str, List[str]] = defaultdict(list)
+        unidentified = 0
+        for files in by_dir.values():
+            ids = Counter(album_id for _, album_id in files if album_id)
+            inferred = ids.most_common(1)[0][0] if ids else ""
+            for path, album_id in files:
+                if album_id or inferred:
+                    groups[album_id or inferred].append(path)
+                else:
+                    unidentified += 1
+        return groups, unidentified
+
+    def _album(self, album_id: str, item: AlbumRefresh) -> AlbumInfo:
+        fetched = self.index.album_fetched(album_id)
+        cached = self.index.get_album(album_id)
+        if cached is not None and fetched is not None and time.time() - fetched < self.max_age:
+            item.cached = True
+            return cached
+        album = self.crawler.crawl_album(ALBUM_URL.format(album_id), with_cover=False)
+        item.unchanged = cached is not None and _same_metadata(album, cached)
+        if cached is not None and cached.cover_ref and album.cover_url == cached.cover_url:
+            # 커버는 다시 받지 않았으므로 캐시의 것을 이어서 보관
+            self.index.put_album(replace(album, cover_ref=cached.cover_ref))
+        else:
+            self.index.put_album(album)
+        return album
+
+    def _refresh_album(
+        self, album_id: str, paths: List[str], cancel: Optional[threading.Event],
+    ) -> AlbumRefresh:
+        item = AlbumRefresh(album_id)
+        if cancel is not None and cancel.is_set():
+            item.error = "취소됨"
+            return item
+        try:
+            album = self._album(album_id, item)
+        except Exception as exc:
+            item.error = str(exc)
+            return item
+        item.album_name = album.album_name
+
+        matcher = TrackMatcher(album.tracks)
+        stale = []
+        for path in paths:
+            meta = self.handler.read_metadata(path)
+            item.files += 1
+            track = matcher.match(path, meta)
+            if track is None:
+                item.unmatched += 1
+            elif changed_fields(meta, track):
+                stale.append((path, track))
+
+        if stale and not (cancel is not None and cancel.is_set()):
+            applied = AlbumApplier(self.handler).apply(stale, ApplyOptions(backup=self.backup))
+            item.updated = applied.applied
+            if applied.errors:
+                item.error = "; ".join(applied.errors[:3])
+            self.index.record_written(
+                (path, path, track.song_id, track.album_id) for path, track in stale
+            )
+        return item
@@ -0,0 +1,217 @@
+"""
+lrclib 덤프 기반 로컬 싱크 가사 저장소 (SQLite + FTS5)
+
+lrclib.net이 배포하는 SQLite 덤프(tracks / lyrics 테이블)를 가져와
+정규화한 제목·아티스트·앨범·재생 시간으로 색인한다.
+MelonCrawler.fetch_synced_lyrics가 네트워크보다 먼저 조회한다.
+
+Usage:
+    python3 -m src.services.lyrics_store import lrclib-db-dump.sqlite3
+    python3 -m src.services.lyrics_store lookup "밤편지" "아이유"
+"""
+
+import argparse
+import re
+import sqlite3
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Optional
+
+from src.services.app_paths import app_data_dir
+
+DEFAULT_DB_NAME = "lyrics.sqlite3"
+
+_BRACKETS = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_NON_WORD = re.compile(r"[\W_]+")
+_ARTIST_SPLIT = re.compile(r",|&| feat\.? | ft\.? | x ", re.IGNORECASE)
+
+# 재생 시간 비교 허용 오차 (초)
+DURATION_TOLERANCE = 3.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lyrics (
+    id          INTEGER PRIMARY KEY,
+    title_key   TEXT NOT NULL,
+    artist_key  TEXT NOT NULL,
+    album_key   TEXT NOT NULL DEFAULT '',
+    duration    REAL,
+    synced      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_lyrics_key ON lyrics (title_key, artist_key);
+CREATE TABLE IF NOT EXISTS lyrics_src (
+    id      INTEGER PRIMARY KEY,
+    title   TEXT NOT NULL,
+    artist  TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS lyrics_fts USING fts5 (
+    title, artist, content='lyrics_src', content_rowid='id'
+);
+"""
+
+
+def normalize_key(text: str) -> str:
+    """NFKC → 소문자 → 괄호 내용 제거 → 문자·숫자 이외 제거"""
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    text = _BRACKETS.sub("", text)
+    return _NON_WORD.sub("", text)
+
+
+def normalize_artist(text: str) -> str:
+    """여러 아티스트 중 첫 번째만 키로 사용 ("아이유, SUGA" → "아이유")"""
+    first = _ARTIST_SPLIT.split(text or "", maxsplit=1)[0]
+    return normalize_key(first)
+
+
+class LocalLyricsStore:
+    """스레드별 커넥션을 쓰는 읽기 위주 저장소"""
+
+    _shared: Optional["LocalLyricsStore"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @classmethod
+    def default_path(cls) -> Path:
+        return app_data_dir() / DEFAULT_DB_NAME
+
+    @classmethod
+    def open_default(cls) -> Optional["LocalLyricsStore"]:
+        """기본 위치에 가져온 덤프가 있으면 열고, 없으면 None"""
+        try:
+            path = cls.default_path()
+            if path.is_file() and path.stat().st_size > 0:
+                return cls(path)
+        except (OSError, sqlite3.Error):
+            pass
+        return None
+
+    @classmethod
+    def shared(cls) -> Optional["LocalLyricsStore"]:
+        """
+        프로세스 전역 기본 저장소 (open_default를 한 번만 연다 — 크롤러를 호출마다 만들어도 공유).
+        덤프를 아직 가져오지 않았으면 None (다음 호출 때 다시 확인)
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls.open_default()
+            return cls._shared
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.create_function("norm_key", 1, normalize_key, deterministic=True)
+            conn.create_function("norm_artist", 1, normalize_artist, deterministic=True)
+            self._local.conn = conn
+        return conn
+
+    # ── 가져오기 ──────────────────────────────
+    def import_lrclib_dump(self, dump_path: Path) -> int:
+        """
+        lrclib 덤프에서 싱크 가사가 있는 트랙만 가져온다.
+        기존 데이터는 교체한다. 반환: 가져온 행 수
+        """
+        conn = self._connect()
+        conn.execute("ATTACH DATABASE ? AS dump", (str(dump_path),))
+        try:
+            with conn:
+                conn.execute("DELETE FROM lyrics")
+                conn.execute("DELETE FROM lyrics_src")
+                conn.execute("INSERT INTO lyrics_fts(lyrics_fts) VALUES ('delete-all')")
+                conn.execute("""
+                    INSERT INTO lyrics_src (id, title, artist)
+                    SELECT t.id, t.name, t.artist_name
+                    FROM dump.tracks t JOIN dump.lyrics l ON l.id = t.last_lyrics_id
+                    WHERE l.synced_lyrics IS NOT NULL AND l.synced_lyrics != ''
+                """)
+                conn.execute("""
+                    INSERT INTO lyrics (id, title_key, artist_key, album_key, duration, synced)
+                    SELECT t.id, norm_key(t.name), norm_artist(t.artist_name),
+                           norm_key(COALESCE(t.album_name, '')), t.duration, l.synced_lyrics
+                    FROM dump.tracks t JOIN dump.lyrics l ON l.id = t.last_lyrics_id
+                    WHERE l.synced_lyrics IS NOT NULL AND l.synced_lyrics != ''
+                """)
+                conn.execute("INSERT INTO lyrics_fts(lyrics_fts) VALUES ('rebuild')")
+            count = conn.execute("SELECT COUNT(*) FROM lyrics").fetchone()[0]
+        finally:
+            conn.execute("DETACH DATABASE dump")
+        return count
+
+    # ── 조회 ─────────────────────────────────
+    def lookup(
+        self, title: str, artist: str, album: str = "", duration: Optional[float] = None,
+    ) -> Optional[str]:
+        """싱크 가사(LRC 텍스트)를 반환. 없으면 None"""
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT album_key, duration, synced FROM lyrics WHERE title_key = ? AND artist_key = ?",
+            (normalize_key(title), normalize_artist(artist)),
+        ).fetchall()
+        if not rows:
+            rows = self._fts_candidates(conn, title, artist)
+        if not rows:
+            return None
+        return self._best(rows, normalize_key(album), duration)
+
+    def _fts_candidates(self, conn: sqlite3.Connection, title: str, artist: str) -> list:
+        """정확한 키가 없을 때 제목/아티스트 토큰으로 전문 검색"""
+        def phrase(text: str) -> str:
+            tokens = re.findall(r"\w+", _BRACKETS.sub("", text or ""))
+            return " ".join(f'"{t}"' for t in tokens)
+
+        title_q, artist_q = phrase(title), phrase(_ARTIST_SPLIT.split(artist or "", 1)[0])
+        if not title_q:
+            return []
+        query = f"title : ({title_q})" + (f" AND artist : ({artist_q})" if artist_q else "")
+        try:
+            return conn.execute(
+                "SELECT l.album_key, l.duration, l.synced FROM lyrics_fts f "
+                "JOIN lyrics l ON l.id = f.rowid WHERE lyrics_fts MATCH ? LIMIT 20",
+                (query,),
+            ).fetchall()
+        except sqlite3.OperationalError:
+            return []
+
+    @staticmethod
+    def _best(rows: list, album_key: str, duration: Optional[float]) -> Optional[str]:
+        """앨범 일치 → 길이 차 순. 양쪽 길이를 다 아는데 허용 오차를 넘는 행은 다른 곡으로 보고 버린다"""
+        def gap(row) -> float:
+            row_duration = row[1]
+            return abs(row_duration - duration) if duration and row_duration else 0.0
+
+        rows = [row for row in rows if gap(row) <= DURATION_TOLERANCE]
+        if not rows:
+            return None
+        return min(rows, key=lambda row: (0 if album_key and row[0] == album_key else 1, gap(row)))[2]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local lrclib lyrics store")
+    parser.add_argument("--db", type=Path, help="저장소 경로 (기본: 앱 데이터 디렉토리)")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_import = sub.add_parser("import", help="lrclib SQLite 덤프 가져오기")
+    p_import.add_argument("dump", type=Path)
+    p_lookup = sub.add_parser("lookup", help="제목/아티스트로 조회")
+    p_lookup.add_argument("title")
+    p_lookup.add_argument("artist")
+    p_lookup.add_argument("--album", default="")
+    p_lookup.add_argument("--duration", type=float)
+    args = parser.parse_args(argv)
+
+    store = LocalLyricsStore(args.db or LocalLyricsStore.default_path())
+    if args.cmd == "import":
+        count = store.import_lrclib_dump(args.dump)
+        print(f"{count} synced lyrics imported into {store.db_path}")
+    else:
+        lrc = store.lookup(args.title, args.artist, args.album, args.duration)
+        print(lrc if lrc else "(not found)")
+
+
+if __name__ == "__main__":
+    main()
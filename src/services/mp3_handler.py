@@ -1,7 +1,19 @@
 """
 mutagen 기반 MP3 메타데이터 읽기/쓰기 (서비스 레이어)
+
+태그는 메모리(BytesIO)에 먼저 렌더링한다.
+- 기존 태그 영역(패딩 포함)에 들어가면 그 자리에 한 번에 덮어쓴다 (오디오는 그대로)
+- 넘치면 (새 APIC·가사 등) mutagen이 제자리에서 오디오를 밀고 패딩을 붙여 저장한다.
+  (임시 파일로 교체하는 방식은 10~100MB 파일 모두에서 더 느려 쓰지 않는다. benchmarks write_grow_10mb)
+
+audio_hash는 태그(ID3v2·ID3v1·APEv2)를 뺀 MPEG 오디오 구간만 해시한다.
+태그만 다른 같은 음원(파일명만 바꿔 여러 번 받은 곡 등)은 같은 값이 나온다.
 """
 
+import hashlib
+import mmap
+import os
+from io import BytesIO
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -17,10 +29,85 @@ from mutagen.id3 import (
     TRCK,
     APIC,
     USLT,
+    SYLT,
     TPOS,
+    TXXX,
 )
 
+from src.services.telemetry import span
+
+# 멜론 식별자 (다시 처리할 때 크롤링·파일명 매칭 없이 바로 찾는다)
+MELON_SONG_ID = "MELON_SONG_ID"
+MELON_ALBUM_ID = "MELON_ALBUM_ID"
+
+_ID3V1_SIZE = 128
+_APE_FOOTER_SIZE = 32
+# 태그 뒤 0 패딩 등을 건너뛰고 첫 MPEG 프레임 동기 신호를 찾는 범위
+_SYNC_SEARCH = 64 * 1024
+
+
+def _synchsafe(data: bytes) -> int:
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+def _to_synchsafe(n: int) -> bytes:
+    return bytes(((n >> 21) & 0x7F, (n >> 14) & 0x7F, (n >> 7) & 0x7F, n & 0x7F))
+
+
+def _id3v2_size(header: bytes) -> int:
+    """ID3v2 헤더(10바이트)로 본 태그 전체 크기 (헤더·패딩·푸터 포함). 태그가 아니면 0"""
+    if len(header) < 10 or header[:3] != b"ID3":
+        return 0
+    size = 10 + _synchsafe(header[6:10])
+    if header[3] == 4 and header[5] & 0x10:
+        size += 10
+    return size
+
+
+def _tag_region(fd: int) -> int:
+    """파일 앞 ID3v2 태그의 전체 크기. 없으면 0"""
+    return _id3v2_size(os.pread(fd, 10, 0))
+
+
+def _audio_bounds(buf) -> Tuple[int, int]:
+    """buf(mmap 등)에서 ID3v2·ID3v1·APEv2 태그를 뺀 오디오 구간 [start, end)"""
+    start, end = 0, len(buf)
+    # 태그를 덧붙여 저장하는 프로그램이 있어 ID3v2가 여러 개 연달아 있을 수 있다
+    while True:
+        size = _id3v2_size(buf[start:start + 10])
+        if not size:
+            break
+        start += size
+    pos = buf.find(b"\xff", start, min(end, start + _SYNC_SEARCH))
+    while 0 <= pos < end - 1:
+        if buf[pos + 1] & 0xE0 == 0xE0:
+            start = pos
+            break
+        pos = buf.find(b"\xff", pos + 1, min(end, start + _SYNC_SEARCH))
+
+    if end - start >= _ID3V1_SIZE and buf[end - _ID3V1_SIZE:end - _ID3V1_SIZE + 3] == b"TAG":
+        end -= _ID3V1_SIZE
+    if end - start >= _APE_FOOTER_SIZE and buf[end - 32:end - 24] == b"APETAGEX":
+        # 푸터: 버전(4) · 태그 크기(4, 푸터 포함·헤더 제외) · 항목 수(4) · 플래그(4)
+        size = int.from_bytes(buf[end - 20:end - 16], "little")
+        flags = int.from_bytes(buf[end - 12:end - 8], "little")
+        end -= size + (_APE_FOOTER_SIZE if flags & 0x80000000 else 0)
+    return start, max(start, end)
+
+
+def _has_id3v1(fd: int, file_size: int) -> bool:
+    return file_size >= _ID3V1_SIZE and os.pread(fd, 3, file_size - _ID3V1_SIZE) == b"TAG"
+
+
 class MP3Handler:
+    @staticmethod
+    def duration(filepath: str) -> Optional[float]:
+        """재생 시간 (초). 읽을 수 없으면 None (가사 후보를 길이로 고를 때 쓴다)"""
+        try:
+            return MP3(filepath).info.length or None
+        except Exception:
+            return None
+
     def read_metadata(self, filepath: str) -> dict:
         """현재 MP3 파일의 메타데이터를 딕셔너리로 반환"""
         result = {
@@ -30,18 +117,29 @@ class MP3Handler:
             "album_artist": "",
             "genre": "",
             "track_number": "",
+            "disc_number": "",
+            "melon_song_id": "",
+            "melon_album_id": "",
         }
         try:
-            tags = ID3(filepath)
+            with span("tag_read", file=os.path.basename(filepath)) as sp:
+                try:
+                    tags = ID3(filepath)
+                except ID3NoHeaderError:
+                    sp.outcome = "miss"
+                    return result
+                sp.bytes = tags.size
             result["title"] = str(tags.get("TIT2", ""))
             result["artist"] = str(tags.get("TPE1", ""))
             result["album"] = str(tags.get("TALB", ""))
             result["album_artist"] = str(tags.get("TPE2", ""))
             result["genre"] = str(tags.get("TCON", ""))
             result["track_number"] = str(tags.get("TRCK", ""))
-        except ID3NoHeaderError:
-            pass
+            result["disc_number"] = str(tags.get("TPOS", ""))
+            result["melon_song_id"] = str(tags.get(f"TXXX:{MELON_SONG_ID}", ""))
+            result["melon_album_id"] = str(tags.get(f"TXXX:{MELON_ALBUM_ID}", ""))
         except Exception:
+            # 실패 내역은 tag_read 스팬(outcome=error)에 남는다
             pass
         return result
 
@@ -57,43 +155,116 @@ class MP3Handler:
         cover_data: Optional[bytes] = None,
         lyrics: str = "",
         disc_number: int = 0,
+        synced_lyrics: Optional[List[Tuple[str, int]]] = None,
+        song_id: str = "",
+        album_id: str = "",
     ) -> None:
-        """MP3 파일에 메타데이터를 기록"""
-        try:
-            tags = ID3(filepath)
-        except ID3NoHeaderError:
-            audio = MP3(filepath)
-            audio.add_tags()
-            tags = audio.tags
-
-        if title:
-            tags["TIT2"] = TIT2(encoding=3, text=title)
-        if artist:
-            tags["TPE1"] = TPE1(encoding=3, text=artist)
-        if album:
-            tags["TALB"] = TALB(encoding=3, text=album)
-        if album_artist:
-            tags["TPE2"] = TPE2(encoding=3, text=album_artist)
-        if genre:
-            tags["TCON"] = TCON(encoding=3, text=genre)
-        if track_number:
-            tags["TRCK"] = TRCK(encoding=3, text=str(track_number))
-        if disc_number:
-            tags["TPOS"] = TPOS(encoding=3, text=str(disc_number))
-
-        if cover_data:
-            tags["APIC"] = APIC(
-                encoding=3,
-                mime="image/jpeg",
-                type=3,
-                desc="Cover",
-                data=cover_data,
-            )
-
-        if lyrics:
-            tags["USLT::kor"] = USLT(encoding=3, lang="kor", desc="", text=lyrics)
+        """
+        MP3 파일에 메타데이터를 기록 (싱크 가사는 SYLT 프레임으로 같은 저장에 포함).
+        song_id / album_id: 멜론 식별자 → TXXX:MELON_SONG_ID / TXXX:MELON_ALBUM_ID
+        """
+        with span("tag_write", file=os.path.basename(filepath), album=album) as sp:
+            try:
+                tags = ID3(filepath)
+            except ID3NoHeaderError:
+                audio = MP3(filepath)
+                audio.add_tags()
+                tags = audio.tags
+
+            if title:
+                tags["TIT2"] = TIT2(encoding=3, text=title)
+            if artist:
+                tags["TPE1"] = TPE1(encoding=3, text=artist)
+            if album:
+                tags["TALB"] = TALB(encoding=3, text=album)
+            if album_artist:
+                tags["TPE2"] = TPE2(encoding=3, text=album_artist)
+            if genre:
+                tags["TCON"] = TCON(encoding=3, text=genre)
+            if track_number:
+                tags["TRCK"] = TRCK(encoding=3, text=str(track_number))
+            if disc_number:
+                tags["TPOS"] = TPOS(encoding=3, text=str(disc_number))
+
+            if song_id:
+                tags.add(TXXX(encoding=3, desc=MELON_SONG_ID, text=song_id))
+            if album_id:
+                tags.add(TXXX(encoding=3, desc=MELON_ALBUM_ID, text=album_id))
 
+            if cover_data:
+                tags["APIC"] = APIC(
+                    encoding=3,
+                    mime="image/jpeg",
+                    type=3,
+                    desc="Cover",
+                    data=cover_data,
+                )
+
+            if lyrics:
+                tags["USLT::kor"] = USLT(encoding=3, lang="kor", desc="", text=lyrics)
+
+            if synced_lyrics:
+                # format=2: 밀리초 타임스탬프, type=1: 가사
+                tags.setall("SYLT", [SYLT(
+                    encoding=3, lang="kor", format=2, type=1, desc="",
+                    text=list(synced_lyrics),
+                )])
+
+            sp.bytes = self._save_tags(tags, filepath)
+
+    @staticmethod
+    def audio_hash(filepath: str) -> str:
+        """
+        오디오 구간의 BLAKE2b-128 (hex). 파일을 mmap으로 열어 복사 없이 해시하므로
+        해시하는 동안 GIL이 풀려 여러 스레드에서 동시에 불러도 된다. 오디오가 없으면 ""
+        """
+        with span("audio_hash", file=os.path.basename(filepath)) as sp:
+            with open(filepath, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    sp.outcome = "miss"
+                    return ""
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    start, end = _audio_bounds(mm)
+                    if start >= end:
+                        sp.outcome = "miss"
+                        return ""
+                    digest = hashlib.blake2b(digest_size=16)
+                    view = memoryview(mm)
+                    try:
+                        digest.update(view[start:end])
+                    finally:
+                        view.release()
+                    sp.bytes = end - start
+        return digest.hexdigest()
+
+    @staticmethod
+    def copy_tags(src: str, dst: str) -> int:
+        """src의 ID3 태그 전체(커버·가사·멜론 ID 포함)를 dst에 기록. 반환: 기록 후 dst 크기"""
+        with span("tag_write", file=os.path.basename(dst)) as sp:
+            sp.bytes = MP3Handler._save_tags(ID3(src), dst)
+            return sp.bytes
+
+    @staticmethod
+    def _save_tags(tags: ID3, filepath: str) -> int:
+        """태그를 렌더링해 기존 영역에 들어가면 제자리 기록, 넘치면 mutagen 저장. 반환: 기록 후 파일 크기"""
+        buf = BytesIO()
+        tags.save(buf, v2_version=3, padding=lambda info: 0)
+        frames = buf.getbuffer()[10:]
+
+        fd = os.open(filepath, os.O_RDWR)
+        try:
+            st = os.fstat(fd)
+            region = _tag_region(fd)
+            if 0 < region and 10 + len(frames) <= region and not _has_id3v1(fd, st.st_size):
+                # 헤더 + 프레임 + 0 패딩으로 덮어쓴다
+                header = b"ID3\x03\x00\x00" + _to_synchsafe(region - 10)
+                os.pwrite(fd, header + frames + bytes(region - 10 - len(frames)), 0)
+                return st.st_size
+        finally:
+            os.close(fd)
+        # 넘치거나 ID3v1도 함께 갱신해야 함
         tags.save(filepath, v2_version=3)
+        return os.path.getsize(filepath)
 
     def write_lrc_file(
         self,
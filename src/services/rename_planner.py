@@ -0,0 +1,266 @@
+"""
+템플릿 기반 일괄 파일명 변경 계획/적용 (서비스 레이어)
+
+디렉토리마다 os.scandir 한 번으로 스냅샷을 만들고, 이름 충돌과
+순환(a→b, b→a)을 메모리에서 해결한 뒤 한 번에 rename 한다.
+.lrc 등 사이드카 파일은 MP3와 같은 이름으로 함께 옮긴다.
+"""
+
+import errno
+import os
+import re
+import string
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from src.models import TrackInfo
+
+DEFAULT_TEMPLATE = "{artist}-{track:02d}-{title}"
+TEMPLATE_FIELDS = ("artist", "title", "album", "album_artist", "track", "disc")
+SIDECAR_SUFFIXES = (".lrc",)
+
+_UNSAFE = re.compile(r'[\\/:*?"<>|]')
+
+# before_move / after_move(원래 경로, 새 경로)
+MoveCallback = Callable[[str, str], None]
+
+
+def safe_filename(text: str) -> str:
+    """파일명에 사용할 수 없는 문자를 제거한다."""
+    return _UNSAFE.sub("", text).strip()
+
+
+@dataclass
+class RenameOp:
+    src: Path
+    dst: Path
+    sidecars: List[Tuple[Path, Path]] = field(default_factory=list)
+
+
+@dataclass
+class RenameResult:
+    renamed: Dict[str, str] = field(default_factory=dict)     # 원래 경로 → 새 경로
+    errors: List[str] = field(default_factory=list)
+
+
+class RenamePlan:
+    def __init__(self, ops: List[RenameOp]):
+        self.ops = ops
+
+    def __len__(self):
+        return len(self.ops)
+
+    def apply(
+        self,
+        before_move: Optional[MoveCallback] = None,
+        after_move: Optional[MoveCallback] = None,
+    ) -> RenameResult:
+        """
+        계획된 rename을 수행한다. 목적지가 아직 다른 원본에 점유된 경우 뒤로 미루고,
+        모든 작업이 서로를 기다리는 순환이면 하나를 임시 이름(temp_path)으로 빼서 푼다.
+        옮기지 못한 파일의 이름은 끝까지 점유된 것으로 보고, 그 이름을 기다리던 작업은
+        덮어쓰지 않고 오류로 남긴다.
+        before_move / after_move: 파일마다 최종 이름으로 옮기기 직전·직후에 호출 (저널 기록용)
+        """
+        result = RenameResult()
+        origin = {op.src: op.src for op in self.ops}
+        pending: Dict[Path, RenameOp] = {op.src: op for op in self.ops}
+        # 사이드카 원본도 점유 중인 경로로 취급
+        occupied: Set[Path] = set(pending)
+        for op in self.ops:
+            occupied.update(src for src, _ in op.sidecars)
+        stuck: Set[Path] = set()        # 옮기지 못해 계속 점유되는 이름
+
+        def blocked(op: RenameOp) -> List[Path]:
+            own = {op.src} | {s for s, _ in op.sidecars}
+            return [t for t in [op.dst] + [dst for _, dst in op.sidecars] if t in occupied and t not in own]
+
+        def fail(src: Path, message: str):
+            op = pending.pop(src)
+            result.errors.append(f"{origin[src].name}: {message}")
+            stuck.update({op.src} | {s for s, _ in op.sidecars})
+
+        while pending:
+            progressed = False
+            for src in list(pending):
+                op = pending[src]
+                if blocked(op):
+                    continue
+                if before_move:
+                    before_move(str(origin[op.src]), str(op.dst))
+                try:
+                    self._move(op)
+                except OSError as exc:
+                    fail(src, str(exc))
+                    progressed = True
+                    continue
+                result.renamed[str(origin[op.src])] = str(op.dst)
+                if after_move:
+                    after_move(str(origin[op.src]), str(op.dst))
+                occupied.difference_update({op.src} | {s for s, _ in op.sidecars})
+                occupied.update([op.dst] + [dst for _, dst in op.sidecars])
+                del pending[src]
+                progressed = True
+
+            if progressed or not pending:
+                continue
+
+            # 옮기지 못한 파일 자리를 기다리는 작업은 순환이 아니다 → 오류로 끝낸다 (연쇄 포함)
+            dead = [src for src, op in pending.items() if any(t in stuck for t in blocked(op))]
+            if dead:
+                for src in dead:
+                    fail(src, "대상 이름을 비우지 못해 건너뜀")
+                continue
+
+            # 순환: 아직 제자리에 있는 첫 작업을 임시 이름으로 옮겨 고리를 끊는다
+            src, op = next(((s, o) for s, o in pending.items() if s == origin[s]), next(iter(pending.items())))
+            tmp = temp_path(src)
+            try:
+                _rename_noreplace(src, tmp)
+            except OSError as exc:
+                fail(src, str(exc))
+                continue
+            sidecars = []
+            for s, d in op.sidecars:
+                t = temp_path(s)
+                try:
+                    _rename_noreplace(s, t)
+                except OSError:
+                    continue            # 사이드카는 제자리에 남긴다 (MP3만큼 중요하지 않다)
+                occupied.discard(s)
+                occupied.add(t)
+                sidecars.append((t, d))
+            occupied.discard(src)
+            occupied.add(tmp)
+            origin[tmp] = origin[src]
+            del pending[src]
+            pending[tmp] = RenameOp(tmp, op.dst, sidecars)
+
+        return result
+
+    @staticmethod
+    def _move(op: RenameOp):
+        _rename_noreplace(op.src, op.dst)
+        for src, dst in op.sidecars:
+            try:
+                _rename_noreplace(src, dst)
+            except OSError:
+                # 사이드카 실패는 MP3 rename을 되돌릴 만큼 중요하지 않다
+                pass
+
+
+def temp_path(path: Path) -> Path:
+    """순환을 풀 때 잠시 쓰는 이름. 원래 경로에서 정해지므로 중단 후 재개할 때 찾을 수 있다"""
+    return path.with_name(f".{path.stem}.renaming{path.suffix}")
+
+
+def _rename_noreplace(src: Path, dst: Path):
+    """dst가 이미 있으면 FileExistsError (os.rename은 POSIX에서 조용히 덮어쓴다)"""
+    if os.path.lexists(dst):
+        raise FileExistsError(errno.EEXIST, "대상 파일이 이미 있음", str(dst))
+    os.rename(src, dst)
+
+
+def validate_template(template: str):
+    """
+    파일명 템플릿 검사. 모르는 필드·잘못된 형식 지정·빈 결과면 ValueError
+    (태그를 모두 기록한 뒤에야 실패하지 않도록 적용 전에 부른다)
+    """
+    try:
+        names = [name for _, name, _, _ in string.Formatter().parse(template) if name is not None]
+    except ValueError as exc:
+        raise ValueError(f"잘못된 파일명 템플릿: {exc}") from None
+    unknown = [name for name in names if name not in TEMPLATE_FIELDS]
+    if unknown:
+        raise ValueError(f"알 수 없는 필드 {{{unknown[0]}}} (사용 가능: {', '.join(TEMPLATE_FIELDS)})")
+    sample = TrackInfo(1, "Title", "Artist", "Album", "Artist", "")
+    try:
+        name = _render(template, sample)
+    except (IndexError, KeyError, TypeError, ValueError) as exc:
+        raise ValueError(f"잘못된 파일명 템플릿: {exc}") from None
+    if not name:
+        raise ValueError("템플릿으로 만든 파일명이 비어 있음")
+
+
+def _render(template: str, track: TrackInfo) -> str:
+    fields = {
+        "artist": safe_filename(track.artist),
+        "title": safe_filename(track.title),
+        "album": safe_filename(track.album),
+        "album_artist": safe_filename(track.album_artist),
+        "track": track.track_number,
+        "disc": track.disc_number,
+    }
+    return safe_filename(template.format_map(fields))
+
+
+class RenamePlanner:
+    """
+    템플릿 필드: {artist} {title} {album} {album_artist} {track} {disc}
+    예) "{artist}-{track:02d}-{title}", "{disc}-{track:02d} {title}"
+    """
+
+    def __init__(self, template: str = DEFAULT_TEMPLATE):
+        validate_template(template)
+        self.template = template
+
+    def format_name(self, track: TrackInfo) -> str:
+        return _render(self.template, track)
+
+    def plan(self, items: List[Tuple[str, TrackInfo]]) -> RenamePlan:
+        by_dir: Dict[Path, List[Tuple[Path, TrackInfo]]] = defaultdict(list)
+        for path, track in items:
+            p = Path(path)
+            by_dir[p.parent].append((p, track))
+
+        ops: List[RenameOp] = []
+        for directory, entries in by_dir.items():
+            ops.extend(self._plan_dir(directory, entries))
+        return RenamePlan(ops)
+
+    def _plan_dir(self, directory: Path, entries: List[Tuple[Path, TrackInfo]]) -> List[RenameOp]:
+        try:
+            with os.scandir(directory) as it:
+                snapshot = {e.name for e in it}
+        except OSError:
+            snapshot = set()
+
+        moving: Set[str] = set()
+        for p, _ in entries:
+            moving.add(p.name)
+            moving.update(p.stem + sfx for sfx in SIDECAR_SUFFIXES if p.stem + sfx in snapshot)
+        # 이동하지 않는 파일들이 차지한 이름 + 이번 계획에서 이미 배정된 이름
+        taken = snapshot - moving
+        ops: List[RenameOp] = []
+        planned = []
+        for src, track in entries:
+            suffix = src.suffix or ".mp3"
+            sidecar_sfx = [sfx for sfx in SIDECAR_SUFFIXES if src.stem + sfx in snapshot]
+            planned.append((src, self.format_name(track), suffix, sidecar_sfx))
+
+        # 이미 원하는 이름인 파일은 먼저 자리를 확정한다
+        for src, base, suffix, sidecar_sfx in planned:
+            if base + suffix == src.name:
+                taken.add(src.name)
+                taken.update(src.stem + sfx for sfx in sidecar_sfx)
+
+        for src, base, suffix, sidecar_sfx in planned:
+            if base + suffix == src.name:
+                continue
+            stem, n = base, 1
+            while True:
+                names = [stem + suffix] + [stem + sfx for sfx in sidecar_sfx]
+                if not any(name in taken for name in names):
+                    break
+                n += 1
+                stem = f"{base}({n})"
+
+            taken.update(names)
+            ops.append(RenameOp(
+                src=src,
+                dst=directory / (stem + suffix),
+                sidecars=[(directory / (src.stem + sfx), directory / (stem + sfx)) for sfx in sidecar_sfx],
+            ))
+        return ops
@@ -0,0 +1,206 @@
+"""
+세션 스냅샷 저장/복원 (다중 파일 탭 상태)
+
+종료 시와 주기적으로 크롤링한 앨범, 파일 목록(크기·mtime·읽어 둔 태그),
+매칭 결과를 저장한다. 복원할 때는 stat이 달라진 파일만 태그를 다시 읽는다.
+앨범아트는 해시 참조만 스냅샷에 넣고, 바이트는 covers/ 아래에 한 번만 기록한다.
+"""
+
+import marshal
+import os
+import sys
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.models import AlbumInfo, TrackKey, album_from_tuple, album_to_tuple, covers
+from src.services.app_paths import app_data_dir
+from src.services.mp3_handler import MP3Handler
+from src.services.telemetry import span
+
+SESSION_FILE = "session.bin"
+COVER_DIR = "covers"
+_MAGIC = b"MTS\x01" + bytes(sys.version_info[:2])     # marshal 포맷은 Python 버전별
+
+
+@dataclass
+class FileEntry:
+    path: str
+    size: int
+    mtime_ns: int
+    meta: Dict[str, str] = field(default_factory=dict)   # MP3Handler.read_metadata 결과
+    track_key: Optional[TrackKey] = None                 # 매칭된 트랙 (디스크, 트랙). 없으면 None
+    applied: bool = False
+
+    def __post_init__(self):
+        # 이전 세션 형식은 트랙번호만 저장했다 (한 장짜리로 간주)
+        if isinstance(self.track_key, int):
+            self.track_key = (1, self.track_key)
+        elif self.track_key is not None:
+            self.track_key = tuple(self.track_key)
+
+    @classmethod
+    def scan(cls, path: str, handler: MP3Handler, **kwargs) -> "FileEntry":
+        st = os.stat(path)
+        return cls(path, st.st_size, st.st_mtime_ns, handler.read_metadata(path), **kwargs)
+
+
+@dataclass
+class SessionSnapshot:
+    url: str = ""
+    album: Optional[AlbumInfo] = None
+    files: List[FileEntry] = field(default_factory=list)
+    applied: int = 0
+
+
+@dataclass
+class RevalidateResult:
+    files: List[FileEntry]
+    rescanned: int = 0
+    missing: int = 0
+
+
+class SessionStore:
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory) if directory else app_data_dir()
+        self.path = self.directory / SESSION_FILE
+        self._last_payload: Optional[tuple] = None
+        self._last_cover: Optional[str] = None
+        self._lock = threading.Lock()
+
+    # ── 저장 ─────────────────────────────────
+    @staticmethod
+    def _payload(snap: SessionSnapshot) -> tuple:
+        files = tuple(
+            (f.path, f.size, f.mtime_ns, f.meta, f.track_key, f.applied)
+            for f in snap.files
+        )
+        album = album_to_tuple(snap.album) if snap.album else None
+        return (snap.url, album, files, snap.applied)
+
+    def save(self, snap: SessionSnapshot) -> bool:
+        """
+        스냅샷을 원자적으로 기록한다 (임시 파일 → os.replace).
+        직전 저장과 내용이 같으면 건너뛴다. 반환: 실제로 기록했는지
+        """
+        payload = self._payload(snap)
+        with self._lock:
+            return self._write(snap, payload)
+
+    def _write(self, snap: SessionSnapshot, payload: tuple) -> bool:
+        # marshal 바이트는 참조 카운트에 따라 달라질 수 있어 직렬화 전 값으로 비교한다
+        if payload == self._last_payload:
+            return False
+        data = _MAGIC + marshal.dumps(payload, 4)
+        cover_ref = snap.album.cover_ref if snap.album else None
+        with span("session_save", files=str(len(snap.files))) as sp:
+            sp.bytes = len(data)
+            if cover_ref:
+                self._save_cover(cover_ref)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".session.")
+            try:
+                with os.fdopen(fd, "wb") as fp:
+                    fp.write(data)
+                os.replace(tmp, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+        self._last_payload = payload
+        if cover_ref != self._last_cover:
+            self._prune_covers(keep=cover_ref)
+            self._last_cover = cover_ref
+        return True
+
+    def _save_cover(self, ref: str):
+        target = self.directory / COVER_DIR / ref
+        if target.exists():
+            return
+        data = covers.get(ref)
+        if data is None:
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{ref}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+
+    # ── 복원 ─────────────────────────────────
+    def load(self) -> Optional[SessionSnapshot]:
+        """저장된 스냅샷. 없거나 읽을 수 없으면 None"""
+        try:
+            data = self.path.read_bytes()
+        except OSError:
+            return None
+        if not data.startswith(_MAGIC):
+            return None
+        with span("session_load") as sp:
+            sp.bytes = len(data)
+            try:
+                payload = marshal.loads(memoryview(data)[len(_MAGIC):])
+                url, album_raw, files, applied = payload
+                album = album_from_tuple(album_raw) if album_raw else None
+            except (EOFError, TypeError, ValueError):
+                sp.outcome = "miss"
+                return None
+        if album and album.cover_ref and album.cover_data is None:
+            self._load_cover(album)
+        self._last_payload = payload
+        self._last_cover = album.cover_ref if album else None
+        return SessionSnapshot(
+            url=url,
+            album=album,
+            files=[FileEntry(*f) for f in files],
+            applied=applied,
+        )
+
+    def _load_cover(self, album: AlbumInfo):
+        try:
+            album.cover_data = (self.directory / COVER_DIR / album.cover_ref).read_bytes()
+        except OSError:
+            album.cover_data = None
+
+    @staticmethod
+    def revalidate(
+        files: List[FileEntry], handler: Optional[MP3Handler] = None,
+    ) -> RevalidateResult:
+        """
+        크기·mtime이 그대로인 파일은 저장된 태그를 그대로 쓰고,
+        바뀐 파일만 다시 읽는다. 사라진 파일은 목록에서 뺀다.
+        """
+        handler = handler or MP3Handler()
+        result = RevalidateResult(files=[])
+        for entry in files:
+            try:
+                st = os.stat(entry.path)
+            except OSError:
+                result.missing += 1
+                continue
+            if (st.st_size, st.st_mtime_ns) != (entry.size, entry.mtime_ns):
+                entry = FileEntry(
+                    entry.path, st.st_size, st.st_mtime_ns,
+                    handler.read_metadata(entry.path),
+                    track_key=entry.track_key,
+                    applied=entry.applied,
+                )
+                result.rescanned += 1
+            result.files.append(entry)
+        return result
+
+    def _prune_covers(self, keep: Optional[str]):
+        """스냅샷이 더 이상 참조하지 않는 커버 파일 정리"""
+        cover_dir = self.directory / COVER_DIR
+        try:
+            names = os.listdir(cover_dir)
+        except OSError:
+            return
+        for name in names:
+            if name != keep:
+                try:
+                    os.unlink(cover_dir / name)
+                except OSError:
+                    pass
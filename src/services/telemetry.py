@@ -0,0 +1,188 @@
+"""
+단계별 타이밍 스팬 기록 및 내보내기 (JSON lines / Prometheus 텍스트)
+
+    with span("fetch", url=url) as sp:
+        resp = requests.get(url)
+        sp.bytes = len(resp.content)
+
+블록 안에서 예외가 나면 outcome="error"로 기록하고 예외는 그대로 전파한다.
+예외를 삼키는 호출부는 span 바깥에서 try/except 하면 실패가 기록된 채 넘어간다.
+"""
+
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List
+
+STAGES = (
+    "fetch",
+    "parse",
+    "cover_download",
+    "image_process",
+    "tag_read",
+    "audio_hash",
+    "backup",
+    "tag_write",
+)
+
+
+@dataclass
+class Span:
+    stage: str
+    started: float                  # time.time()
+    duration_ms: float = 0.0
+    bytes: int = 0
+    outcome: str = "ok"             # ok | error | miss
+    error: str = ""
+    attrs: Dict[str, str] = field(default_factory=dict)
+
+
+class _StageTotals:
+    __slots__ = ("count", "total_ms", "bytes", "outcomes")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.bytes = 0
+        self.outcomes: Dict[str, int] = defaultdict(int)
+
+
+class Telemetry:
+    """
+    스레드 안전 스팬 수집기.
+    누적 합계(횟수·시간·바이트·결과)는 계속 유지하고,
+    개별 스팬은 최근 max_spans개만 보관해 분위수/내보내기에 쓴다.
+    """
+
+    def __init__(self, max_spans: int = 5000):
+        self._lock = threading.Lock()
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        self._totals: Dict[str, _StageTotals] = defaultdict(_StageTotals)
+        self.enabled = True
+
+    @contextmanager
+    def span(self, stage: str, **attrs) -> Iterator[Span]:
+        sp = Span(stage=stage, started=time.time(),
+                  attrs={k: str(v) for k, v in attrs.items()})
+        t0 = time.perf_counter()
+        try:
+            yield sp
+        except BaseException as exc:
+            sp.outcome = "error"
+            sp.error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            sp.duration_ms = (time.perf_counter() - t0) * 1000
+            self.record(sp)
+
+    def record(self, sp: Span):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._spans.append(sp)
+            totals = self._totals[sp.stage]
+            totals.count += 1
+            totals.total_ms += sp.duration_ms
+            totals.bytes += sp.bytes
+            totals.outcomes[sp.outcome] += 1
+
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+            self._totals.clear()
+
+    # ── 집계 ─────────────────────────────────
+    def summary(self) -> Dict[str, dict]:
+        """단계별 {count, errors, total_ms, mean_ms, p50_ms, p95_ms, max_ms, bytes}"""
+        with self._lock:
+            spans = list(self._spans)
+            totals = {
+                k: (v.count, v.total_ms, v.bytes, dict(v.outcomes))
+                for k, v in self._totals.items()
+            }
+
+        durations: Dict[str, List[float]] = defaultdict(list)
+        for sp in spans:
+            durations[sp.stage].append(sp.duration_ms)
+
+        result = {}
+        for stage, (count, total_ms, nbytes, outcomes) in totals.items():
+            values = sorted(durations.get(stage, []))
+            result[stage] = {
+                "count": count,
+                "errors": outcomes.get("error", 0),
+                "misses": outcomes.get("miss", 0),
+                "total_ms": total_ms,
+                "mean_ms": total_ms / count if count else 0.0,
+                "p50_ms": _quantile(values, 0.5),
+                "p95_ms": _quantile(values, 0.95),
+                "max_ms": values[-1] if values else 0.0,
+                "bytes": nbytes,
+                "outcomes": outcomes,
+            }
+        return result
+
+    def by_attr(self, attr: str) -> Dict[str, Dict[str, float]]:
+        """attr 값(예: album)별 단계 소요 시간 합계 (ms)"""
+        result: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for sp in self.spans():
+            key = sp.attrs.get(attr)
+            if key:
+                result[key][sp.stage] += sp.duration_ms
+        return {k: dict(v) for k, v in result.items()}
+
+    # ── 내보내기 ──────────────────────────────
+    def export_jsonl(self, path: Path) -> int:
+        spans = self.spans()
+        with open(path, "w", encoding="utf-8") as f:
+            for sp in spans:
+                f.write(json.dumps(asdict(sp), ensure_ascii=False) + "\n")
+        return len(spans)
+
+    def prometheus_text(self, prefix: str = "mp3tagger") -> str:
+        lines = [
+            f"# HELP {prefix}_stage_duration_seconds Time spent per pipeline stage.",
+            f"# TYPE {prefix}_stage_duration_seconds summary",
+        ]
+        summary = self.summary()
+        for stage, s in sorted(summary.items()):
+            label = f'stage="{stage}"'
+            lines.append(f'{prefix}_stage_duration_seconds{{{label},quantile="0.5"}} {s["p50_ms"] / 1000:.6f}')
+            lines.append(f'{prefix}_stage_duration_seconds{{{label},quantile="0.95"}} {s["p95_ms"] / 1000:.6f}')
+            lines.append(f'{prefix}_stage_duration_seconds_sum{{{label}}} {s["total_ms"] / 1000:.6f}')
+            lines.append(f'{prefix}_stage_duration_seconds_count{{{label}}} {s["count"]}')
+        lines.append(f"# HELP {prefix}_stage_bytes_total Bytes transferred or processed per stage.")
+        lines.append(f"# TYPE {prefix}_stage_bytes_total counter")
+        for stage, s in sorted(summary.items()):
+            lines.append(f'{prefix}_stage_bytes_total{{stage="{stage}"}} {s["bytes"]}')
+        lines.append(f"# HELP {prefix}_stage_outcomes_total Stage results by outcome.")
+        lines.append(f"# TYPE {prefix}_stage_outcomes_total counter")
+        for stage, s in sorted(summary.items()):
+            for outcome, n in sorted(s["outcomes"].items()):
+                lines.append(f'{prefix}_stage_outcomes_total{{stage="{stage}",outcome="{outcome}"}} {n}')
+        return "\n".join(lines) + "\n"
+
+    def export_prometheus(self, path: Path):
+        Path(path).write_text(self.prometheus_text(), encoding="utf-8")
+
+
+def _quantile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+# 프로세스 전역 수집기
+telemetry = Telemetry()
+
+
+def span(stage: str, **attrs):
+    return telemetry.span(stage, **attrs)
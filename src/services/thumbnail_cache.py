@@ -0,0 +1,154 @@
+"""
+앨범아트 썸네일 디스크 캐시 (커버 갤러리용)
+
+커버 내용 해시(CoverStore.ref_for)를 키로 thumbs/<크기>/<해시 앞 2자>/<해시>.jpg 에 보관한다.
+같은 커버는 앨범이 달라도 한 번만 만든다. 썸네일 생성·디스크 읽기는 작업 스레드 풀에서 하고,
+결과(디코딩된 PIL 이미지)를 콜백으로 넘긴다. PhotoImage 생성은 호출 측(Tk 스레드) 몫이다.
+
+JPEG 원본은 Image.draft로 디코더 단계에서 1/2·1/4·1/8로 줄여 읽고,
+그 밖의 형식은 thumbnail(reducing_gap)이 Image.reduce로 먼저 줄인 뒤 리샘플링한다.
+"""
+
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from src.services.app_paths import app_data_dir
+from src.services.telemetry import span
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+THUMB_DIR = "thumbs"
+THUMB_SIZE = 140
+THUMB_WORKERS = min(4, os.cpu_count() or 2)
+THUMB_QUALITY = 85
+
+ThumbCallback = Callable[[str, Optional["Image.Image"]], None]
+
+
+def make_thumbnail(data: bytes, size: int, square: bool = False, keep_alpha: bool = False) -> "Image.Image":
+    """
+    커버 바이트 → 긴 변이 size 이하인 RGB 이미지 (비율 유지).
+    square: 비율과 관계없이 size×size로 맞춘다 / keep_alpha: 투명도가 있으면 RGBA로 둔다
+    """
+    img = Image.open(BytesIO(data))
+    img.draft("RGB", (size, size))
+    if img.mode not in (("RGB", "RGBA") if keep_alpha else ("RGB",)):
+        has_alpha = keep_alpha and ("A" in img.mode or "transparency" in img.info)
+        img = img.convert("RGBA" if has_alpha else "RGB")
+    if square:
+        return img.resize((size, size), Image.LANCZOS, reducing_gap=2.0)
+    img.thumbnail((size, size), Image.LANCZOS, reducing_gap=2.0)
+    return img
+
+
+class ThumbnailCache:
+    def __init__(self, directory: Optional[Path] = None, size: int = THUMB_SIZE,
+                 workers: int = THUMB_WORKERS):
+        base = Path(directory) if directory else app_data_dir() / THUMB_DIR
+        self.size = size
+        self.directory = base / str(size)
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="thumb")
+        self._lock = threading.Lock()
+        self._pending: Dict[str, List[ThumbCallback]] = {}
+
+    @property
+    def available(self) -> bool:
+        return Image is not None
+
+    def path_for(self, ref: str) -> Path:
+        return self.directory / ref[:2] / f"{ref}.jpg"
+
+    # ── 동기 (작업 스레드에서 호출) ─────────────
+    def load(self, ref: str, source: Callable[[], Optional[bytes]]) -> Optional["Image.Image"]:
+        """
+        디스크 캐시의 썸네일, 없으면 source()의 커버 바이트로 만들어 저장한다.
+        커버가 없거나 이미지가 아니면 None
+        """
+        if Image is None:
+            return None
+        path = self.path_for(ref)
+        try:
+            img = Image.open(path)
+            img.load()
+            return img
+        except (OSError, ValueError):
+            pass                        # 없음 또는 깨진 캐시 → 다시 만든다
+        data = source()
+        if not data:
+            return None
+        with span("image_process", kind="thumbnail") as sp:
+            sp.bytes = len(data)
+            try:
+                img = make_thumbnail(data, self.size)
+            except (OSError, ValueError, Image.DecompressionBombError):
+                sp.outcome = "error"
+                return None
+        self._store(path, img)
+        return img
+
+    def _store(self, path: Path, img: "Image.Image"):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fp:
+                    img.save(fp, format="JPEG", quality=THUMB_QUALITY)
+                os.replace(tmp, path)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+        except OSError:
+            pass                        # 캐시 기록 실패는 다음에 다시 만들 뿐
+
+    # ── 비동기 ───────────────────────────────
+    def request(
+        self,
+        ref: str,
+        source: Callable[[], Optional[bytes]],
+        callback: ThumbCallback,
+        wanted: Optional[Callable[[str], bool]] = None,
+    ):
+        """
+        작업 스레드에서 load 후 callback(ref, 이미지 또는 None)을 부른다 (작업 스레드에서 호출됨).
+        같은 ref를 이미 처리 중이면 콜백만 붙는다.
+        wanted: 차례가 왔을 때 False면 콜백 없이 건너뛴다 (스크롤로 화면에서 벗어난 타일).
+        다시 필요해지면 호출 측이 request를 다시 부른다
+        """
+        with self._lock:
+            waiting = self._pending.get(ref)
+            if waiting is not None:
+                waiting.append(callback)
+                return
+            self._pending[ref] = [callback]
+        self._pool.submit(self._run, ref, source, wanted)
+
+    def _run(self, ref: str, source, wanted):
+        img, skipped = None, False
+        try:
+            if wanted is None or wanted(ref):
+                img = self.load(ref, source)
+            else:
+                skipped = True
+        except Exception:
+            img = None                  # source() 실패 등 → 기다리는 콜백에는 "없음"으로 알린다
+        finally:
+            with self._lock:
+                callbacks = self._pending.pop(ref, [])
+        if skipped:
+            return
+        for cb in callbacks:
+            cb(ref, img)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,118 @@
+"""
+MP3 파일명 ↔ 앨범 트랙 자동 매칭 (서비스 레이어)
+"""
+
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.models import TrackInfo, TrackKey
+
+_NUM_PREFIX = re.compile(r"^(\d+)[.\s_-]")
+# 여러 장짜리 앨범의 "1-03 Title", "2.11 Title"
+_DISC_TRACK_PREFIX = re.compile(r"^(\d{1,2})[-.](\d{1,3})[.\s_-]")
+# 디스크 폴더: "CD1", "CD 2", "Disc 03", "Album [Disk2]"
+_DISC_DIR = re.compile(r"(?<![a-z0-9])(?:cd|disc|disk)\s*[-_.]?\s*(\d{1,2})(?!\d)", re.IGNORECASE)
+_NORMALIZE = re.compile(r"[\s\-_\(\)\[\]]")
+
+
+def normalize_title(text: str) -> str:
+    """공백·괄호·구분자를 제거하고 소문자로 변환"""
+    return _NORMALIZE.sub("", text.lower())
+
+
+class TrackMatcher:
+    """
+    파일명 기반 자동 매칭. 트랙은 (디스크, 트랙번호)로 구분한다.
+    0순위: 태그에 기록된 멜론 songId (read_metadata의 melon_song_id)
+    1순위: 파일명 앞 트랙번호 (`01 Title.mp3`, `1. Title.mp3`, 여러 장이면 `1-03 Title.mp3`)
+    2순위: 정규화한 트랙 제목이 파일명에 포함되는지 검사
+    여러 장짜리 앨범은 상위 폴더 이름(CD1, Disc 2)이나 태그의 TPOS로 디스크를 정하고
+    번호·제목을 그 디스크 안에서 먼저 찾는다.
+    """
+
+    def __init__(self, tracks: List[TrackInfo]):
+        self._by_key: Dict[TrackKey, TrackInfo] = {t.key: t for t in tracks}
+        self._by_song: Dict[str, TrackInfo] = {t.song_id: t for t in tracks if t.song_id}
+        self._ordered = sorted(self._by_key.values(), key=lambda t: t.key)
+        self._discs = sorted({t.disc_number for t in tracks})
+        self._by_num: Dict[int, List[TrackInfo]] = defaultdict(list)
+        for track in self._ordered:
+            self._by_num[track.track_number].append(track)
+        # 제목 정규화는 트랙당 한 번만 수행 (디스크마다 같은 제목이 있을 수 있어 디스크별로 보관)
+        by_title = {(t.disc_number, t.title.lower()): t for t in self._ordered}
+        self._titles: Dict[int, list] = defaultdict(list)
+        for (disc, title), track in by_title.items():
+            self._titles[disc].append((normalize_title(title), track))
+
+    @property
+    def multi_disc(self) -> bool:
+        return len(self._discs) > 1
+
+    def match(self, path: str, meta: Optional[Dict[str, str]] = None) -> Optional[TrackInfo]:
+        """meta: 이미 읽어 둔 태그 (있으면 songId로 먼저 찾고 TPOS를 디스크 힌트로 쓴다)"""
+        song_id = meta.get("melon_song_id") if meta else ""
+        if song_id and song_id in self._by_song:
+            return self._by_song[song_id]
+
+        p = Path(path)
+        stem = p.stem
+        disc = self.disc_hint(path, meta)
+
+        if self.multi_disc:
+            m = _DISC_TRACK_PREFIX.match(stem)
+            if m:
+                track = self._by_key.get((int(m.group(1)), int(m.group(2))))
+                if track:
+                    return track
+
+        m = _NUM_PREFIX.match(stem)
+        if m:
+            track = self.lookup(int(m.group(1)), disc)
+            if track:
+                return track
+
+        normalized = normalize_title(stem)
+        discs = [disc] if disc is not None else []
+        discs += [d for d in self._discs if d != disc]
+        for d in discs:
+            for norm_title, track in self._titles[d]:
+                if norm_title and norm_title in normalized:
+                    return track
+        return None
+
+    def lookup(self, number: int, disc: Optional[int] = None) -> Optional[TrackInfo]:
+        """
+        트랙번호로 찾기. disc를 모르면 한 장짜리이거나 번호가 한 디스크에만 있을 때만 찾는다.
+        디스크 안에 없는 번호는 앨범 전체 순번(1..N, 디스크를 이어서 센 번호)으로 본다.
+        """
+        if disc is None and len(self._discs) == 1:
+            disc = self._discs[0]
+        if disc is not None:
+            track = self._by_key.get((disc, number))
+            if track:
+                return track
+        else:
+            candidates = self._by_num.get(number, ())
+            if len(candidates) == 1:
+                return candidates[0]
+            if candidates:
+                return None               # 여러 디스크에 같은 번호 — 제목으로 넘긴다
+        if self.multi_disc and 1 <= number <= len(self._ordered):
+            track = self._ordered[number - 1]
+            if disc is None or track.disc_number == disc:
+                return track
+        return None
+
+    def disc_hint(self, path: str, meta: Optional[Dict[str, str]] = None) -> Optional[int]:
+        """상위 폴더 이름 → 태그 TPOS 순으로 디스크 번호. 한 장짜리 앨범이거나 모르면 None"""
+        if not self.multi_disc:
+            return None
+        m = _DISC_DIR.search(Path(path).parent.name)
+        if m and int(m.group(1)) in self._discs:
+            return int(m.group(1))
+        raw = (meta or {}).get("disc_number", "").split("/")[0].strip()
+        if raw.isdigit() and int(raw) in self._discs:
+            return int(raw)
+        return None
@@ -0,0 +1,103 @@
+"""
+앨범아트 미리보기 이미지 (디코딩·리샘플링은 작업 스레드, PhotoImage 생성만 Tk 스레드)
+
+커버 원본(수 MB PNG 등)을 Tk 스레드에서 열고 LANCZOS로 줄이면 크롤링 완료 콜백 동안
+UI가 수백 ms 멈춘다. 여기서는 작업 스레드가 커버를 한 번 BASE_SIZE로 디코딩·리샘플링해
+두고, 패널별 크기는 그 결과에서 다시 줄인다. Tk 스레드는 완성된 이미지로 PhotoImage만 만든다.
+같은 커버(CoverStore 참조)·같은 크기의 PhotoImage는 패널끼리 공유한다.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
+from src.services.telemetry import span
+from src.services.thumbnail_cache import make_thumbnail
+
+try:
+    from PIL import Image, ImageTk
+except ImportError:
+    Image = ImageTk = None
+
+PhotoCallback = Callable[[Optional["ImageTk.PhotoImage"]], None]
+
+
+class CoverImages:
+    """
+    커버 참조(cover_ref) → 미리보기 이미지 캐시.
+    디코딩 결과(BASE_SIZE)는 작업 스레드 쪽에, PhotoImage는 Tk 스레드 쪽에 각각 LRU로 보관한다.
+    """
+
+    BASE_SIZE = 180          # 가장 큰 미리보기 (AlbumInfoPanel.ART_SIZE)
+    DECODED_MAX = 8
+    PHOTO_MAX = 8
+
+    def __init__(self, workers: int = 1):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cover")
+        self._lock = threading.Lock()
+        self._decoded: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self._photos: "OrderedDict[Tuple[str, int], ImageTk.PhotoImage]" = OrderedDict()
+
+    @property
+    def available(self) -> bool:
+        return Image is not None and ImageTk is not None
+
+    # ── Tk 스레드 ─────────────────────────────
+    def request(self, ref: str, data: bytes, size: int, post: Callable, callback: PhotoCallback):
+        """
+        size×size 미리보기를 callback(PhotoImage 또는 None)으로 넘긴다 (Tk 스레드에서 호출됨).
+        이미 만든 PhotoImage면 바로, 아니면 작업 스레드에서 디코딩한 뒤 post(UIUpdateBus.post)로 돌아온다.
+        결과가 늦게 도착할 수 있으므로 callback 쪽에서 아직 같은 커버를 보여줄 차례인지 확인한다.
+        """
+        photo = self._photos.get((ref, size))
+        if photo is not None:
+            self._photos.move_to_end((ref, size))
+            callback(photo)
+            return
+        self._pool.submit(self._decode_worker, ref, data, size, post, callback)
+
+    def _deliver(self, ref: str, size: int, img, callback: PhotoCallback):
+        if img is None:
+            callback(None)
+            return
+        key = (ref, size)
+        photo = self._photos.get(key)
+        if photo is None:
+            photo = ImageTk.PhotoImage(img)
+            self._photos[key] = photo
+            while len(self._photos) > self.PHOTO_MAX:
+                self._photos.popitem(last=False)
+        callback(photo)
+
+    # ── 작업 스레드 ───────────────────────────
+    def _decode_worker(self, ref: str, data: bytes, size: int, post: Callable, callback: PhotoCallback):
+        try:
+            img = self.resized(ref, data, size)
+        except Exception:
+            img = None                  # 깨진 이미지 → "없음"으로 표시
+        post(self._deliver, ref, size, img, callback)
+
+    def resized(self, ref: str, data: bytes, size: int) -> "Image.Image":
+        """size×size로 줄인 커버. 원본 디코딩은 커버당 한 번 (BASE_SIZE 결과를 재사용)"""
+        with self._lock:
+            base = self._decoded.get(ref)
+            if base is not None:
+                self._decoded.move_to_end(ref)
+        if base is None:
+            base = self._decode(data)
+            with self._lock:
+                self._decoded[ref] = base
+                while len(self._decoded) > self.DECODED_MAX:
+                    self._decoded.popitem(last=False)
+        if size == base.width:
+            return base
+        return base.resize((size, size), Image.LANCZOS)
+
+    def _decode(self, data: bytes) -> "Image.Image":
+        with span("image_process") as sp:
+            sp.bytes = len(data)
+            return make_thumbnail(data, self.BASE_SIZE, square=True, keep_alpha=True)
+
+
+cover_images = CoverImages()
@@ -2,11 +2,17 @@
 메인 애플리케이션 윈도우
 """
 
+import logging
+import os
+import threading
 import tkinter as tk
 from tkinter import ttk
 
+from src.services import SessionSnapshot, SessionStore
 from src.ui.theme import Theme, apply_dark_theme, DND_AVAILABLE
-from src.ui.widgets import StatusBar, SingleFileTab, MultiFileTab
+from src.ui.update_bus import UIUpdateBus
+from src.ui.stall_watchdog import StallWatchdog
+from src.ui.widgets import StatusBar, SingleFileTab, MultiFileTab, DiagnosticsTab, LibraryTab, CoverGallery
 
 try:
     from tkinterdnd2 import TkinterDnD
@@ -23,7 +29,10 @@ class MainWindow(_BaseWindow):
     ┌──────────────────────────────────────────┐
     │  Notebook                                │
     │  ├── 단일 파일 탭 (SingleFileTab)        │
-    │  └── 다중 파일 탭 (MultiFileTab)         │
+    │  ├── 다중 파일 탭 (MultiFileTab)         │
+    │  ├── 라이브러리 탭 (LibraryTab)          │
+    │  ├── 커버 탭 (CoverGallery)              │
+    │  └── 진단 탭 (DiagnosticsTab)            │
     ├──────────────────────────────────────────┤
     │  StatusBar (bottom, fixed)               │
     └──────────────────────────────────────────┘
@@ -32,13 +41,28 @@ class MainWindow(_BaseWindow):
     WIN_W, WIN_H  = 1200, 800
     WIN_MIN_W     = 900
     WIN_MIN_H     = 650
+    AUTOSAVE_MS   = 60_000
 
     def __init__(self):
         super().__init__()
+        self.ui_bus = UIUpdateBus(self)
         self._setup_window()
         apply_dark_theme(self)
         self._build_layout()
         self._apply_root_bg()
+        self.ui_bus.start()
+
+        # 옵트인: MP3TAGGER_STALL_WATCHDOG=1 이면 메인 루프 정지 감시
+        self.stall_watchdog = StallWatchdog.from_env(self)
+        if self.stall_watchdog:
+            self.stall_watchdog.start()
+
+        # 이전 세션 복원 (백그라운드에서 읽고 stat 검증 후 UI에 반영) + 주기 저장
+        self.session_store = SessionStore()
+        self._session_ready = False
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        threading.Thread(target=self._restore_worker, daemon=True).start()
+        self.after(self.AUTOSAVE_MS, self._autosave)
 
     def _setup_window(self):
         self.title("Melon MP3 Tagger")
@@ -58,22 +82,92 @@ class MainWindow(_BaseWindow):
         self.status_bar.pack(side="bottom", fill="x")
 
         # ── Notebook (메인 영역) ────────────────
-        notebook = ttk.Notebook(self)
+        notebook = self.notebook = ttk.Notebook(self)
         notebook.pack(side="top", fill="both", expand=True, padx=6, pady=(6, 0))
 
         # 단일 파일 탭
-        self.single_tab = SingleFileTab(notebook, status_bar=self.status_bar)
+        self.single_tab = SingleFileTab(
+            notebook, status_bar=self.status_bar, ui_bus=self.ui_bus,
+        )
         notebook.add(self.single_tab, text="  단일 파일  ")
 
         # 다중 파일 탭
-        self.multi_tab = MultiFileTab(notebook, status_bar=self.status_bar)
+        self.multi_tab = MultiFileTab(
+            notebook, status_bar=self.status_bar, ui_bus=self.ui_bus,
+        )
         notebook.add(self.multi_tab, text="  다중 파일  ")
 
+        # 라이브러리 탭 (멜론 ID로 폴더 전체 새로 고침, 다중 파일 탭과 색인 공유)
+        self.library_tab = LibraryTab(
+            notebook, status_bar=self.status_bar, ui_bus=self.ui_bus,
+            library=self.multi_tab.library,
+        )
+        notebook.add(self.library_tab, text="  라이브러리  ")
+
+        # 커버 탭 (앨범 캐시의 커버 격자, 더블클릭 → 다중 파일 탭에서 열기)
+        self.cover_tab = CoverGallery(
+            notebook, status_bar=self.status_bar, ui_bus=self.ui_bus,
+            library=self.multi_tab.library, on_open=self._open_album,
+        )
+        notebook.add(self.cover_tab, text="  커버  ")
+
+        # 진단 탭 (단계별 타이밍/실패 집계)
+        self.diagnostics_tab = DiagnosticsTab(notebook, status_bar=self.status_bar)
+        notebook.add(self.diagnostics_tab, text="  진단  ")
+
+    def _open_album(self, album_id: str):
+        self.multi_tab.open_album(album_id)
+        self.notebook.select(self.multi_tab)
+
+    # ── 세션 ──────────────────────────────────
+    def _restore_worker(self):
+        snap = self.session_store.load()
+        result = None
+        if snap and (snap.files or snap.album):
+            result = SessionStore.revalidate(snap.files)
+            snap.files = result.files
+        journal = self.multi_tab.journal
+        interrupted = journal.interrupted() if journal else []
+        self.ui_bus.post(self._on_session_loaded, snap, result, interrupted)
+
+    def _on_session_loaded(self, snap: SessionSnapshot, result, interrupted=()):
+        self._session_ready = True
+        if result is not None and self.multi_tab.restore_session(snap):
+            msg = f"이전 세션 복원 — 파일 {len(snap.files)}개"
+            if result.rescanned or result.missing:
+                msg += f" (변경 {result.rescanned}, 없음 {result.missing})"
+            self.status_bar.set_status(msg, "info")
+        # 세션으로 파일 목록이 채워진 뒤에 물어야 행 상태를 갱신할 수 있다
+        self.multi_tab.offer_resume(list(interrupted))
+
+    def _autosave(self):
+        if self._session_ready:
+            snap = self.multi_tab.session_snapshot()
+            threading.Thread(target=self._save_session, args=(snap,), daemon=True).start()
+        self.after(self.AUTOSAVE_MS, self._autosave)
+
+    def _save_session(self, snap: SessionSnapshot):
+        try:
+            self.session_store.save(snap)
+        except Exception:
+            logging.getLogger(__name__).exception("session save failed")
+
+    def _on_close(self):
+        if self._session_ready:
+            self._save_session(self.multi_tab.session_snapshot())
+        if self.stall_watchdog:
+            self.stall_watchdog.stop()
+        self.cover_tab.stop()
+        self.ui_bus.stop()
+        self.destroy()
+
 
 # ─────────────────────────────────────────────
 # 진입점
 # ─────────────────────────────────────────────
 def main():
+    if os.environ.get("MP3TAGGER_STALL_WATCHDOG", "") not in ("", "0"):
+        logging.basicConfig(level=logging.INFO)
     app = MainWindow()
     app.mainloop()
 
@@ -0,0 +1,134 @@
+"""
+Tk 메인 루프 정지(stall) 감지기 (옵트인)
+
+메인 루프에 heartbeat를 예약하고, 보조 스레드가 마지막 heartbeat 이후 경과 시간을
+감시한다. threshold_ms를 넘기면 그 순간 메인 스레드의 스택을 캡처하고,
+루프가 다시 돌아오면 정지 시간과 원인 콜백을 로그로 남긴다.
+
+활성화: 환경 변수 MP3TAGGER_STALL_WATCHDOG=1 (임계값: MP3TAGGER_STALL_MS, 기본 200)
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from src.services.telemetry import Span, telemetry
+
+log = logging.getLogger(__name__)
+
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_DISPATCH_MODULES = ("stall_watchdog.py", "update_bus.py")
+
+
+@dataclass
+class StallReport:
+    duration_ms: float
+    callback: str                       # 스택에서 찾은 프로젝트 코드의 가장 바깥 프레임
+    stack: List[str] = field(default_factory=list)
+
+
+class StallWatchdog:
+    HEARTBEAT_MS = 50
+    THRESHOLD_MS = 200
+
+    def __init__(self, root, threshold_ms: int = THRESHOLD_MS, heartbeat_ms: int = HEARTBEAT_MS):
+        self._root = root
+        self._threshold = threshold_ms / 1000
+        self._heartbeat_ms = heartbeat_ms
+        self._lock = threading.Lock()
+        self._last_beat = time.perf_counter()
+        self._captured: Optional[StallReport] = None
+        self._main_ident = threading.main_thread().ident
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.reports: List[StallReport] = []
+
+    @classmethod
+    def from_env(cls, root) -> Optional["StallWatchdog"]:
+        """MP3TAGGER_STALL_WATCHDOG가 설정되어 있으면 감시기를 만들어 반환"""
+        if os.environ.get("MP3TAGGER_STALL_WATCHDOG", "") in ("", "0"):
+            return None
+        threshold = int(os.environ.get("MP3TAGGER_STALL_MS", cls.THRESHOLD_MS))
+        return cls(root, threshold_ms=threshold)
+
+    def start(self):
+        self._main_ident = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._root.after(self._heartbeat_ms, self._beat)
+        self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    # ── 메인 스레드 ────────────────────────────
+    def _beat(self):
+        if self._stop.is_set():
+            return
+        now = time.perf_counter()
+        with self._lock:
+            gap = now - self._last_beat
+            self._last_beat = now
+            captured, self._captured = self._captured, None
+
+        lag = gap - self._heartbeat_ms / 1000
+        if captured is not None or lag > self._threshold:
+            report = captured or StallReport(0.0, "<unknown>")
+            report.duration_ms = lag * 1000
+            self._report(report)
+
+        self._root.after(self._heartbeat_ms, self._beat)
+
+    def _report(self, report: StallReport):
+        self.reports.append(report)
+        log.warning(
+            "Tk main loop blocked for %.0f ms in %s\n%s",
+            report.duration_ms, report.callback, "".join(report.stack),
+        )
+        telemetry.record(Span(
+            stage="ui_stall",
+            started=time.time() - report.duration_ms / 1000,
+            duration_ms=report.duration_ms,
+            outcome="error",
+            error=f"blocked in {report.callback}",
+            attrs={"callback": report.callback},
+        ))
+
+    # ── 보조 스레드 ────────────────────────────
+    def _watch(self):
+        interval = self._heartbeat_ms / 1000 / 2
+        while not self._stop.wait(interval):
+            with self._lock:
+                stalled = time.perf_counter() - self._last_beat - self._heartbeat_ms / 1000
+                already = self._captured is not None
+            if stalled > self._threshold and not already:
+                report = self._capture_main_stack()
+                with self._lock:
+                    self._captured = report
+
+    def _capture_main_stack(self) -> StallReport:
+        frame = sys._current_frames().get(self._main_ident)
+        if frame is None:
+            return StallReport(0.0, "<unknown>")
+        summary = traceback.extract_stack(frame)
+        stack = traceback.format_list(summary)
+
+        # Tk 디스패치(tkinter.CallWrapper) 바로 아래의 프로젝트 프레임을 원인 콜백으로 본다.
+        # UI 갱신 버스처럼 콜백을 대신 호출하는 모듈은 건너뛴다.
+        start = 0
+        for i, fs in enumerate(summary):
+            if fs.name == "__call__" and os.sep + "tkinter" + os.sep in fs.filename:
+                start = i + 1
+        last = summary[-1]
+        callback = f"{last.name} ({os.path.basename(last.filename)}:{last.lineno})"
+        for fs in summary[start:]:
+            path = os.path.abspath(fs.filename)
+            if path.startswith(_SRC_DIR) and os.path.basename(path) not in _DISPATCH_MODULES:
+                callback = f"{fs.name} ({os.path.relpath(path, os.path.dirname(_SRC_DIR))}:{fs.lineno})"
+                break
+        return StallReport(0.0, callback, stack)
@@ -0,0 +1,72 @@
+"""
+워커 스레드 → Tk 메인 루프 UI 갱신 버스 (프레임 단위 병합)
+"""
+
+import sys
+import threading
+import itertools
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class UIUpdateBus:
+    """
+    스레드 안전한 UI 갱신 큐.
+
+    워커 스레드는 post()로 콜백을 넣기만 하고, Tk 루프가 TICK_MS 간격으로
+    한 번에 비운다. 같은 key로 들어온 갱신은 마지막 값만 남기므로
+    (진행률, 행 상태, 통계 등) 파일 수백 개를 처리해도 프레임당 한 번만 그린다.
+    key가 없는 이벤트(완료/오류 통지)는 병합하지 않고 순서대로 실행한다.
+    """
+
+    TICK_MS = 50
+
+    def __init__(self, root, tick_ms: int = TICK_MS):
+        self._root = root
+        self._tick_ms = tick_ms
+        self._lock = threading.Lock()
+        self._pending: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._seq = itertools.count()
+        self._after_id: Optional[str] = None
+
+    # ── 워커 스레드용 ──────────────────────────
+    def post(self, callback: Callable, *args: Any, key: Optional[Hashable] = None):
+        """
+        다음 틱에 메인 스레드에서 callback(*args)를 실행하도록 예약한다.
+        key가 주어지면 아직 처리되지 않은 같은 key의 갱신을 대체한다.
+        """
+        if key is None:
+            key = ("_event", next(self._seq))
+        with self._lock:
+            # 병합된 항목은 최신 위치로 옮겨 이벤트 간 순서를 보존한다
+            self._pending.pop(key, None)
+            self._pending[key] = (callback, args)
+
+    # ── 메인 루프용 ────────────────────────────
+    def start(self):
+        if self._after_id is None:
+            self._after_id = self._root.after(self._tick_ms, self._drain)
+
+    def stop(self):
+        if self._after_id is not None:
+            try:
+                self._root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def flush(self):
+        """대기 중인 갱신을 즉시 실행 (메인 스레드에서만 호출)"""
+        with self._lock:
+            batch = list(self._pending.values())
+            self._pending.clear()
+        for callback, args in batch:
+            try:
+                callback(*args)
+            except Exception:
+                self._root.report_callback_exception(*sys.exc_info())
+
+    def _drain(self):
+        self._after_id = None
+        self.flush()
+        self._after_id = self._root.after(self._tick_ms, self._drain)
@@ -9,6 +9,9 @@ from src.ui.widgets.file_dialog import CustomFileDialog
 from src.ui.widgets.mp3_panel import MP3FilePanel
 from src.ui.widgets.single_file_tab import SingleFileTab
 from src.ui.widgets.multi_file_tab import MultiFileTab
+from src.ui.widgets.diagnostics_tab import DiagnosticsTab
+from src.ui.widgets.library_tab import LibraryTab
+from src.ui.widgets.cover_gallery import CoverGallery
 
 __all__ = [
     "AlbumInfoPanel",
@@ -20,4 +23,7 @@ __all__ = [
     "CustomFileDialog",
     "SingleFileTab",
     "MultiFileTab",
+    "DiagnosticsTab",
+    "LibraryTab",
+    "CoverGallery",
 ]
@@ -3,8 +3,10 @@
 """
 
 import tkinter as tk
-from tkinter import ttk
+from tkinter import messagebox, ttk
+from typing import Optional
 
+from src.services import DEFAULT_TEMPLATE, validate_template
 from src.ui.theme import Theme
 
 
@@ -24,8 +26,10 @@ class ActionBar(ttk.Frame):
         ttk.Separator(self, orient="horizontal").pack(fill="x", pady=(0, 8))
         btn_row = ttk.Frame(self, style="Card.TFrame")
         btn_row.pack(fill="x")
-        ttk.Button(btn_row, text="선택 항목 적용", style="Accent.TButton", command=lambda: self._on_apply_selected and self._on_apply_selected()).pack(side="left", padx=(0, 6))
-        ttk.Button(btn_row, text="매칭된 항목 모두 적용", style="Accent.TButton", command=lambda: self._on_apply_all and self._on_apply_all()).pack(side="left", padx=(0, 6))
+        self._apply_sel_btn = ttk.Button(btn_row, text="선택 항목 적용", style="Accent.TButton", command=lambda: self._on_apply_selected and self._on_apply_selected())
+        self._apply_sel_btn.pack(side="left", padx=(0, 6))
+        self._apply_all_btn = ttk.Button(btn_row, text="매칭된 항목 모두 적용", style="Accent.TButton", command=lambda: self._on_apply_all and self._on_apply_all())
+        self._apply_all_btn.pack(side="left", padx=(0, 6))
         ttk.Button(btn_row, text="건너뛰기", style="TButton", command=lambda: self._on_skip and self._on_skip()).pack(side="left")
         opts_frame = ttk.Frame(btn_row, style="Card.TFrame")
         opts_frame.pack(side="right")
@@ -33,6 +37,33 @@ class ActionBar(ttk.Frame):
         ttk.Checkbutton(opts_frame, text="원본 백업", variable=self._backup_var).pack(side="left", padx=6)
         self._cover_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(opts_frame, text="앨범아트 포함", variable=self._cover_var).pack(side="left", padx=6)
+        self._lrc_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(opts_frame, text="가사(.lrc)", variable=self._lrc_var).pack(side="left", padx=6)
+        self._embed_lyrics_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(opts_frame, text="가사 임베드", variable=self._embed_lyrics_var).pack(side="left", padx=6)
+        self._rename_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(opts_frame, text="파일명 변경", variable=self._rename_var).pack(side="left", padx=(6, 2))
+        self._template_var = tk.StringVar(value=DEFAULT_TEMPLATE)
+        ttk.Entry(opts_frame, textvariable=self._template_var, width=24, font=Theme.FONT_MONO).pack(side="left", padx=(0, 6))
 
-    def get_options(self) -> dict:
-        return {"backup": self._backup_var.get(), "include_cover": self._cover_var.get()}
+    def get_options(self) -> Optional[dict]:
+        """적용 옵션. 파일명 템플릿이 잘못됐으면 알리고 None"""
+        template = self._template_var.get().strip()
+        if self._rename_var.get():
+            try:
+                validate_template(template)
+            except ValueError as exc:
+                messagebox.showerror("파일명 템플릿 오류", str(exc))
+                return None
+        return {
+            "backup": self._backup_var.get(),
+            "include_cover": self._cover_var.get(),
+            "write_lrc": self._lrc_var.get(),
+            "embed_lyrics": self._embed_lyrics_var.get(),
+            "rename_template": template if self._rename_var.get() else None,
+        }
+
+    def set_enabled(self, enabled: bool):
+        state = "normal" if enabled else "disabled"
+        self._apply_sel_btn.configure(state=state)
+        self._apply_all_btn.configure(state=state)
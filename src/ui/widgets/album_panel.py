@@ -4,29 +4,28 @@
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict
-from io import BytesIO
+from typing import Dict, Optional
 
 from src.models import AlbumInfo
+from src.ui.cover_images import cover_images
 from src.ui.theme import Theme, PIL_AVAILABLE
-
-try:
-    from PIL import Image, ImageTk
-except ImportError:
-    Image = ImageTk = None
+from src.ui.update_bus import UIUpdateBus
 
 
 class AlbumInfoPanel(ttk.Frame):
     """
     앨범아트(180x180) + 앨범명/아티스트/장르/발매일 텍스트 표시
     레이아웃: pack() 사용 (수직 스택)
+    앨범아트 디코딩은 cover_images 작업 스레드에서 하고 ui_bus로 돌아와 표시한다
     """
 
     ART_SIZE = 180
 
-    def __init__(self, parent, **kwargs):
+    def __init__(self, parent, ui_bus: "UIUpdateBus", **kwargs):
         super().__init__(parent, style="Card.TFrame", **kwargs)
+        self._ui_bus = ui_bus
         self._photo_ref = None
+        self._cover_ref: Optional[str] = None      # 표시하려는 커버 (늦게 온 결과 거르기용)
         self._build()
 
     def _build(self):
@@ -73,15 +72,29 @@ class AlbumInfoPanel(ttk.Frame):
         self._track_count_var = tk.StringVar(value="—")
         ttk.Label(badge_frame, textvariable=self._track_count_var, style="Sub.TLabel").pack(side="left")
 
-    def load_album(self, album: AlbumInfo):
+    def load_album(self, album: AlbumInfo, cover_pending: bool = False):
+        """cover_pending: 앨범아트가 아직 다운로드 중이면 True (도착 시 set_cover 호출)"""
         self._info_vars["album_name"].set(album.album_name or "—")
         self._info_vars["album_artist"].set(album.album_artist or "—")
         self._info_vars["genre"].set(album.genre or "—")
         self._info_vars["release_date"].set(album.release_date or "—")
         self._track_count_var.set(f"{len(album.tracks)}곡")
-        if album.cover_data and PIL_AVAILABLE and Image is not None and ImageTk is not None:
-            self._load_cover(album.cover_data)
+        if cover_pending and not album.cover_ref:
+            self._cover_ref = None
+            self._art_label.config(text="앨범아트\n받는 중...", image="")
+        else:
+            self.set_cover(album)
+
+    def set_cover(self, album: AlbumInfo):
+        data = album.cover_data
+        prev, self._cover_ref = self._cover_ref, album.cover_ref if data else None
+        if data and PIL_AVAILABLE and cover_images.available:
+            if prev != self._cover_ref:
+                self._art_label.config(text="앨범아트\n여는 중...", image="")
+            cover_images.request(album.cover_ref, data, self.ART_SIZE, self._ui_bus.post,
+                                 lambda photo, ref=album.cover_ref: self._on_cover(ref, photo))
         else:
+            self._photo_ref = None
             self._art_label.config(text="앨범아트\n없음", image="")
 
     def clear(self):
@@ -90,9 +103,13 @@ class AlbumInfoPanel(ttk.Frame):
         self._track_count_var.set("—")
         self._art_label.config(text="앨범아트\n없음", image="")
         self._photo_ref = None
+        self._cover_ref = None
 
-    def _load_cover(self, data: bytes):
-        img = Image.open(BytesIO(data))
-        img = img.resize((self.ART_SIZE, self.ART_SIZE), Image.LANCZOS)
-        self._photo_ref = ImageTk.PhotoImage(img)
-        self._art_label.config(image=self._photo_ref, text="")
+    def _on_cover(self, ref: str, photo):
+        if ref != self._cover_ref:
+            return                      # 그 사이 다른 앨범으로 바뀜
+        self._photo_ref = photo
+        if photo is None:
+            self._art_label.config(text="앨범아트\n없음", image="")
+        else:
+            self._art_label.config(image=photo, text="")
@@ -0,0 +1,254 @@
+"""
+커버 갤러리 탭 (앨범 캐시의 앨범아트를 격자로 보기)
+"""
+
+import math
+import threading
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from src.services import LibraryIndex, ThumbnailCache
+from src.services.library_index import AlbumSummary
+from src.services.thumbnail_cache import THUMB_SIZE
+from src.ui.theme import Theme, PIL_AVAILABLE
+from src.ui.widgets.status_bar import StatusBar
+from src.ui.update_bus import UIUpdateBus
+
+try:
+    from PIL import ImageTk
+except ImportError:
+    ImageTk = None
+
+
+class CoverGallery(ttk.Frame):
+    """
+    라이브러리 색인에 보관한 앨범을 커버 격자로 보여주는 탭. 더블클릭하면 다중 파일 탭에서 연다.
+
+    레이아웃:
+    ┌───────────────────────────────────────────────┐
+    │  커버 갤러리 (N개)          [검색.......] [새로고침] │
+    ├───────────────────────────────────────────────┤
+    │  ┌────┐ ┌────┐ ┌────┐ ┌────┐                 ▲ │
+    │  │    │ │    │ │    │ │    │   (Canvas)        │
+    │  └────┘ └────┘ └────┘ └────┘                 ▼ │
+    └───────────────────────────────────────────────┘
+
+    화면에 보이는 타일(+위아래 한 줄)만 Canvas 항목으로 만든다. 썸네일은 ThumbnailCache
+    작업 스레드가 디스크 캐시에서 읽거나 만들고, Tk 스레드는 PhotoImage만 만든다.
+    PhotoImage는 최근 것 PHOTO_CACHE개만 들고 있어 수천 개를 넘겨도 메모리가 일정하다.
+    """
+
+    PAD = 12
+    TILE_W = THUMB_SIZE + 24
+    TILE_H = THUMB_SIZE + 52
+    PHOTO_CACHE = 240
+    OVERSCAN_ROWS = 1
+
+    def __init__(self, parent, status_bar: "StatusBar", ui_bus: "UIUpdateBus",
+                 library: Optional[LibraryIndex],
+                 on_open: Optional[Callable[[str], None]] = None,
+                 thumbs: Optional[ThumbnailCache] = None, **kwargs):
+        super().__init__(parent, style="TFrame", **kwargs)
+        self._status_bar = status_bar
+        self._ui_bus = ui_bus
+        self._library = library
+        self._on_open = on_open
+        self._own_thumbs = thumbs is None
+        self._thumbs = thumbs or ThumbnailCache()
+        self._albums: List[AlbumSummary] = []
+        self._view: List[AlbumSummary] = []
+        self._cols = 1
+        self._tiles: Dict[int, Tuple[int, ...]] = {}          # view 인덱스 → Canvas 항목들
+        self._photos: "OrderedDict[str, ImageTk.PhotoImage]" = OrderedDict()
+        self._visible_refs: Set[str] = set()
+        self._failed: Set[str] = set()
+        self._render_pending = False
+        self._build()
+        # 탭을 열 때마다 목록을 다시 읽는다 (다른 탭에서 크롤링한 앨범 반영)
+        self.bind("<Map>", lambda _e: self.refresh())
+
+    def _build(self):
+        T = Theme
+
+        top = ttk.Frame(self, style="Panel.TFrame")
+        top.pack(side="top", fill="x")
+        self._title_var = tk.StringVar(value="커버 갤러리")
+        ttk.Label(top, textvariable=self._title_var, background=T.PANEL).pack(side="left", padx=(12, 6), pady=8)
+        ttk.Button(top, text="새로고침", command=self.refresh, style="Accent.TButton").pack(
+            side="right", padx=(6, 12), pady=8,
+        )
+        self._filter_var = tk.StringVar()
+        self._filter_var.trace_add("write", lambda *_: self._apply_filter())
+        ttk.Entry(top, textvariable=self._filter_var, width=30).pack(side="right", pady=8)
+        ttk.Label(top, text="검색", background=T.PANEL).pack(side="right", padx=(0, 6), pady=8)
+
+        body = ttk.Frame(self, style="Card.TFrame")
+        body.pack(fill="both", expand=True, padx=8, pady=8)
+        self.canvas = tk.Canvas(body, bg=T.SURFACE, highlightthickness=0, yscrollincrement=24)
+        vsb = ttk.Scrollbar(body, orient="vertical", command=self._yview)
+        self.canvas.configure(yscrollcommand=vsb.set)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        vsb.grid(row=0, column=1, sticky="ns")
+        body.grid_rowconfigure(0, weight=1)
+        body.grid_columnconfigure(0, weight=1)
+
+        self.canvas.bind("<Configure>", lambda _e: self._layout())
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", lambda _e: self._scroll(-3))
+        self.canvas.bind("<Button-5>", lambda _e: self._scroll(3))
+        self.canvas.bind("<Double-Button-1>", self._on_double_click)
+
+    # ── 데이터 ────────────────────────────────
+    def stop(self):
+        """창을 닫을 때: 직접 만든 썸네일 작업 풀을 정리한다 (대기 중인 작업은 버림)"""
+        if self._own_thumbs:
+            self._thumbs.shutdown()
+
+    def refresh(self):
+        if self._library is None:
+            self._title_var.set("커버 갤러리 — 라이브러리 색인을 열 수 없습니다")
+            return
+        threading.Thread(target=self._load_worker, daemon=True).start()
+
+    def _load_worker(self):
+        try:
+            albums = self._library.album_summaries()
+        except Exception as exc:
+            self._ui_bus.post(self._status_bar.set_status, f"앨범 목록 읽기 실패: {exc}", "error")
+            return
+        self._ui_bus.post(self._on_loaded, albums, key="gallery_albums")
+
+    def _on_loaded(self, albums: List[AlbumSummary]):
+        self._albums = albums
+        self._apply_filter(keep_position=True)
+
+    def _apply_filter(self, keep_position: bool = False):
+        needle = self._filter_var.get().strip().lower()
+        if needle:
+            self._view = [a for a in self._albums
+                          if needle in a.album_name.lower() or needle in a.album_artist.lower()]
+        else:
+            self._view = list(self._albums)
+        self._title_var.set(f"커버 갤러리 ({len(self._view)}/{len(self._albums)})")
+        if not keep_position:
+            self.canvas.yview_moveto(0)
+        self._layout()
+
+    # ── 배치·그리기 ───────────────────────────
+    def _layout(self):
+        width = max(1, self.canvas.winfo_width())
+        self._cols = max(1, (width - self.PAD) // self.TILE_W)
+        rows = math.ceil(len(self._view) / self._cols)
+        self.canvas.configure(scrollregion=(0, 0, width, rows * self.TILE_H + self.PAD))
+        self.canvas.delete("tile")
+        self._tiles.clear()
+        self._render()
+
+    def _yview(self, *args):
+        self.canvas.yview(*args)
+        self._schedule_render()
+
+    def _scroll(self, units: int):
+        self.canvas.yview_scroll(units, "units")
+        self._schedule_render()
+
+    def _on_wheel(self, event):
+        self._scroll(-3 if event.delta > 0 else 3)
+
+    def _schedule_render(self):
+        # 스크롤 이벤트가 몰려도 유휴 시점에 한 번만 다시 그린다
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render)
+
+    def _visible_range(self) -> range:
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first_row = max(0, int(top // self.TILE_H) - self.OVERSCAN_ROWS)
+        last_row = int(bottom // self.TILE_H) + self.OVERSCAN_ROWS
+        return range(first_row * self._cols, min(len(self._view), (last_row + 1) * self._cols))
+
+    def _render(self):
+        self._render_pending = False
+        visible = self._visible_range()
+        for index in [i for i in self._tiles if i not in visible]:
+            for item in self._tiles.pop(index):
+                self.canvas.delete(item)
+        self._visible_refs = {self._view[i].cover_ref for i in visible if self._view[i].cover_ref}
+        for index in visible:
+            if index not in self._tiles:
+                self._tiles[index] = self._draw_tile(index)
+
+    def _draw_tile(self, index: int) -> Tuple[int, ...]:
+        T = Theme
+        album = self._view[index]
+        row, col = divmod(index, self._cols)
+        x = self.PAD + col * self.TILE_W + self.TILE_W // 2
+        y = self.PAD + row * self.TILE_H
+        half = THUMB_SIZE // 2
+        c = self.canvas
+        items = [
+            c.create_rectangle(x - half, y, x + half, y + THUMB_SIZE, fill=T.PANEL, outline="", tags="tile"),
+            c.create_image(x, y + half, tags="tile"),
+            c.create_text(x, y + THUMB_SIZE + 8, text=_clip(album.album_name, 18), fill=T.TEXT,
+                          font=T.FONT_KR_SM, anchor="n", tags="tile"),
+            c.create_text(x, y + THUMB_SIZE + 26, text=_clip(album.album_artist, 20), fill=T.TEXT_SUB,
+                          font=T.FONT_KR_SM, anchor="n", tags="tile"),
+        ]
+        ref = album.cover_ref
+        photo = self._photos.get(ref) if ref else None
+        if photo is not None:
+            self._photos.move_to_end(ref)
+            c.itemconfigure(items[1], image=photo)
+        elif not ref or ref in self._failed or not (PIL_AVAILABLE and ImageTk and self._thumbs.available):
+            items.append(c.create_text(x, y + half, text="커버 없음", fill=T.TEXT_DIM,
+                                       font=T.FONT_KR_SM, tags="tile"))
+        else:
+            album_id = album.album_id
+            self._thumbs.request(
+                ref,
+                source=lambda: self._library.album_cover(album_id),
+                callback=self._thumb_ready,
+                wanted=lambda r: r in self._visible_refs,
+            )
+        return tuple(items)
+
+    def _thumb_ready(self, ref: str, img):
+        """작업 스레드에서 호출 → Tk 스레드로 넘긴다"""
+        self._ui_bus.post(self._on_thumb, ref, img, key=("thumb", ref))
+
+    def _on_thumb(self, ref: str, img):
+        if img is None:
+            # 커버를 읽을 수 없음 → 해당 타일을 "커버 없음"으로 다시 그린다
+            self._failed.add(ref)
+            for index in [i for i in self._tiles if self._view[i].cover_ref == ref]:
+                for item in self._tiles.pop(index):
+                    self.canvas.delete(item)
+            self._render()
+            return
+        photo = ImageTk.PhotoImage(img)
+        self._photos[ref] = photo
+        while len(self._photos) > self.PHOTO_CACHE:
+            oldest = next(iter(self._photos))
+            if oldest in self._visible_refs:
+                break
+            self._photos.popitem(last=False)
+        for index, items in self._tiles.items():
+            if self._view[index].cover_ref == ref:
+                self.canvas.itemconfigure(items[1], image=photo)
+
+    # ── 열기 ──────────────────────────────────
+    def _on_double_click(self, event):
+        col = int((event.x - self.PAD) // self.TILE_W)
+        row = int((self.canvas.canvasy(event.y) - self.PAD) // self.TILE_H)
+        index = row * self._cols + col
+        if 0 <= col < self._cols and 0 <= index < len(self._view) and self._on_open:
+            album = self._view[index]
+            self._on_open(album.album_id)
+            self._status_bar.set_status(f"앨범 여는 중 — {album.album_name}", "info")
+
+
+def _clip(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[:limit - 1] + "…"
@@ -0,0 +1,166 @@
+"""
+진단 탭 (단계별 소요 시간·바이트·실패 집계 + 텔레메트리 내보내기)
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from pathlib import Path
+
+from src.services.telemetry import STAGES, telemetry
+from src.ui.theme import Theme
+from src.ui.widgets.status_bar import StatusBar
+
+
+class DiagnosticsTab(ttk.Frame):
+    """
+    텔레메트리 스팬 요약을 보여주는 탭.
+
+    레이아웃:
+    ┌───────────────────────────────────────────────┐
+    │  [새로고침] [JSONL 내보내기] [Prometheus] [초기화] │
+    ├───────────────────────────────────────────────┤
+    │  단계 │ 횟수 │ 실패 │ 미스 │ 평균 │ p95 │ 바이트 │
+    ├───────────────────────────────────────────────┤
+    │  앨범별 소요 시간                               │
+    ├───────────────────────────────────────────────┤
+    │  최근 오류                                      │
+    └───────────────────────────────────────────────┘
+    """
+
+    REFRESH_MS = 2000
+
+    STAGE_COLS = {
+        "stage":  {"width": 120, "anchor": "w",      "label": "단계"},
+        "count":  {"width": 60,  "anchor": "e",      "label": "횟수"},
+        "errors": {"width": 60,  "anchor": "e",      "label": "실패"},
+        "misses": {"width": 60,  "anchor": "e",      "label": "미스"},
+        "mean":   {"width": 80,  "anchor": "e",      "label": "평균(ms)"},
+        "p95":    {"width": 80,  "anchor": "e",      "label": "p95(ms)"},
+        "total":  {"width": 90,  "anchor": "e",      "label": "합계(ms)"},
+        "bytes":  {"width": 100, "anchor": "e",      "label": "바이트"},
+    }
+
+    def __init__(self, parent, status_bar: "StatusBar", **kwargs):
+        super().__init__(parent, style="TFrame", **kwargs)
+        self._status_bar = status_bar
+        self._build()
+        self._schedule_refresh()
+
+    def _build(self):
+        T = Theme
+
+        btn_row = ttk.Frame(self, style="Panel.TFrame")
+        btn_row.pack(side="top", fill="x")
+        buttons = [
+            ("새로고침",            self.refresh,             "Accent.TButton"),
+            ("JSONL 내보내기",      self._export_jsonl,       "TButton"),
+            ("Prometheus 내보내기", self._export_prometheus,  "TButton"),
+            ("초기화",              self._clear,              "Danger.TButton"),
+        ]
+        for text, cmd, style_name in buttons:
+            ttk.Button(btn_row, text=text, command=cmd, style=style_name).pack(
+                side="left", padx=(12 if text == "새로고침" else 0, 6), pady=8,
+            )
+
+        body = ttk.PanedWindow(self, orient="vertical")
+        body.pack(fill="both", expand=True, padx=8, pady=8)
+
+        # 단계별 요약
+        stage_card = ttk.Frame(body, style="Card.TFrame")
+        ttk.Label(stage_card, text="단계별 요약", style="Header.TLabel", background=T.SURFACE).pack(anchor="w", padx=12, pady=(10, 6))
+        self.stage_tree = ttk.Treeview(stage_card, columns=list(self.STAGE_COLS), show="headings", height=8)
+        for col_id, cfg in self.STAGE_COLS.items():
+            self.stage_tree.heading(col_id, text=cfg["label"], anchor=cfg["anchor"])
+            self.stage_tree.column(col_id, width=cfg["width"], anchor=cfg["anchor"], stretch=(col_id == "stage"))
+        self.stage_tree.tag_configure("error", foreground=T.ERROR)
+        self.stage_tree.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        body.add(stage_card, weight=2)
+
+        # 앨범별 소요 시간
+        album_card = ttk.Frame(body, style="Card.TFrame")
+        ttk.Label(album_card, text="앨범별 소요 시간 (ms)", style="Header.TLabel", background=T.SURFACE).pack(anchor="w", padx=12, pady=(10, 6))
+        album_cols = ["album"] + list(STAGES)
+        self.album_tree = ttk.Treeview(album_card, columns=album_cols, show="headings", height=6)
+        self.album_tree.heading("album", text="앨범", anchor="w")
+        self.album_tree.column("album", width=180, anchor="w", stretch=True)
+        for stage in STAGES:
+            self.album_tree.heading(stage, text=stage, anchor="e")
+            self.album_tree.column(stage, width=90, anchor="e", stretch=False)
+        self.album_tree.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        body.add(album_card, weight=1)
+
+        # 최근 오류
+        err_card = ttk.Frame(body, style="Card.TFrame")
+        ttk.Label(err_card, text="최근 오류", style="Header.TLabel", background=T.SURFACE).pack(anchor="w", padx=12, pady=(10, 6))
+        self._error_text = tk.Text(
+            err_card, bg=T.ENTRY_BG, fg=T.ERROR, font=T.FONT_MONO,
+            relief="flat", height=6, state="disabled", wrap="none",
+        )
+        self._error_text.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        body.add(err_card, weight=1)
+
+    # ── 갱신 ──────────────────────────────────
+    def _schedule_refresh(self):
+        # 보이는 동안만 주기적으로 다시 그린다
+        if self.winfo_ismapped():
+            self.refresh()
+        self.after(self.REFRESH_MS, self._schedule_refresh)
+
+    def refresh(self):
+        summary = telemetry.summary()
+        order = [s for s in STAGES if s in summary] + sorted(s for s in summary if s not in STAGES)
+
+        self.stage_tree.delete(*self.stage_tree.get_children())
+        for stage in order:
+            s = summary[stage]
+            self.stage_tree.insert("", "end", values=(
+                stage, s["count"], s["errors"], s["misses"],
+                f"{s['mean_ms']:.1f}", f"{s['p95_ms']:.1f}",
+                f"{s['total_ms']:.0f}", f"{s['bytes']:,}",
+            ), tags=("error",) if s["errors"] else ())
+
+        self.album_tree.delete(*self.album_tree.get_children())
+        for album, stages in sorted(telemetry.by_attr("album").items()):
+            vals = [album] + [f"{stages.get(st, 0):.0f}" if st in stages else "" for st in STAGES]
+            self.album_tree.insert("", "end", values=vals)
+
+        errors = [sp for sp in telemetry.spans() if sp.outcome == "error"][-50:]
+        self._error_text.configure(state="normal")
+        self._error_text.delete("1.0", "end")
+        for sp in reversed(errors):
+            target = sp.attrs.get("file") or sp.attrs.get("url") or ""
+            self._error_text.insert("end", f"[{sp.stage}] {target}  {sp.error}\n")
+        self._error_text.configure(state="disabled")
+
+    # ── 내보내기 ──────────────────────────────
+    def _export_jsonl(self):
+        path = filedialog.asksaveasfilename(
+            parent=self, defaultextension=".jsonl",
+            initialfile="telemetry.jsonl",
+            filetypes=[("JSON lines", "*.jsonl"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            n = telemetry.export_jsonl(Path(path))
+            self._status_bar.set_status(f"스팬 {n}개 내보냄 — {path}", "success")
+        except OSError as exc:
+            messagebox.showerror("내보내기 오류", str(exc))
+
+    def _export_prometheus(self):
+        path = filedialog.asksaveasfilename(
+            parent=self, defaultextension=".prom",
+            initialfile="mp3tagger.prom",
+            filetypes=[("Prometheus text", "*.prom"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            telemetry.export_prometheus(Path(path))
+            self._status_bar.set_status(f"메트릭 내보냄 — {path}", "success")
+        except OSError as exc:
+            messagebox.showerror("내보내기 오류", str(exc))
+
+    def _clear(self):
+        telemetry.clear()
+        self.refresh()
@@ -0,0 +1,247 @@
+"""
+라이브러리 탭 (태그의 멜론 ID로 폴더 전체 메타데이터 새로 고침, 같은 음원 중복 찾기)
+"""
+
+import os
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from pathlib import Path
+from typing import List, Optional
+
+from src.api import MelonCrawler
+from src.services import LibraryIndex, LibraryRefresher, MP3Handler, RefreshResult
+from src.services.library_index import LibraryFile
+from src.services.library_refresh import AlbumRefresh, RefreshProgress
+from src.ui.theme import Theme
+from src.ui.widgets.status_bar import StatusBar
+from src.ui.update_bus import UIUpdateBus
+
+
+class LibraryTab(ttk.Frame):
+    """
+    이미 태깅한 라이브러리를 albumId별로 다시 가져와 바뀐 파일만 다시 기록하는 탭.
+
+    레이아웃:
+    ┌───────────────────────────────────────────────┐
+    │  폴더 [.......] [폴더 선택] [새로 고침] [중복 찾기] [취소] │
+    ├───────────────────────────────────────────────┤
+    │  albumId │ 앨범 │ 파일 │ 갱신 │ 캐시 │ 오류       │
+    ├───────────────────────────────────────────────┤
+    │  중복 파일 (오디오가 같은 묶음)                  │
+    └───────────────────────────────────────────────┘
+    """
+
+    COLS = {
+        "album_id": {"width": 100, "anchor": "w", "label": "albumId"},
+        "album":    {"width": 260, "anchor": "w", "label": "앨범"},
+        "files":    {"width": 60,  "anchor": "e", "label": "파일"},
+        "updated":  {"width": 60,  "anchor": "e", "label": "갱신"},
+        "cached":   {"width": 60,  "anchor": "center", "label": "캐시"},
+        "error":    {"width": 260, "anchor": "w", "label": "오류"},
+    }
+
+    def __init__(self, parent, status_bar: "StatusBar", ui_bus: "UIUpdateBus",
+                 library: Optional[LibraryIndex], **kwargs):
+        super().__init__(parent, style="TFrame", **kwargs)
+        self._status_bar = status_bar
+        self._ui_bus = ui_bus
+        self._library = library
+        self._cancel: Optional[threading.Event] = None
+        self._build()
+
+    def _build(self):
+        T = Theme
+
+        row = ttk.Frame(self, style="Panel.TFrame")
+        row.pack(side="top", fill="x")
+        ttk.Label(row, text="폴더", background=T.PANEL).pack(side="left", padx=(12, 6), pady=8)
+        self._root_var = tk.StringVar()
+        ttk.Entry(row, textvariable=self._root_var).pack(side="left", fill="x", expand=True, pady=8)
+        ttk.Button(row, text="폴더 선택", command=self._choose_root, style="TButton").pack(
+            side="left", padx=(6, 0), pady=8,
+        )
+        self._run_btn = ttk.Button(row, text="새로 고침", command=self._start, style="Accent.TButton")
+        self._run_btn.pack(side="left", padx=(6, 0), pady=8)
+        self._dupes_btn = ttk.Button(row, text="중복 찾기", command=self._find_duplicates, style="TButton")
+        self._dupes_btn.pack(side="left", padx=(6, 0), pady=8)
+        self._cancel_btn = ttk.Button(row, text="취소", command=self._stop, style="Danger.TButton",
+                                      state="disabled")
+        self._cancel_btn.pack(side="left", padx=(6, 0), pady=8)
+        self._backup_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(row, text="원본 백업", variable=self._backup_var).pack(side="left", padx=(6, 12), pady=8)
+
+        body = ttk.PanedWindow(self, orient="vertical")
+        body.pack(fill="both", expand=True, padx=8, pady=8)
+
+        card = ttk.Frame(body, style="Card.TFrame")
+        ttk.Label(card, text="앨범별 결과", style="Header.TLabel", background=T.SURFACE).pack(anchor="w", padx=12, pady=(10, 6))
+        self.tree = ttk.Treeview(card, columns=list(self.COLS), show="headings")
+        for col_id, cfg in self.COLS.items():
+            self.tree.heading(col_id, text=cfg["label"], anchor=cfg["anchor"])
+            self.tree.column(col_id, width=cfg["width"], anchor=cfg["anchor"],
+                             stretch=col_id in ("album", "error"))
+        self.tree.tag_configure("error", foreground=T.ERROR)
+        self.tree.tag_configure("updated", foreground=T.SUCCESS)
+        self.tree.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        body.add(card, weight=2)
+
+        # 같은 음원 묶음 (묶음 행 아래에 파일 행, 멜론 ID가 있는 파일이 먼저)
+        dupes_card = ttk.Frame(body, style="Card.TFrame")
+        ttk.Label(dupes_card, text="중복 파일 (오디오가 같은 묶음)", style="Header.TLabel", background=T.SURFACE).pack(anchor="w", padx=12, pady=(10, 6))
+        self.dupes_tree = ttk.Treeview(dupes_card, columns=("song_id", "size"), show="tree headings", height=6)
+        self.dupes_tree.heading("#0", text="파일", anchor="w")
+        self.dupes_tree.heading("song_id", text="songId", anchor="w")
+        self.dupes_tree.heading("size", text="크기", anchor="e")
+        self.dupes_tree.column("#0", width=480, anchor="w", stretch=True)
+        self.dupes_tree.column("song_id", width=100, anchor="w", stretch=False)
+        self.dupes_tree.column("size", width=90, anchor="e", stretch=False)
+        self.dupes_tree.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        body.add(dupes_card, weight=1)
+
+    # ── 실행 ──────────────────────────────────
+    def _choose_root(self):
+        path = filedialog.askdirectory(parent=self, mustexist=True)
+        if path:
+            self._root_var.set(path)
+
+    def _selected_root(self) -> Optional[Path]:
+        if self._cancel is not None:
+            return None
+        if self._library is None:
+            messagebox.showerror("라이브러리", "라이브러리 색인을 열 수 없습니다.")
+            return None
+        root = self._root_var.get().strip()
+        if not root or not Path(root).is_dir():
+            messagebox.showwarning("라이브러리", "폴더를 선택하세요.")
+            return None
+        return Path(root)
+
+    def _set_busy(self, busy: bool, cancellable: bool = True):
+        self._cancel = threading.Event() if busy else None
+        for btn in (self._run_btn, self._dupes_btn):
+            btn.configure(state="disabled" if busy else "normal")
+        self._cancel_btn.configure(state="normal" if busy and cancellable else "disabled")
+
+    def _start(self):
+        root = self._selected_root()
+        if root is None:
+            return
+        self.tree.delete(*self.tree.get_children())
+        self._set_busy(True)
+        self._status_bar.reset_progress()
+        self._status_bar.set_status("라이브러리 색인 중...", "info")
+        threading.Thread(
+            target=self._worker, args=(root, self._cancel, self._backup_var.get()), daemon=True,
+        ).start()
+
+    def _find_duplicates(self):
+        root = self._selected_root()
+        if root is None:
+            return
+        self.dupes_tree.delete(*self.dupes_tree.get_children())
+        self._set_busy(True, cancellable=False)
+        self._status_bar.set_status("색인·오디오 해시 계산 중...", "info")
+        threading.Thread(target=self._dupes_worker, args=(root,), daemon=True).start()
+
+    def _dupes_worker(self, root: Path):
+        try:
+            self._library.scan(root, MP3Handler())
+            groups = self._library.duplicates(root)
+        except Exception as exc:
+            self._ui_bus.post(self._on_dupes_done, [], str(exc))
+            return
+        self._ui_bus.post(self._on_dupes_done, groups, None)
+
+    def _on_dupes_done(self, groups: List[List[LibraryFile]], error: Optional[str]):
+        self._set_busy(False)
+        if error:
+            self._status_bar.set_status(f"중복 찾기 실패: {error}", "error")
+            return
+        for group in groups:
+            head = group[0]
+            parent = self.dupes_tree.insert(
+                "", "end", text=f"{os.path.basename(head.path)} 외 {len(group) - 1}개", open=True,
+                values=(head.song_id, ""),
+            )
+            for f in group:
+                self.dupes_tree.insert(parent, "end", text=f.path, values=(f.song_id, f"{f.size:,}"))
+        extra = sum(len(g) - 1 for g in groups)
+        self._status_bar.set_status(
+            f"중복 묶음 {len(groups)}개 (여분 {extra}개) — 새로 고침 시 ID 없는 사본은 태그를 복사",
+            "success" if not groups else "warning",
+        )
+
+    def _stop(self):
+        if self._cancel is not None:
+            self._cancel.set()
+            self._status_bar.set_status("취소하는 중... (진행 중인 앨범은 끝까지 처리)", "warning")
+
+    def _confirm_write(self, cancel: threading.Event, files: int, albums: int) -> bool:
+        """워커 스레드에서 호출: Tk 스레드에서 기록 여부를 묻고 답을 기다린다"""
+        answer = threading.Event()
+        ok = []
+
+        def ask():
+            if messagebox.askyesno(
+                "라이브러리 새로 고침",
+                f"앨범 {albums}개 · 파일 {files}개의 태그를 멜론 정보로 다시 확인해 바뀐 파일에 기록합니다.\n"
+                "ID가 없는 중복 사본은 같은 음원 파일의 태그로 덮어씁니다.\n\n계속할까요?",
+                parent=self,
+            ):
+                ok.append(True)
+            answer.set()
+
+        self._ui_bus.post(ask)
+        while not answer.wait(0.5):
+            if cancel.is_set():
+                return False
+        return bool(ok)
+
+    def _worker(self, root: Path, cancel: threading.Event, backup: bool):
+        bus = self._ui_bus
+        refresher = LibraryRefresher(self._library, MelonCrawler(), backup=backup)
+
+        def on_progress(p: RefreshProgress):
+            if p.album is not None:
+                bus.post(self._add_row, p.album)
+            bus.post(self._status_bar.set_progress, p.albums_done, p.albums_total, key="library_progress")
+            bus.post(
+                self._status_bar.set_status,
+                f"새로 고침 중... 앨범 {p.albums_done}/{p.albums_total} · 갱신 {p.files_updated}/{p.files_checked}",
+                "info", key="library_status",
+            )
+
+        try:
+            result = refresher.run(
+                root, on_progress, cancel,
+                confirm=lambda files, albums: self._confirm_write(cancel, files, albums),
+            )
+        except Exception as exc:
+            bus.post(self._on_done, None, str(exc))
+            return
+        bus.post(self._on_done, result, None)
+
+    def _add_row(self, item: AlbumRefresh):
+        tags = ("error",) if item.error else ("updated",) if item.updated else ()
+        self.tree.insert("", "end", values=(
+            item.album_id, item.album_name, item.files, item.updated,
+            "예" if item.cached else "변경 없음" if item.unchanged else "", item.error,
+        ), tags=tags)
+
+    def _on_done(self, result: Optional[RefreshResult], error: Optional[str]):
+        self._set_busy(False)
+        if result is None:
+            self._status_bar.set_status(f"새로 고침 실패: {error}", "error")
+            return
+        msg = f"앨범 {len(result.albums)}개 · 파일 {result.files}개 중 {result.updated}개 갱신"
+        if result.adopted:
+            msg += f", 중복 사본에서 태그 복사 {result.adopted}개"
+        if result.unidentified:
+            msg += f" (ID 없음 {result.unidentified})"
+        if result.cancelled:
+            self._status_bar.set_status(f"취소됨 — {msg}", "warning")
+        elif result.errors:
+            self._status_bar.set_status(f"{msg}, 오류 {len(result.errors)}건", "warning")
+        else:
+            self._status_bar.set_status(msg, "success")
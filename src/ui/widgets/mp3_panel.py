@@ -2,6 +2,7 @@
 MP3 파일 목록 패널 (Treeview + 파일/폴더 추가, 자동 매칭)
 """
 
+import itertools
 import re
 import subprocess
 from pathlib import Path
@@ -9,7 +10,7 @@ from typing import Dict, List, Optional
 
 from tkinter import ttk
 
-from src.services import MP3Handler
+from src.services import FileEntry, MP3Handler
 from src.ui.theme import Theme, _get_default_dir, DND_AVAILABLE, DND_FILES
 from src.ui.widgets.file_dialog import CustomFileDialog
 
@@ -31,6 +32,8 @@ class MP3FilePanel(ttk.Frame):
         super().__init__(parent, style="Card.TFrame", **kwargs)
         self._on_files_changed = on_files_changed
         self._file_paths: Dict[str, str] = {}   # iid -> 절대경로
+        self._entries: Dict[str, FileEntry] = {}   # iid -> 추가 시점 stat + 읽은 태그 (세션 저장용)
+        self._next_id = 0
         self._last_dir: Path = _get_default_dir()   # 마지막 탐색 디렉토리
         self._build()
         self._setup_drag_drop()
@@ -154,11 +157,13 @@ class MP3FilePanel(ttk.Frame):
         for iid in self.tree.selection():
             self.tree.delete(iid)
             self._file_paths.pop(iid, None)
+            self._entries.pop(iid, None)
         self._notify_changed()
 
     def _clear_all(self):
         self.tree.delete(*self.tree.get_children())
         self._file_paths.clear()
+        self._entries.clear()
         self._notify_changed()
 
     def _auto_match(self):
@@ -169,22 +174,35 @@ class MP3FilePanel(ttk.Frame):
     def _add_path_list(self, paths: List[str]):
         handler = MP3Handler()
         existing = set(self._file_paths.values())
-        count = len(self.tree.get_children())
+        entries = []
 
-        for path in paths:
+        for path in _expand_dirs(paths):
             if path in existing:
                 continue
             p = Path(path)
             if not p.suffix.lower() == ".mp3":
                 continue
+            try:
+                entries.append(FileEntry.scan(str(p), handler))
+            except OSError:
+                continue
+            existing.add(str(p))
+
+        self._insert_entries(entries)
+        self._notify_changed()
 
-            meta = handler.read_metadata(str(p))
-            iid = f"mp3_{count}"
+    def _insert_entries(self, entries: List[FileEntry]) -> List[str]:
+        count = len(self.tree.get_children())
+        iids = []
+        for entry in entries:
+            meta = entry.meta
+            iid = f"mp3_{self._next_id}"
+            self._next_id += 1
             tag = "even" if count % 2 == 0 else "odd"
             self.tree.insert(
                 "", "end", iid=iid,
                 values=(
-                    p.name,
+                    Path(entry.path).name,
                     meta.get("track_number", ""),
                     meta.get("title", ""),
                     meta.get("artist", ""),
@@ -192,11 +210,11 @@ class MP3FilePanel(ttk.Frame):
                 ),
                 tags=(tag,),
             )
-            self._file_paths[iid] = str(p)
-            existing.add(str(p))
+            self._file_paths[iid] = entry.path
+            self._entries[iid] = entry
+            iids.append(iid)
             count += 1
-
-        self._notify_changed()
+        return iids
 
     def _notify_changed(self):
         if self._on_files_changed:
@@ -211,15 +229,16 @@ class MP3FilePanel(ttk.Frame):
             if iid in self._file_paths
         ]
 
-    def set_match_result(self, iid: str, track_number: int, status: str, status_type: str):
+    def set_match_result(self, iid: str, track_label: str, status: str, status_type: str):
         """
         파일 행의 매칭 결과를 갱신한다.
+        track_label: 표시할 트랙번호 (여러 장짜리 앨범은 "2-05")
         status_type: 'matched' | 'unmatched'
         """
         if not self.tree.exists(iid):
             return
         vals = list(self.tree.item(iid, "values"))
-        vals[1] = track_number
+        vals[1] = track_label
         vals[4] = status
         tags = [t for t in self.tree.item(iid, "tags")
                 if t not in ("matched", "unmatched", "applied")]
@@ -235,5 +254,48 @@ class MP3FilePanel(ttk.Frame):
     def get_iids(self) -> List[str]:
         return list(self.tree.get_children())
 
+    def get_entries(self) -> Dict[str, FileEntry]:
+        """세션 저장용: 목록 순서대로 iid → 파일 항목 (적용 여부 포함, 매칭은 호출 측이 채움)"""
+        out = {}
+        for iid in self.tree.get_children():
+            entry = self._entries.get(iid)
+            if entry is None:
+                continue
+            entry.applied = "applied" in self.tree.item(iid, "tags")
+            out[iid] = entry
+        return out
+
+    def restore_entries(self, entries: List[FileEntry]) -> List[str]:
+        """이미 읽어 둔 태그로 행을 채운다 (파일을 다시 읽지 않음). 반환: 새 iid 목록"""
+        self.tree.delete(*self.tree.get_children())
+        self._file_paths.clear()
+        self._entries.clear()
+        return self._insert_entries(entries)
+
     def get_path_by_iid(self, iid: str) -> Optional[str]:
         return self._file_paths.get(iid)
+
+    def update_path(self, iid: str, new_path: str):
+        """파일명 변경 후 행의 경로/파일명 컬럼을 갱신한다."""
+        if iid not in self._file_paths or not self.tree.exists(iid):
+            return
+        self._file_paths[iid] = new_path
+        if iid in self._entries:
+            self._entries[iid].path = new_path
+        vals = list(self.tree.item(iid, "values"))
+        vals[0] = Path(new_path).name
+        self.tree.item(iid, values=vals)
+
+
+def _expand_dirs(paths: List[str]) -> List[str]:
+    """폴더는 안의 MP3와 바로 아래 디스크 폴더(CD1, CD2 …)의 MP3로 펼친다"""
+    out = []
+    for path in paths:
+        p = Path(path)
+        if not p.is_dir():
+            out.append(path)
+            continue
+        found = [f for f in itertools.chain(p.glob("*"), p.glob("*/*"))
+                 if f.suffix.lower() == ".mp3" and f.is_file()]
+        out.extend(str(f) for f in sorted(found))
+    return out
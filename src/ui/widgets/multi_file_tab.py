@@ -2,17 +2,21 @@
 다중 파일 탭 (다수 MP3 일괄 메타데이터 변경)
 """
 
-import re
-import shutil
+import logging
+import sqlite3
 import threading
 import tkinter as tk
+from collections import Counter
+from dataclasses import replace
 from tkinter import ttk, messagebox
-from pathlib import Path
 from typing import Optional, Dict, List
 
-from src.models import AlbumInfo, TrackInfo
+from src.models import AlbumInfo, TrackInfo, TrackKey, track_label
 from src.api import MelonCrawler
-from src.services import MP3Handler
+from src.services import (
+    AlbumApplier, ApplyJournal, ApplyOptions, JournalJob, LibraryIndex, SessionSnapshot,
+    TrackMatcher,
+)
 from src.ui.theme import Theme
 from src.ui.widgets.album_panel import AlbumInfoPanel
 from src.ui.widgets.track_tree import TrackTreeview
@@ -20,6 +24,7 @@ from src.ui.widgets.mp3_panel import MP3FilePanel
 from src.ui.widgets.url_bar import UrlBar
 from src.ui.widgets.action_bar import ActionBar
 from src.ui.widgets.status_bar import StatusBar
+from src.ui.update_bus import UIUpdateBus
 
 class MultiFileTab(ttk.Frame):
     """
@@ -27,12 +32,35 @@ class MultiFileTab(ttk.Frame):
     기존 MainWindow의 레이아웃과 동일.
     """
 
-    def __init__(self, parent, status_bar: "StatusBar", **kwargs):
+    COVER_WAIT_S = 30
+    ALBUM_URL = "https://www.melon.com/album/detail.htm?albumId={}"
+    # 앨범 캐시를 크롤링 없이 쓰는 기간 (초). 더 오래된 앨범은 다시 크롤링한다
+    ALBUM_CACHE_MAX_AGE = 7 * 24 * 3600
+
+    def __init__(self, parent, status_bar: "StatusBar", ui_bus: "UIUpdateBus", **kwargs):
         super().__init__(parent, style="TFrame", **kwargs)
         self._status_bar = status_bar
+        self._ui_bus = ui_bus
+        self._applying = False
         self._album: Optional[AlbumInfo] = None
-        self._match_map: Dict[str, int] = {}
+        self._match_map: Dict[str, TrackKey] = {}      # 파일 iid → (디스크, 트랙)
+        self._crawl_cancel: Optional[threading.Event] = None
+        self._cover_ready = threading.Event()
+        self._cover_ready.set()
         self._stats = {"matched": 0, "total": 0, "applied": 0}
+        # 중단된 일괄 적용을 다음 실행에서 이어서 할 수 있게 파일별 진행을 기록
+        try:
+            self.journal: Optional[ApplyJournal] = ApplyJournal()
+        except (OSError, sqlite3.Error):
+            logging.getLogger(__name__).exception("apply journal unavailable")
+            self.journal = None
+        # 태그의 멜론 ID로 다시 불러온 폴더를 앨범 캐시·songId로 바로 식별
+        try:
+            self.library: Optional[LibraryIndex] = LibraryIndex()
+        except (OSError, sqlite3.Error):
+            logging.getLogger(__name__).exception("library index unavailable")
+            self.library = None
+        self._match_after_crawl = False
         self._build()
 
     def _build(self):
@@ -58,7 +86,7 @@ class MultiFileTab(ttk.Frame):
         # 상단 수평 PanedWindow
         top_pane = ttk.PanedWindow(outer_pane, orient="horizontal")
 
-        self.album_panel = AlbumInfoPanel(top_pane)
+        self.album_panel = AlbumInfoPanel(top_pane, ui_bus=self._ui_bus)
         top_pane.add(self.album_panel, weight=0)
         self.album_panel.configure(width=220)
 
@@ -91,21 +119,40 @@ class MultiFileTab(ttk.Frame):
         self.album_panel.clear()
         self.track_tree.clear()
 
+        # 이전 크롤링의 앨범아트 다운로드는 취소
+        if self._crawl_cancel is not None:
+            self._crawl_cancel.set()
+        self._crawl_cancel = threading.Event()
+        self._cover_ready = threading.Event()
         threading.Thread(
-            target=self._crawl_worker, args=(url,), daemon=True,
+            target=self._crawl_worker,
+            args=(url, self._crawl_cancel, self._cover_ready),
+            daemon=True,
         ).start()
 
-    def _crawl_worker(self, url: str):
+    def _crawl_worker(self, url: str, cancel: threading.Event, cover_ready: threading.Event):
+        def on_cover(album: AlbumInfo):
+            cover_ready.set()
+            self._ui_bus.post(self._on_cover_ready, album)
+            self._remember_album(album)
+
         try:
             crawler = MelonCrawler()
-            album = crawler.crawl_album(url)
-            self.after(0, self._on_crawl_success, album)
+            album = crawler.crawl_album(url, on_cover=on_cover, cancel=cancel)
+            if not cancel.is_set():
+                self._ui_bus.post(self._on_crawl_success, album)
         except Exception as exc:
-            self.after(0, self._on_crawl_error, str(exc))
+            cover_ready.set()
+            if not cancel.is_set():
+                self._ui_bus.post(self._on_crawl_error, str(exc))
+
+    def _on_cover_ready(self, album: AlbumInfo):
+        if album is self._album:
+            self.album_panel.set_cover(album)
 
     def _on_crawl_success(self, album: AlbumInfo):
         self._album = album
-        self.album_panel.load_album(album)
+        self.album_panel.load_album(album, cover_pending=not self._cover_ready.is_set())
         self.track_tree.load_tracks(album.tracks)
         self._status_bar.set_status(
             f"크롤링 완료 — {album.album_name} ({len(album.tracks)}곡)", "success"
@@ -113,6 +160,18 @@ class MultiFileTab(ttk.Frame):
         self._status_bar.set_progress(100)
         self.url_bar.set_enabled(True)
         self._update_stats()
+        if self._match_after_crawl:
+            self._match_after_crawl = False
+            self._auto_match()
+
+    def _remember_album(self, album: AlbumInfo):
+        """albumId로 다시 찾을 수 있게 앨범 캐시에 보관 (워커 스레드). 커버를 못 받은 앨범은 두지 않는다"""
+        if self.library is None or (album.cover_url and album.cover_data is None):
+            return
+        try:
+            self.library.put_album(album)
+        except sqlite3.Error:
+            logging.getLogger(__name__).exception("album cache write failed")
 
     def _on_crawl_error(self, msg: str):
         self._status_bar.set_status(f"크롤링 실패: {msg}", "error")
@@ -129,8 +188,86 @@ class MultiFileTab(ttk.Frame):
     def _on_files_changed(self, event: str):
         if event == "auto_match":
             self._auto_match()
+        elif event == "files_changed":
+            self._identify_from_tags()
         self._update_stats()
 
+    def _identify_from_tags(self):
+        """
+        이미 태깅된 파일(TXXX:MELON_ALBUM_ID)이 들어오면 그 앨범을 바로 불러온다.
+        캐시에 있으면 크롤링 없이, 없으면 albumId URL로 크롤링한 뒤 songId로 매칭.
+        """
+        if self.library is None or self._applying or self._album is not None:
+            return
+        entries = list(self.mp3_panel.get_entries().values())
+        ids = Counter(e.meta.get("melon_album_id") for e in entries if e.meta.get("melon_album_id"))
+        if not ids:
+            return
+        album_id = ids.most_common(1)[0][0]
+        threading.Thread(
+            target=self._identify_worker, args=(album_id, entries), daemon=True,
+        ).start()
+
+    def _identify_worker(self, album_id: str, entries: list):
+        try:
+            self.library.record(entries)
+            album = self._cached_album(album_id)
+        except sqlite3.Error:
+            logging.getLogger(__name__).exception("library lookup failed")
+            album = None
+        self._ui_bus.post(self._on_identified, album_id, album)
+
+    def open_album(self, album_id: str):
+        """커버 갤러리 등에서 고른 앨범 열기 (앨범 캐시에서, 없으면 크롤링). 현재 앨범은 바뀐다"""
+        if self.library is None or self._applying:
+            return
+        threading.Thread(target=self._open_worker, args=(album_id,), daemon=True).start()
+
+    def _open_worker(self, album_id: str):
+        try:
+            album = self._cached_album(album_id)
+        except sqlite3.Error:
+            logging.getLogger(__name__).exception("library lookup failed")
+            album = None
+        self._ui_bus.post(self._on_identified, album_id, album, True)
+
+    def _cached_album(self, album_id: str) -> Optional[AlbumInfo]:
+        """
+        앨범 캐시 (ALBUM_CACHE_MAX_AGE 이내, 워커 스레드). 커버 없이 보관된 앨범
+        (라이브러리 갱신 등)은 커버만 받아 붙이고, 받지 못하면 None → 크롤링한다
+        """
+        album = self.library.get_album(album_id, self.ALBUM_CACHE_MAX_AGE)
+        if album is None or not album.cover_url or album.cover_data is not None:
+            return album
+        data = MelonCrawler().fetch_cover(album)
+        if not data:
+            return None
+        album.cover_data = data
+        self._remember_album(album)
+        return album
+
+    def _on_identified(self, album_id: str, album: Optional[AlbumInfo], force: bool = False):
+        """force: 이미 앨범이 열려 있어도 바꾼다 (커버 갤러리에서 열기)"""
+        if (self._album is not None and not force) or self._applying:
+            return
+        url = self.ALBUM_URL.format(album_id)
+        self.url_bar.set_url(url)
+        has_files = bool(self.mp3_panel.get_iids())
+        if album is None:
+            self._match_after_crawl = has_files
+            self._start_crawl(url)
+            return
+        # 진행 중인 크롤링이 있으면 그 결과·커버가 덮어쓰지 않게 취소
+        if self._crawl_cancel is not None:
+            self._crawl_cancel.set()
+        self._cover_ready = threading.Event()
+        self._cover_ready.set()
+        self._on_crawl_success(album)
+        if has_files:
+            self._auto_match()
+        how = "앨범 캐시에서 열기" if force else "태그의 멜론 ID로 앨범 식별"
+        self._status_bar.set_status(f"{how} — {album.album_name} (캐시)", "success")
+
     def _auto_match(self):
         """파일명 기반 자동 매칭 (트랙번호 추출)"""
         if not self._album:
@@ -141,47 +278,26 @@ class MultiFileTab(ttk.Frame):
         matched_count = 0
         iids = self.mp3_panel.get_iids()
         total = len(iids)
-
-        track_by_num = {t.track_number: t for t in self._album.tracks}
-        track_by_title = {t.title.lower(): t for t in self._album.tracks}
+        matcher = TrackMatcher(self._album.tracks)
+        multi_disc = self._album.multi_disc
+        entries = self.mp3_panel.get_entries()
 
         for iid in iids:
             path = self.mp3_panel.get_path_by_iid(iid)
             if not path:
                 continue
-            stem = Path(path).stem
-
-            # 파일명에서 트랙번호 추출 시도
-            m = re.match(r"^(\d+)[.\s_-]", stem)
-            if m:
-                num = int(m.group(1))
-                if num in track_by_num:
-                    self._match_map[iid] = num
-                    self.mp3_panel.set_match_result(iid, num, "매칭됨", "matched")
-                    self.track_tree.set_track_status(num, "매칭됨", "matched")
-                    matched_count += 1
-                    continue
-
-            # 제목 유사도 매칭
-            normalized = re.sub(r"[\s\-_\(\)\[\]]", "", stem).lower()
-            best_match = None
-            for title_lower, track in track_by_title.items():
-                norm_title = re.sub(r"[\s\-_\(\)\[\]]", "", title_lower)
-                if norm_title and norm_title in normalized:
-                    best_match = track
-                    break
-
-            if best_match:
-                self._match_map[iid] = best_match.track_number
+
+            entry = entries.get(iid)
+            track = matcher.match(path, entry.meta if entry else None)
+            if track:
+                self._match_map[iid] = track.key
                 self.mp3_panel.set_match_result(
-                    iid, best_match.track_number, "매칭됨", "matched"
-                )
-                self.track_tree.set_track_status(
-                    best_match.track_number, "매칭됨", "matched"
+                    iid, track_label(track.key, multi_disc), "매칭됨", "matched"
                 )
+                self.track_tree.set_track_status(track.key, "매칭됨", "matched")
                 matched_count += 1
             else:
-                self.mp3_panel.set_match_result(iid, 0, "미매칭", "unmatched")
+                self.mp3_panel.set_match_result(iid, "", "미매칭", "unmatched")
 
         self._status_bar.set_status(
             f"자동 매칭 완료 — {matched_count}/{total}개 매칭", "success"
@@ -215,47 +331,151 @@ class MultiFileTab(ttk.Frame):
         if not self._album:
             messagebox.showwarning("앨범 없음", "먼저 멜론 앨범을 크롤링해 주세요.")
             return
+        if self._applying:
+            return
 
         opts = self.action_bar.get_options()
-        handler = MP3Handler()
-        track_by_num = {t.track_number: t for t in self._album.tracks}
-        applied = 0
-        errors = []
+        if opts is None:
+            return
+        track_by_key = {t.key: t for t in self._album.tracks}
 
+        # Tk 위젯 접근은 메인 스레드에서 끝내고 워커에는 순수 데이터만 넘긴다
+        jobs = []
         for iid in iids:
-            track_num = self._match_map.get(iid)
-            if track_num is None:
+            key = self._match_map.get(iid)
+            if key is None:
                 continue
-            track = track_by_num.get(track_num)
+            track = track_by_key.get(key)
             if not track:
                 continue
             path = self.mp3_panel.get_path_by_iid(iid)
             if not path:
                 continue
+            jobs.append((iid, path, track))
 
-            try:
-                if opts["backup"]:
-                    backup_path = Path(path).with_suffix(".mp3.bak")
-                    if not backup_path.exists():
-                        shutil.copy2(path, backup_path)
-                handler.write_metadata(
-                    filepath=path,
-                    title=track.title,
-                    artist=track.artist,
-                    album=track.album,
-                    album_artist=track.album_artist,
-                    genre=track.genre,
-                    track_number=track.track_number,
-                    cover_data=self._album.cover_data if opts["include_cover"] else None,
-                )
-                self.mp3_panel.mark_applied(iid)
-                self.track_tree.set_track_status(track_num, "적용됨", "matched")
+        if not jobs:
+            return
+
+        # 앨범아트가 아직 오는 중이면 워커가 잠시 기다렸다가 넣는다
+        cover_wait = None
+        if opts["include_cover"] and self._album.cover_data is None:
+            cover_wait = (self._album, self._cover_ready)
+        options = ApplyOptions(
+            backup=opts["backup"],
+            cover_data=self._album.cover_data if opts["include_cover"] else None,
+            rename_template=opts["rename_template"],
+            write_lrc=opts["write_lrc"],
+            embed_lyrics=opts["embed_lyrics"],
+        )
+        self._start_apply(jobs, options, cover_wait)
+
+    def _start_apply(self, jobs: list, options: ApplyOptions, cover_wait=None, resume_job: int = None):
+        self._applying = True
+        self.action_bar.set_enabled(False)
+        self._status_bar.set_progress(0)
+        if options.write_lrc or options.embed_lyrics:
+            options.lyrics_fetcher = MelonCrawler().fetch_track_lyrics
+            self._status_bar.set_status(f"가사 가져오는 중... ({len(jobs)}곡)", "info")
+        else:
+            self._status_bar.set_status(f"적용 중... (0/{len(jobs)})", "info")
+        threading.Thread(
+            target=self._apply_worker,
+            args=(jobs, options, self._stats["applied"], cover_wait, resume_job),
+            daemon=True,
+        ).start()
+
+    def offer_resume(self, interrupted: List[JournalJob]):
+        """
+        지난 실행에서 중단된 적용 작업이 있으면 이어서 할지 묻는다.
+        가장 최근 작업만 제안하고, 그보다 오래된 작업은 정리한다.
+        """
+        if not interrupted or self.journal is None:
+            return
+        latest, stale = interrupted[0], interrupted[1:]
+        for job in stale:
+            self.journal.discard(job.id)
+        if self._applying:
+            return
+        done = len(latest.items) - latest.remaining
+        if not messagebox.askyesno(
+            "중단된 작업",
+            f"이전 실행에서 적용이 중단되었습니다 ({done}/{len(latest.items)}개 완료).\n"
+            "남은 파일에 이어서 적용할까요?",
+        ):
+            self.journal.discard(latest.id)
+            return
+        iid_by_path = {e.path: iid for iid, e in self.mp3_panel.get_entries().items()}
+        jobs = [(iid_by_path.get(path), path, track) for path, track in latest.items]
+        options = ApplyOptions(cover_data=latest.cover, **latest.options)
+        self._start_apply(jobs, options, resume_job=latest.id)
+
+    def _apply_worker(
+        self, jobs: list, options: ApplyOptions, applied_base: int,
+        cover_wait=None, resume_job: int = None,
+    ):
+        bus = self._ui_bus
+        if cover_wait is not None:
+            album, ready = cover_wait
+            ready.wait(self.COVER_WAIT_S)
+            options.cover_data = album.cover_data
+        iid_by_path = {path: iid for iid, path, _ in jobs}
+        items = [(path, track) for _, path, track in jobs]
+        applied = 0
+        written = []
+
+        def on_progress(done, total, path, track, error):
+            nonlocal applied
+            if error is None:
                 applied += 1
-            except Exception as exc:
-                errors.append(f"{Path(path).name}: {exc}")
+                written.append((path, track))
+                iid = iid_by_path[path]
+                if iid is not None:
+                    bus.post(self.mp3_panel.mark_applied, iid, key=("file_row", iid))
+                bus.post(
+                    self.track_tree.set_track_status,
+                    track.key, "적용됨", "matched",
+                    key=("track_row", track.key),
+                )
+                bus.post(self._set_applied, applied_base + applied, key="stats")
+            bus.post(self._status_bar.set_progress, done, total, key="progress")
+            bus.post(
+                self._status_bar.set_status,
+                f"적용 중... ({done}/{total})", "info",
+                key="status",
+            )
 
-        self._stats["applied"] += applied
+        try:
+            result = AlbumApplier(journal=self.journal).apply(items, options, on_progress, resume_job)
+        except Exception as exc:
+            # 저널 기록 실패 등 — 작업 전체가 멈춘 경우에도 UI는 풀어 준다
+            bus.post(self._on_apply_done, applied, [str(exc)])
+            return
+        for old_path, new_path in result.renamed.items():
+            iid = iid_by_path.get(old_path)
+            if iid is not None:
+                bus.post(self.mp3_panel.update_path, iid, new_path)
+        self._record_written(written, result.renamed)
+        bus.post(self._on_apply_done, result.applied, result.errors)
+
+    def _record_written(self, written: list, renamed: Dict[str, str]):
+        """기록한 멜론 ID를 색인에 반영 (워커 스레드)"""
+        if self.library is None:
+            return
+        try:
+            self.library.record_written(
+                (path, renamed.get(path, path), track.song_id, track.album_id)
+                for path, track in written
+            )
+        except sqlite3.Error:
+            logging.getLogger(__name__).exception("library index update failed")
+
+    def _set_applied(self, applied: int):
+        self._stats["applied"] = applied
         self._update_stats()
+
+    def _on_apply_done(self, applied: int, errors: List[str]):
+        self._applying = False
+        self.action_bar.set_enabled(True)
         self._status_bar.set_status(f"적용 완료 — {applied}개 파일 처리됨", "success")
         if errors:
             messagebox.showerror(
@@ -263,6 +483,56 @@ class MultiFileTab(ttk.Frame):
                 "다음 파일에서 오류가 발생했습니다:\n\n" + "\n".join(errors[:10]),
             )
 
+    # ─────────────────────────────────────────
+    # 세션 저장/복원
+    # ─────────────────────────────────────────
+    def session_snapshot(self) -> SessionSnapshot:
+        """현재 앨범·파일 목록·매칭 결과 (메인 스레드에서 호출, 저장은 다른 스레드 가능)"""
+        files = [
+            replace(entry, track_key=self._match_map.get(iid))
+            for iid, entry in self.mp3_panel.get_entries().items()
+        ]
+        return SessionSnapshot(
+            url=self.url_bar.get_url() if self._album else "",
+            album=self._album,
+            files=files,
+            applied=self._stats["applied"],
+        )
+
+    def restore_session(self, snap: SessionSnapshot) -> bool:
+        """
+        저장된 세션으로 탭을 채운다. 태그는 스냅샷 값을 그대로 쓴다.
+        사용자가 이미 작업을 시작했다면 덮어쓰지 않고 False.
+        """
+        if self._applying or self._album or self.mp3_panel.get_iids():
+            return False
+        if snap.album:
+            self._album = snap.album
+            self.url_bar.set_url(snap.url)
+            self.album_panel.load_album(snap.album)
+            self.track_tree.load_tracks(snap.album.tracks)
+        track_keys = {t.key for t in snap.album.tracks} if snap.album else set()
+        multi_disc = bool(snap.album and snap.album.multi_disc)
+
+        iids = self.mp3_panel.restore_entries(snap.files)
+        matched = 0
+        for iid, entry in zip(iids, snap.files):
+            key = entry.track_key
+            if key is None or key not in track_keys:
+                continue
+            self._match_map[iid] = key
+            matched += 1
+            self.mp3_panel.set_match_result(iid, track_label(key, multi_disc), "매칭됨", "matched")
+            if entry.applied:
+                self.mp3_panel.mark_applied(iid)
+                self.track_tree.set_track_status(key, "적용됨", "matched")
+            else:
+                self.track_tree.set_track_status(key, "매칭됨", "matched")
+
+        self._stats["applied"] = snap.applied
+        self._update_stats(matched=matched)
+        return True
+
     def _update_stats(self, matched: int = None, total: int = None):
         if matched is not None:
             self._stats["matched"] = matched
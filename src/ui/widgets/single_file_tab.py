@@ -7,22 +7,22 @@ import shutil
 import subprocess
 import threading
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import ttk, messagebox
 from pathlib import Path
-from typing import Optional, Dict
-from io import BytesIO
+from typing import Optional, Dict, Tuple
 
 from src.models import AlbumInfo, TrackInfo
 from src.api import MelonCrawler
-from src.services import MP3Handler
+from src.services import MP3Handler, RenamePlanner
+from src.services.lyrics_store import normalize_artist, normalize_key
+from src.ui.cover_images import cover_images
 from src.ui.theme import Theme, _get_default_dir, PIL_AVAILABLE, DND_AVAILABLE, DND_FILES
 from src.ui.widgets.file_dialog import CustomFileDialog
 from src.ui.widgets.status_bar import StatusBar
+from src.ui.update_bus import UIUpdateBus
 
-try:
-    from PIL import Image, ImageTk
-except ImportError:
-    Image = ImageTk = None
+_ALBUM_URL = re.compile(r"melon\.com/.*albumId=\d+")
 
 class SingleFileTab(ttk.Frame):
     """
@@ -41,18 +41,36 @@ class SingleFileTab(ttk.Frame):
     """
 
     ART_SIZE = 160
+    PREFETCH_DEBOUNCE_MS = 400
 
-    def __init__(self, parent, status_bar: "StatusBar", **kwargs):
+    # 추측 요청(앨범 미리 받기·가사 조기 조회)과 가사 동시 조회용
+    _prefetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="prefetch")
+
+    def __init__(self, parent, status_bar: "StatusBar", ui_bus: "UIUpdateBus", **kwargs):
         super().__init__(parent, style="TFrame", **kwargs)
         self._status_bar = status_bar
+        self._ui_bus = ui_bus
         self._mp3_path: Optional[str] = None
         self._album: Optional[AlbumInfo] = None
         self._matched_track: Optional[TrackInfo] = None
         self._lyrics: str = ""
         self._synced_lyrics: list = []
         self._photo_ref = None
+        self._cover_ref: Optional[str] = None
+        # 앨범아트는 목록보다 늦게 도착한다: 새 크롤링 시 이전 다운로드 취소
+        self._crawl_cancel: Optional[threading.Event] = None
+        self._cover_ready = threading.Event()
+        self._cover_ready.set()
+        self._apply_after_cover = False
+        # 추측 요청 상태: 디바운스 타이머, 마지막으로 미리 받은 URL, 조기 가사 조회
+        self._url_after: Optional[str] = None
+        self._search_after: Optional[str] = None
+        self._prefetched_url = ""
+        self._early_lyrics: Optional[Tuple[str, Future]] = None     # (검색어, Future[(아티스트, 싱크 가사)])
         self._build()
         self._setup_drag_drop()
+        self._url_var.trace_add("write", lambda *_: self._debounce("_url_after", self._prefetch_album))
+        self._search_var.trace_add("write", lambda *_: self._debounce("_search_after", self._prefetch_lyrics))
 
     def _build(self):
         T = Theme
@@ -340,6 +358,43 @@ class SingleFileTab(ttk.Frame):
         # 미리보기가 이미 로드된 상태면 적용 버튼 활성화
         if self._matched_track:
             self._apply_btn.configure(state="normal")
+        self._prefetch_lyrics()
+
+    # ── 추측 요청 (크롤링 버튼 전에 미리) ──────
+    def _debounce(self, attr: str, callback):
+        pending = getattr(self, attr)
+        if pending is not None:
+            self.after_cancel(pending)
+        setattr(self, attr, self.after(self.PREFETCH_DEBOUNCE_MS, lambda: self._fire(attr, callback)))
+
+    def _fire(self, attr: str, callback):
+        setattr(self, attr, None)
+        callback()
+
+    def _prefetch_album(self):
+        """유효한 앨범 URL이 입력되면 바로 받아 둔다 (크롤링 시 single-flight 캐시 적중)"""
+        url = self._url_var.get().strip()
+        if url == self._prefetched_url or not _ALBUM_URL.search(url):
+            return
+        self._prefetched_url = url
+        self._prefetch_pool.submit(self._warm_album, url)
+
+    @staticmethod
+    def _warm_album(url: str):
+        try:
+            MelonCrawler().crawl_album(url, on_cover=lambda album: None)
+        except Exception:
+            pass
+
+    def _prefetch_lyrics(self):
+        """검색어 + MP3의 기존 아티스트 태그로 lrclib 조회를 앨범 크롤링과 동시에 시작"""
+        search = self._search_var.get().strip()
+        if not search or not self._mp3_path:
+            self._early_lyrics = None
+            return
+        if self._early_lyrics and self._early_lyrics[0] == search:
+            return
+        self._early_lyrics = (search, self._prefetch_pool.submit(_early_lyrics_job, search, self._mp3_path))
 
     # ── 크롤링 ────────────────────────────────
     def _do_crawl(self):
@@ -359,17 +414,40 @@ class SingleFileTab(ttk.Frame):
         self._status_bar.set_progress(0)
         self._clear_preview()
 
+        if self._crawl_cancel is not None:
+            self._crawl_cancel.set()
+        self._crawl_cancel = threading.Event()
+        self._cover_ready = threading.Event()
         threading.Thread(
-            target=self._crawl_worker, args=(url, search), daemon=True,
+            target=self._crawl_worker,
+            args=(url, search, self._crawl_cancel, self._cover_ready),
+            daemon=True,
         ).start()
 
-    def _crawl_worker(self, url: str, search: str):
+    def _crawl_worker(self, url: str, search: str, cancel: threading.Event, cover_ready: threading.Event):
+        def on_cover(album: AlbumInfo):
+            cover_ready.set()
+            self._ui_bus.post(self._on_cover_ready, album)
+
         try:
             crawler = MelonCrawler()
-            album = crawler.crawl_album(url)
-            self.after(0, self._on_crawl_done, album, search)
+            album = crawler.crawl_album(url, on_cover=on_cover, cancel=cancel)
+            if not cancel.is_set():
+                self._ui_bus.post(self._on_crawl_done, album, search)
         except Exception as exc:
-            self.after(0, self._on_crawl_error, str(exc))
+            cover_ready.set()
+            if not cancel.is_set():
+                self._ui_bus.post(self._on_crawl_error, str(exc))
+
+    def _on_cover_ready(self, album: AlbumInfo):
+        if album is not self._album:
+            return
+        if self._matched_track:
+            self._show_cover(album)
+        if self._apply_after_cover:
+            self._apply_after_cover = False
+            self._apply_btn.configure(state="normal")
+            self._do_apply()
 
     def _on_crawl_done(self, album: AlbumInfo, search: str):
         self._album = album
@@ -397,13 +475,21 @@ class SingleFileTab(ttk.Frame):
         self._status_bar.set_status(f"'{track.title}' 매칭 완료", "success")
         self._status_bar.set_progress(100)
 
-        # 가사 비동기 로딩 시작 (일반 + 싱크)
+        # 가사 비동기 로딩 시작 (곡 상세 + 싱크 가사 동시)
         if track.song_id:
             self._lyrics_status_var.set("가사 로딩 중...")
             self._sync_status_var.set("")
+            pool = self._prefetch_pool
+            detail_f = pool.submit(MelonCrawler().crawl_song_detail, track.song_id)
+            early = self._early_lyrics
+            early_f = early[1] if early and normalize_key(early[0]) == normalize_key(track.title) else None
+            synced_f = None
+            if early_f is None or (early_f.done() and not early_f.exception() and not early_f.result()[1]):
+                early_f = None
+                synced_f = pool.submit(_synced_lyrics_job, track, self._mp3_path)
             threading.Thread(
                 target=self._fetch_lyrics_worker,
-                args=(track.song_id, track.title, track.artist, track.album),
+                args=(track, detail_f, early_f, synced_f, self._mp3_path),
                 daemon=True,
             ).start()
         else:
@@ -420,11 +506,25 @@ class SingleFileTab(ttk.Frame):
         )
 
     # ── 가사 로딩 ────────────────────────────
-    def _fetch_lyrics_worker(self, song_id: str, title: str, artist: str, album: str):
-        crawler = MelonCrawler()
-        detail = crawler.crawl_song_detail(song_id)
-        synced = crawler.fetch_synced_lyrics(title, artist, album)
-        self.after(0, self._on_lyrics_done, detail["lyrics"], synced, detail["genre"])
+    def _fetch_lyrics_worker(
+        self, track: TrackInfo, detail_f: Future, early_f: Optional[Future], synced_f: Optional[Future],
+        mp3_path: Optional[str] = None,
+    ):
+        synced = []
+        if early_f is not None:
+            # 조기 조회 결과는 아티스트가 같을 때만 채택, 아니면 정식 조회
+            try:
+                artist, synced = early_f.result()
+                if normalize_artist(artist) != normalize_artist(track.artist):
+                    synced = []
+            except Exception:
+                synced = []
+            if not synced:
+                synced = _synced_lyrics_job(track, mp3_path)
+        elif synced_f is not None:
+            synced = synced_f.result()
+        detail = detail_f.result()
+        self._ui_bus.post(self._on_lyrics_done, detail["lyrics"], synced, detail["genre"])
 
     def _on_lyrics_done(self, lyrics: str, synced: list, genre: str):
         # 멜론 가사가 없고 LRCLIB 싱크 가사가 있으면 LRC에서 plain 텍스트 추출
@@ -486,21 +586,39 @@ class SingleFileTab(ttk.Frame):
         self._meta_vars["release_date"].set(album.release_date or "—")
         self._meta_vars["track_number"].set(str(track.track_number))
         self._meta_vars["disc_number"].set(str(track.disc_number))
-
-        if album.cover_data and PIL_AVAILABLE:
-            img = Image.open(BytesIO(album.cover_data))
-            img = img.resize((self.ART_SIZE, self.ART_SIZE), Image.LANCZOS)
-            self._photo_ref = ImageTk.PhotoImage(img)
-            self._art_label.config(image=self._photo_ref, text="")
+        self._show_cover(album)
+
+    def _show_cover(self, album: AlbumInfo):
+        # 디코딩·리샘플링은 cover_images 작업 스레드에서 (다중 파일 탭과 같은 커버면 결과 공유)
+        data = album.cover_data
+        prev, self._cover_ref = self._cover_ref, album.cover_ref if data else None
+        if data and PIL_AVAILABLE and cover_images.available:
+            if prev != self._cover_ref:
+                self._art_label.config(text="앨범아트\n여는 중...", image="")
+            cover_images.request(album.cover_ref, data, self.ART_SIZE, self._ui_bus.post,
+                                 lambda photo, ref=album.cover_ref: self._on_cover_image(ref, photo))
+        elif not self._cover_ready.is_set():
+            self._art_label.config(text="앨범아트\n받는 중...", image="")
         else:
             self._art_label.config(text="앨범아트\n없음", image="")
 
+    def _on_cover_image(self, ref: str, photo):
+        if ref != self._cover_ref:
+            return                      # 그 사이 미리보기가 바뀜
+        self._photo_ref = photo
+        if photo is None:
+            self._art_label.config(text="앨범아트\n없음", image="")
+        else:
+            self._art_label.config(image=photo, text="")
+
     def _clear_preview(self):
         for var in self._meta_vars.values():
             var.set("—")
         self._art_label.config(text="앨범아트\n없음", image="")
         self._photo_ref = None
+        self._cover_ref = None
         self._matched_track = None
+        self._apply_after_cover = False
         self._lyrics = ""
         self._synced_lyrics = []
         self._lyrics_status_var.set("")
@@ -510,11 +628,6 @@ class SingleFileTab(ttk.Frame):
         self._lyrics_text.configure(state="disabled")
 
     # ── 적용 ──────────────────────────────────
-    @staticmethod
-    def _safe_filename(text: str) -> str:
-        """파일명에 사용할 수 없는 문자를 제거한다."""
-        return re.sub(r'[\\/:*?"<>|]', "", text).strip()
-
     def _do_apply(self):
         if not self._mp3_path:
             messagebox.showwarning("파일 없음", "MP3 파일을 먼저 선택해 주세요.")
@@ -522,6 +635,12 @@ class SingleFileTab(ttk.Frame):
         if not self._matched_track or not self._album:
             messagebox.showwarning("매칭 없음", "먼저 크롤링을 실행해 주세요.")
             return
+        if self._cover_var.get() and not self._cover_ready.is_set():
+            # 앨범아트 도착 후 _on_cover_ready에서 이어서 적용
+            self._apply_after_cover = True
+            self._apply_btn.configure(state="disabled")
+            self._status_bar.set_status("앨범아트 받는 중... 완료되면 적용합니다", "info")
+            return
 
         track = self._matched_track
         handler = MP3Handler()
@@ -543,25 +662,18 @@ class SingleFileTab(ttk.Frame):
                 disc_number=track.disc_number,
                 cover_data=self._album.cover_data if self._cover_var.get() else None,
                 lyrics=self._lyrics,
+                song_id=track.song_id,
+                album_id=track.album_id,
             )
 
             # ── 파일명 변경: 가수명-트랙번호-노래제목.mp3 ──
+            # 동일 이름 파일이 이미 있으면 덮어쓰지 않고 번호 붙임 (기존 .lrc도 함께 이동)
             old_path = Path(self._mp3_path)
-            artist_part = self._safe_filename(track.artist)
-            title_part  = self._safe_filename(track.title)
-            new_name    = f"{artist_part}-{track.track_number:02d}-{title_part}.mp3"
-            new_path    = old_path.parent / new_name
-
-            # 동일 이름 파일이 이미 있으면 덮어쓰지 않고 번호 붙임
-            if new_path.exists() and new_path != old_path:
-                stem = f"{artist_part}-{track.track_number:02d}-{title_part}"
-                for i in range(2, 100):
-                    candidate = old_path.parent / f"{stem}({i}).mp3"
-                    if not candidate.exists():
-                        new_path = candidate
-                        break
-
-            old_path.rename(new_path)
+            renamed = RenamePlanner().plan([(self._mp3_path, track)]).apply()
+            if renamed.errors:
+                raise OSError(renamed.errors[0])
+            new_path = Path(renamed.renamed.get(self._mp3_path, self._mp3_path))
+            new_name = new_path.name
             self._mp3_path = str(new_path)
 
             # ── .lrc 사이드카 파일 생성 (삼성뮤직 싱크 가사) ──
@@ -604,3 +716,17 @@ class SingleFileTab(ttk.Frame):
         self._status_bar.reset_progress()
 
 
+def _early_lyrics_job(search: str, mp3_path: str) -> Tuple[str, list]:
+    """MP3 태그의 아티스트·앨범 + 검색어 + 재생 시간으로 lrclib 조회. 반환: (사용한 아티스트, 싱크 가사)"""
+    tags = MP3Handler().read_metadata(mp3_path)
+    artist = tags.get("artist", "")
+    if not artist:
+        return "", []
+    synced = MelonCrawler().fetch_synced_lyrics(search, artist, tags.get("album", ""), MP3Handler.duration(mp3_path))
+    return artist, synced
+
+
+def _synced_lyrics_job(track: TrackInfo, mp3_path: Optional[str]) -> list:
+    """트랙의 싱크 가사. MP3를 골라 두었으면 그 재생 시간으로 후보를 고른다"""
+    duration = MP3Handler.duration(mp3_path) if mp3_path else None
+    return MelonCrawler().fetch_synced_lyrics(track.title, track.artist, track.album, duration)
@@ -5,7 +5,7 @@
 from tkinter import ttk
 from typing import List, Optional
 
-from src.models import TrackInfo
+from src.models import TrackInfo, TrackKey, track_label
 from src.ui.theme import Theme
 
 
@@ -46,15 +46,20 @@ class TrackTreeview(ttk.Frame):
         tree_frame.grid_rowconfigure(0, weight=1)
         tree_frame.grid_columnconfigure(0, weight=1)
 
+    @staticmethod
+    def iid_for(key: TrackKey) -> str:
+        return f"{key[0]}-{key[1]}"
+
     def load_tracks(self, tracks: List[TrackInfo]):
         self.tree.delete(*self.tree.get_children())
+        multi_disc = len({t.disc_number for t in tracks}) > 1
         for i, track in enumerate(tracks):
             tag = "even" if i % 2 == 0 else "odd"
-            vals = (track.track_number, track.title, track.artist, "대기")
-            self.tree.insert("", "end", iid=str(track.track_number), values=vals, tags=(tag,))
+            vals = (track_label(track.key, multi_disc), track.title, track.artist, "대기")
+            self.tree.insert("", "end", iid=self.iid_for(track.key), values=vals, tags=(tag,))
 
-    def set_track_status(self, track_number: int, status: str, status_type: str = ""):
-        iid = str(track_number)
+    def set_track_status(self, key: TrackKey, status: str, status_type: str = ""):
+        iid = self.iid_for(key)
         if not self.tree.exists(iid):
             return
         vals = list(self.tree.item(iid, "values"))
@@ -70,11 +75,12 @@ class TrackTreeview(ttk.Frame):
     def clear(self):
         self.tree.delete(*self.tree.get_children())
 
-    def get_selected_track_number(self) -> Optional[int]:
+    def get_selected_track_key(self) -> Optional[TrackKey]:
         sel = self.tree.selection()
         if not sel:
             return None
         try:
-            return int(sel[0])
+            disc, num = sel[0].split("-")
+            return int(disc), int(num)
         except ValueError:
             return None
@@ -43,6 +43,9 @@ class UrlBar(ttk.Frame):
     def get_url(self) -> str:
         return self._url_var.get().strip()
 
+    def set_url(self, url: str):
+        self._url_var.set(url)
+
     def set_enabled(self, enabled: bool):
         state = "normal" if enabled else "disabled"
         self._entry.configure(state=state)